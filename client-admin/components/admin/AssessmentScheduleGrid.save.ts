@@ -1,5 +1,9 @@
 import { assessmentScheduleService } from '@/lib/api';
-import type { AssessmentSchedule, AssessmentScheduleCreate } from '@/types/schedule';
+import type {
+  AssessmentSchedule,
+  AssessmentScheduleBatch,
+  AssessmentScheduleCreate,
+} from '@/types/schedule';
 import type { AssessmentRow } from './AssessmentScheduleGrid';
 
 /**
@@ -104,6 +108,61 @@ function transformSchedulesToRows(schedules: AssessmentSchedule[]): AssessmentRo
   return rows;
 }
 
+const scheduleKey = (schedule: AssessmentScheduleCreate | AssessmentSchedule): string =>
+  `${schedule.subject}|${schedule.groups_composition}`;
+
+const isSameSchedule = (existing: AssessmentSchedule, target: AssessmentScheduleCreate): boolean =>
+  existing.subject === target.subject &&
+  existing.groups_composition === target.groups_composition &&
+  existing.professor_name === target.professor_name &&
+  existing.assessment_date === target.assessment_date &&
+  existing.assessment_time === target.assessment_time &&
+  existing.room_code === target.room_code &&
+  (existing.cycle_type ?? null) === (target.cycle_type ?? null);
+
+/**
+ * Calculează diferența dintre evaluările existente și cele din grid.
+ * Rândurile cu aceeași disciplină și serie de grupe sunt actualizate (doar dacă s-au schimbat),
+ * celelalte rânduri existente sunt refolosite pentru rândurile noi, iar restul sunt create/șterse.
+ */
+function diffSchedules(existing: AssessmentSchedule[], target: AssessmentScheduleCreate[]): AssessmentScheduleBatch {
+  const batch = { create: [], update: [], delete: [] } as Required<AssessmentScheduleBatch>;
+  const unmatchedExisting = new Map<string, AssessmentSchedule[]>();
+  for (const schedule of existing) {
+    const key = scheduleKey(schedule);
+    unmatchedExisting.set(key, [...(unmatchedExisting.get(key) || []), schedule]);
+  }
+
+  const unmatchedTarget: AssessmentScheduleCreate[] = [];
+  const pairs: [AssessmentSchedule, AssessmentScheduleCreate][] = [];
+  for (const schedule of target) {
+    const match = unmatchedExisting.get(scheduleKey(schedule))?.shift();
+    if (match) {
+      pairs.push([match, schedule]);
+    } else {
+      unmatchedTarget.push(schedule);
+    }
+  }
+
+  const leftoverExisting = Array.from(unmatchedExisting.values()).flat();
+  for (const schedule of unmatchedTarget) {
+    const reused = leftoverExisting.shift();
+    if (reused) {
+      pairs.push([reused, schedule]);
+    } else {
+      batch.create.push(schedule);
+    }
+  }
+
+  for (const [current, schedule] of pairs) {
+    if (!isSameSchedule(current, schedule)) {
+      batch.update.push({ id: current.id, ...schedule });
+    }
+  }
+  batch.delete = leftoverExisting.map((schedule) => schedule.id);
+  return batch;
+}
+
 export type SaveAssessmentScheduleParams = {
   assessmentRows: AssessmentRow[];
   academicYear: number;
@@ -145,28 +204,20 @@ export const saveAssessmentSchedule = async (params: SaveAssessmentScheduleParam
   }
 
   try {
-    // Obține evaluările existente pentru a șterge cele vechi (dacă există)
+    // Obține evaluările existente pentru a calcula diferența față de grid
     const existingSchedules = await assessmentScheduleService.getAllAssessmentSchedules({
       academic_year: academicYear,
       semester: semester,
       cycle_type: cycleType || undefined,
     });
 
-    // Șterge evaluările existente
-    for (const existing of existingSchedules) {
-      await assessmentScheduleService.deleteAssessmentSchedule(existing.id);
-    }
-
-    // Creează noile evaluări
-    const createdSchedules: AssessmentSchedule[] = [];
-    for (const scheduleData of schedulesToSave) {
-      const created = await assessmentScheduleService.createAssessmentSchedule(scheduleData);
-      createdSchedules.push(created);
-    }
+    // Trimite toată diferența într-o singură cerere (o tranzacție pe server)
+    const batch = diffSchedules(existingSchedules, schedulesToSave);
+    await assessmentScheduleService.batchAssessmentSchedules(batch);
 
     setMessage({
       type: 'success',
-      text: `${createdSchedules.length} evaluări periodice salvate cu succes!`,
+      text: `${schedulesToSave.length} evaluări periodice salvate cu succes!`,
     });
   } catch (err: any) {
     const errorMessage = err.response?.data?.detail || err.message || 'Eroare la salvare';
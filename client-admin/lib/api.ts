@@ -8,6 +8,8 @@ import type {
 } from '@/types/auth';
 import type {
   AssessmentSchedule,
+  AssessmentScheduleBatch,
+  AssessmentScheduleBatchResult,
   AssessmentScheduleCreate,
   AssessmentScheduleUpdate,
   Group,
@@ -15,6 +17,8 @@ import type {
   Room,
   Schedule,
   ScheduleCreate,
+  ScheduleSolveRequest,
+  ScheduleSolveResult,
   ScheduleUpdate,
   Subject,
 } from '@/types/schedule';
@@ -30,19 +34,35 @@ export const api = axios.create({
 });
 
 // Interceptor pentru a adăuga token-ul la fiecare request
+// Read-your-writes: după o modificare serverul trimite X-Read-Primary-Until, iar până atunci
+// citirile noastre trebuie servite de baza principală (nu de replica de citire)
+const READ_PRIMARY_HEADER = 'X-Read-Primary-Until';
+const READ_PRIMARY_STORAGE_KEY = 'readPrimaryUntil';
+
 api.interceptors.request.use((config) => {
   if (typeof window !== 'undefined') {
     const token = localStorage.getItem('token');
     if (token) {
       config.headers.Authorization = `Bearer ${token}`;
     }
+    const readPrimaryUntil = sessionStorage.getItem(READ_PRIMARY_STORAGE_KEY);
+    if (readPrimaryUntil) {
+      // Serverul compară valoarea cu propriul ceas și o ignoră după expirare
+      config.headers[READ_PRIMARY_HEADER] = readPrimaryUntil;
+    }
   }
   return config;
 });
 
 // Interceptor pentru a gestiona răspunsurile de eroare
 api.interceptors.response.use(
-  (response) => response,
+  (response) => {
+    const readPrimaryUntil = response.headers[READ_PRIMARY_HEADER.toLowerCase()];
+    if (readPrimaryUntil && typeof window !== 'undefined') {
+      sessionStorage.setItem(READ_PRIMARY_STORAGE_KEY, readPrimaryUntil);
+    }
+    return response;
+  },
   (error) => {
     if (error.response?.status === 401) {
       // Token invalid sau expirat
@@ -176,6 +196,26 @@ export const scheduleService = {
     return response.data;
   },
 
+  // Obține orarul unui profesor (inclusiv orele doar din săptămâna impară)
+  getScheduleByProfessor: async (professorId: number, params?: {
+    academic_year?: number;
+    semester?: string;
+    cycle_type?: string;
+  }): Promise<Schedule[]> => {
+    const response = await api.get<Schedule[]>(`/schedule/professor/${professorId}`, { params });
+    return response.data;
+  },
+
+  // Obține orarul unei săli după cod (inclusiv orele doar din săptămâna impară)
+  getScheduleByRoom: async (roomCode: string, params?: {
+    academic_year?: number;
+    semester?: string;
+    cycle_type?: string;
+  }): Promise<Schedule[]> => {
+    const response = await api.get<Schedule[]>(`/schedule/room/${encodeURIComponent(roomCode)}`, { params });
+    return response.data;
+  },
+
   // Obține un orar după ID
   getScheduleById: async (id: number): Promise<Schedule> => {
     const response = await api.get<Schedule>(`/schedule/id/${id}`);
@@ -219,6 +259,14 @@ export const scheduleService = {
     return response.data;
   },
 
+  // Propune zi/interval/sală pentru orele neprogramate (nu scrie nimic în baza de date)
+  solveSchedule: async (data: ScheduleSolveRequest): Promise<ScheduleSolveResult> => {
+    const response = await api.post<ScheduleSolveResult>('/schedule/solve', data, {
+      timeout: ((data.time_limit_seconds ?? 10) + 30) * 1000,
+    });
+    return response.data;
+  },
+
   // Trimite refresh_all către toți clienții WebSocket conectați
   refreshAllSchedules: async (): Promise<{
     message: string;
@@ -351,5 +399,13 @@ export const assessmentScheduleService = {
   deleteAssessmentSchedule: async (id: number): Promise<void> => {
     await api.delete(`/assessment-schedules/${id}`);
   },
+
+  // Aplică creări, actualizări și ștergeri într-o singură tranzacție
+  batchAssessmentSchedules: async (
+    data: AssessmentScheduleBatch
+  ): Promise<AssessmentScheduleBatchResult> => {
+    const response = await api.post<AssessmentScheduleBatchResult>('/assessment-schedules/batch', data);
+    return response.data;
+  },
 };
 
@@ -70,14 +70,54 @@ export interface ScheduleCreate {
 
 export type ScheduleUpdate = Partial<ScheduleCreate>;
 
+// Cerere pentru solver-ul de orar (POST /schedule/solve)
+export interface ScheduleSolveRequirement {
+  group_ids: number[]; // Mai multe grupe = curs pe serie
+  subject_id: number;
+  professor_id: number;
+  session_type: SessionType;
+  weekly_count?: number;
+  parity?: 'both' | 'even' | 'odd';
+  min_capacity?: number | null;
+  room_ids?: number[] | null;
+}
+
+export interface ScheduleSolveRequest {
+  academic_year?: number | null;
+  semester?: string | null;
+  cycle_type?: string | null;
+  requirements: ScheduleSolveRequirement[];
+  unavailable?: { professor_id: number; day: string; hour?: string | null }[];
+  days?: string[];
+  hours?: string[];
+  skip_scheduled?: boolean;
+  time_limit_seconds?: number;
+  seed?: number;
+}
+
+// Ciorna propusă: orele de adăugat, aplicate din grilă la salvare
+export interface ScheduleSolveResult {
+  draft: ScheduleCreate[];
+  sessions: number;
+  cost: number;
+  conflicts: number;
+  group_gaps: number;
+  professor_gaps: number;
+  same_day_repeats: number;
+  unpaired: number;
+  iterations: number;
+  workers: number;
+  elapsed_seconds: number;
+}
+
 // Tipuri pentru evaluările periodice (format backend - baza de date)
 export interface AssessmentSchedule {
   id: number;
   subject: string; // Numele disciplinei (scris manual)
   groups_composition: string; // Componența seriei - grupele separate prin virgulă (ex: "TI-221, TI-222, TI-223")
   professor_name: string; // Cadrul didactic titular (scris manual)
-  assessment_date: string; // Data evaluării (scris manual)
-  assessment_time: string; // Ora evaluării (scris manual)
+  assessment_date: string; // Data evaluării (AAAA-LL-ZZ sau ZZ.LL.AAAA, "" dacă nu este stabilită)
+  assessment_time: string; // Ora evaluării (HH:MM, "" dacă nu este stabilită)
   room_code: string; // Codul sălii (scris manual)
   academic_year: number; // Anul academic (1, 2, 3, 4)
   semester: string; // "assessments1" sau "assessments2"
@@ -97,3 +137,20 @@ export interface AssessmentScheduleCreate {
 }
 
 export type AssessmentScheduleUpdate = Partial<AssessmentScheduleCreate>;
+
+// Batch pentru evaluările periodice - o singură tranzacție pe server
+export interface AssessmentScheduleBatchUpdate extends AssessmentScheduleUpdate {
+  id: number;
+}
+
+export interface AssessmentScheduleBatch {
+  create?: AssessmentScheduleCreate[];
+  update?: AssessmentScheduleBatchUpdate[];
+  delete?: number[];
+}
+
+export interface AssessmentScheduleBatchResult {
+  created: AssessmentSchedule[];
+  updated: AssessmentSchedule[];
+  deleted: number[];
+}
@@ -386,12 +386,15 @@ export default function StudentSchedule() {
           return;
         }
 
-        // Încearcă să încarce de la server
-        const data = await assessmentScheduleService.getAllAssessmentSchedules({
+        // Încearcă să încarce de la server (doar evaluările grupei, dacă o cunoaștem)
+        const assessmentParams = {
           academic_year: selectedAcademicYear,
           semester: selectedSemester,
           cycle_type: selectedCycleType,
-        });
+        };
+        const data = userGroupCode
+          ? await assessmentScheduleService.getAssessmentSchedulesByGroup(userGroupCode, assessmentParams)
+          : await assessmentScheduleService.getAllAssessmentSchedules(assessmentParams);
         const filteredData = filterAssessmentsForUser(data);
         setAssessmentSchedules(filteredData);
         setError(''); // Resetează erorile la reîncărcare reușită
@@ -459,6 +462,58 @@ export default function StudentSchedule() {
     selectedCycleTypeRef.current = selectedCycleType;
   }, [selectedAcademicYear, selectedSemester, selectedCycleType]);
 
+  // Abonare la evaluările grupei prin WebSocket și aplicarea deltelor primite în starea locală
+  useEffect(() => {
+    if (!userGroupCode) {
+      return;
+    }
+
+    scheduleWebSocket.subscribe({
+      groups: [userGroupCode],
+      academic_year: isAssessmentSchedule ? selectedAcademicYear : null,
+      semester: isAssessmentSchedule ? selectedSemester : null,
+    });
+
+    const unsubscribeAssessmentUpdate = scheduleWebSocket.onAssessmentUpdate((update) => {
+      if (
+        !isAssessmentSchedule ||
+        selectedAcademicYear === null ||
+        selectedSemester === null ||
+        selectedCycleType === null
+      ) {
+        return;
+      }
+
+      // Doar evaluările din felia afișată (an, semestru, ciclu) și ale grupei utilizatorului
+      const visible = filterAssessmentsForUser(
+        update.upserted.filter(
+          (a) =>
+            a.academic_year === selectedAcademicYear &&
+            a.semester === selectedSemester &&
+            (a.cycle_type ?? null) === selectedCycleType
+        )
+      );
+      const visibleById = new Map(visible.map((a) => [a.id, a]));
+      // Evaluările modificate care nu mai aparțin feliei/grupei sunt eliminate
+      const removedIds = new Set([...update.deleted, ...update.upserted.map((a) => a.id)]);
+
+      setAssessmentSchedules((current) => {
+        const next = current
+          .filter((a) => !removedIds.has(a.id) || visibleById.has(a.id))
+          .map((a) => visibleById.get(a.id) ?? a);
+        const existingIds = new Set(current.map((a) => a.id));
+        next.push(...visible.filter((a) => !existingIds.has(a.id)));
+        saveAssessmentScheduleCache(next, selectedAcademicYear, selectedSemester, selectedCycleType);
+        return next;
+      });
+      console.log(`✓ Evaluări actualizate prin WebSocket (${update.action})`);
+    });
+
+    return () => {
+      unsubscribeAssessmentUpdate();
+    };
+  }, [userGroupCode, isAssessmentSchedule, selectedAcademicYear, selectedSemester, selectedCycleType]);
+
   // Conectare WebSocket - separat, doar depinde de isOnline pentru a evita conexiuni duplicate
   useEffect(() => {
     if (!isOnline) {
@@ -384,5 +384,20 @@ export const assessmentScheduleService = {
     const response = await api.get<AssessmentSchedule[]>('/assessment-schedules/', { params });
     return response.data;
   },
+  // Doar evaluările unei grupe (căutare indexată pe server)
+  getAssessmentSchedulesByGroup: async (
+    groupCode: string,
+    params?: {
+      academic_year?: number;
+      semester?: string;
+      cycle_type?: string;
+    }
+  ): Promise<AssessmentSchedule[]> => {
+    const response = await api.get<AssessmentSchedule[]>(
+      `/assessment-schedules/by-group/${encodeURIComponent(groupCode)}`,
+      { params }
+    );
+    return response.data;
+  },
 };
 
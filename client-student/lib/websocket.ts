@@ -1,7 +1,7 @@
 /**
  * WebSocket client pentru actualizări în timp real ale orarului.
  */
-import type { Schedule } from '@/types/schedule';
+import type { AssessmentSchedule, Schedule } from '@/types/schedule';
 
 export type ScheduleUpdateMessage = {
   type: 'schedule_update';
@@ -11,9 +11,28 @@ export type ScheduleUpdateMessage = {
   timestamp?: string;
 };
 
-export type WebSocketMessage = ScheduleUpdateMessage | { type: 'connected' | 'pong'; message?: string; connection_count?: number };
+// Delta pentru evaluările periodice: evaluările create/modificate și ID-urile de eliminat
+export type AssessmentScheduleUpdateMessage = {
+  type: 'assessment_schedule_update';
+  action: 'create' | 'update' | 'delete' | 'batch';
+  upserted: AssessmentSchedule[];
+  deleted: number[];
+};
+
+// Abonament: serverul trimite doar evaluările acestor grupe (și, opțional, ale anului/semestrului)
+export type AssessmentSubscription = {
+  groups: string[];
+  academic_year?: number | null;
+  semester?: string | null;
+};
+
+export type WebSocketMessage =
+  | ScheduleUpdateMessage
+  | AssessmentScheduleUpdateMessage
+  | { type: 'connected' | 'pong' | 'subscribed' | 'unsubscribed' | 'error'; message?: string; connection_count?: number };
 
 type ScheduleUpdateCallback = (schedules: Schedule[]) => void;
+type AssessmentUpdateCallback = (update: AssessmentScheduleUpdateMessage) => void;
 type ConnectionCallback = () => void;
 type ErrorCallback = (error: Event) => void;
 
@@ -27,7 +46,10 @@ class ScheduleWebSocketClient {
   private shouldReconnect = true;
   private isConnecting = false; // Flag pentru a preveni conexiuni simultane
   
+  private subscription: AssessmentSubscription | null = null;
+  
   private scheduleUpdateCallbacks: Set<ScheduleUpdateCallback> = new Set();
+  private assessmentUpdateCallbacks: Set<AssessmentUpdateCallback> = new Set();
   private connectionCallbacks: Set<ConnectionCallback> = new Set();
   private errorCallbacks: Set<ErrorCallback> = new Set();
   
@@ -78,6 +100,8 @@ class ScheduleWebSocketClient {
         console.log('✓ WebSocket conectat cu succes');
         this.isConnecting = false;
         this.reconnectAttempts = 0;
+        // Retrimite abonamentul după (re)conectare
+        this.sendSubscription();
         this.notifyConnectionCallbacks();
       };
 
@@ -182,9 +206,37 @@ class ScheduleWebSocketClient {
 
     if (message.type === 'schedule_update') {
       this.handleScheduleUpdate(message);
+      return;
+    }
+
+    if (message.type === 'assessment_schedule_update') {
+      console.log(`📡 Primită actualizare evaluări: ${message.action}`);
+      this.assessmentUpdateCallbacks.forEach((callback) => {
+        try {
+          callback(message);
+        } catch (error) {
+          console.error('Eroare în callback-ul de actualizare a evaluărilor:', error);
+        }
+      });
     }
   }
 
+  /**
+   * Setează abonamentul pentru evaluări (null = primește toate modificările).
+   */
+  subscribe(subscription: AssessmentSubscription | null): void {
+    this.subscription = subscription;
+    this.sendSubscription();
+  }
+
+  private sendSubscription(): void {
+    if (!this.ws || this.ws.readyState !== WebSocket.OPEN) {
+      return;
+    }
+    const payload = this.subscription ? { type: 'subscribe', ...this.subscription } : { type: 'unsubscribe' };
+    this.ws.send(JSON.stringify(payload));
+  }
+
   /**
    * Procesează actualizări de orar.
    */
@@ -213,6 +265,16 @@ class ScheduleWebSocketClient {
     };
   }
 
+  /**
+   * Adaugă un callback pentru delte ale evaluărilor periodice.
+   */
+  onAssessmentUpdate(callback: AssessmentUpdateCallback): () => void {
+    this.assessmentUpdateCallbacks.add(callback);
+    return () => {
+      this.assessmentUpdateCallbacks.delete(callback);
+    };
+  }
+
   /**
    * Adaugă un callback pentru evenimente de conectare.
    */
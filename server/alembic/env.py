@@ -19,6 +19,7 @@ if config.config_file_name is not None:
 
 # add your model's MetaData object here
 from models.assessment_schedule import AssessmentSchedule
+from models.assessment_schedule_group import AssessmentScheduleGroup
 from models.schedule import Schedule
 from models.user import User
 from models.room import Room
@@ -67,6 +68,15 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # Runner-ul de migrări (migrate.py) transmite conexiunea pe care ține lock-ul;
+    # migrările rulează pe aceeași conexiune, în tranzacția deschisă de el
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     # Folosește DATABASE_URL din variabila de mediu dacă există, altfel folosește config din alembic.ini
     database_url = os.getenv("DATABASE_URL")
     if database_url:
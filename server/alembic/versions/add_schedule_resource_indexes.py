@@ -0,0 +1,37 @@
+"""add_schedule_resource_indexes
+
+Revision ID: add_schedule_resource_indexes
+Revises: typed_assessment_date_time
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_schedule_resource_indexes'
+down_revision: Union[str, Sequence[str], None] = 'typed_assessment_date_time'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ('ix_schedules_group_id', 'group_id'),
+    ('ix_schedules_professor_id', 'professor_id'),
+    ('ix_schedules_odd_week_professor_id', 'odd_week_professor_id'),
+    ('ix_schedules_room_id', 'room_id'),
+    ('ix_schedules_odd_week_room_id', 'odd_week_room_id'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema - index the group/professor/room columns of schedules (incl. odd week)."""
+    for name, column in INDEXES:
+        op.create_index(name, 'schedules', [column], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name='schedules')
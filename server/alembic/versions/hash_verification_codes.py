@@ -0,0 +1,56 @@
+"""hash_verification_codes
+
+Revision ID: hash_verification_codes
+Revises: normalize_username_lower
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'hash_verification_codes'
+down_revision: Union[str, Sequence[str], None] = 'normalize_username_lower'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - store verification codes hashed, add composite and expiry indexes."""
+    # Codurile sunt valabile doar 10 minute; cele existente (în clar) sunt șterse,
+    # utilizatorii vor solicita pur și simplu un cod nou.
+    op.execute("DELETE FROM verification_codes")
+
+    op.drop_index('ix_verification_codes_code', table_name='verification_codes')
+    op.drop_index('ix_verification_codes_user_id', table_name='verification_codes')
+
+    # Folosim batch mode pentru SQLite
+    with op.batch_alter_table('verification_codes', schema=None) as batch_op:
+        batch_op.drop_column('code')
+        batch_op.add_column(sa.Column('code_hash', sa.String(length=64), nullable=False))
+
+    op.create_index(
+        'ix_verification_codes_user_verified_created',
+        'verification_codes',
+        ['user_id', 'verified', 'created_at'],
+        unique=False,
+    )
+    op.create_index('ix_verification_codes_expires_at', 'verification_codes', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore the plain code column and the old indexes."""
+    op.execute("DELETE FROM verification_codes")
+
+    op.drop_index('ix_verification_codes_expires_at', table_name='verification_codes')
+    op.drop_index('ix_verification_codes_user_verified_created', table_name='verification_codes')
+
+    with op.batch_alter_table('verification_codes', schema=None) as batch_op:
+        batch_op.drop_column('code_hash')
+        batch_op.add_column(sa.Column('code', sa.String(length=6), nullable=False))
+
+    op.create_index('ix_verification_codes_user_id', 'verification_codes', ['user_id'], unique=False)
+    op.create_index('ix_verification_codes_code', 'verification_codes', ['code'], unique=False)
@@ -0,0 +1,105 @@
+"""normalize_assessment_schedule_groups
+
+Revision ID: normalize_assessment_groups
+Revises: hash_verification_codes
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'normalize_assessment_groups'
+down_revision: Union[str, Sequence[str], None] = 'hash_verification_codes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _parse_groups_composition(value):
+    """Împarte "TI-221, TI-222" în coduri de grupă (fără goluri și duplicate, păstrând ordinea)."""
+    codes = []
+    for part in (value or "").split(","):
+        code = part.strip()
+        if code and code not in codes:
+            codes.append(code)
+    return codes
+
+
+def upgrade() -> None:
+    """Upgrade schema - move assessment_schedules.groups_composition into assessment_schedule_groups."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    tables = inspector.get_table_names()
+
+    if 'assessment_schedule_groups' not in tables:
+        op.create_table(
+            'assessment_schedule_groups',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('assessment_schedule_id', sa.Integer(), nullable=False),
+            sa.Column('group_code', sa.String(), nullable=False),
+            sa.Column('position', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['assessment_schedule_id'], ['assessment_schedules.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint(
+                'assessment_schedule_id', 'group_code',
+                name='uq_assessment_schedule_groups_assessment_group',
+            ),
+        )
+        op.create_index(op.f('ix_assessment_schedule_groups_id'), 'assessment_schedule_groups', ['id'], unique=False)
+        op.create_index(
+            'ix_assessment_schedule_groups_group_code',
+            'assessment_schedule_groups',
+            ['group_code', 'assessment_schedule_id'],
+            unique=False,
+        )
+
+    columns = [col['name'] for col in inspector.get_columns('assessment_schedules')]
+    if 'groups_composition' not in columns:
+        return
+
+    # Parsează componența existentă și creează asocierile
+    links_table = sa.table(
+        'assessment_schedule_groups',
+        sa.column('assessment_schedule_id', sa.Integer()),
+        sa.column('group_code', sa.String()),
+        sa.column('position', sa.Integer()),
+    )
+    rows = conn.execute(sa.text("SELECT id, groups_composition FROM assessment_schedules")).fetchall()
+    links = [
+        {"assessment_schedule_id": row.id, "group_code": code, "position": position}
+        for row in rows
+        for position, code in enumerate(_parse_groups_composition(row.groups_composition))
+    ]
+    if links:
+        op.bulk_insert(links_table, links)
+
+    # Folosim batch mode pentru SQLite
+    with op.batch_alter_table('assessment_schedules', schema=None) as batch_op:
+        batch_op.drop_column('groups_composition')
+
+
+def downgrade() -> None:
+    """Downgrade schema - rebuild groups_composition from assessment_schedule_groups."""
+    with op.batch_alter_table('assessment_schedules', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('groups_composition', sa.String(), nullable=False, server_default=''))
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        "SELECT assessment_schedule_id, group_code FROM assessment_schedule_groups "
+        "ORDER BY assessment_schedule_id, position"
+    )).fetchall()
+    compositions = {}
+    for row in rows:
+        compositions.setdefault(row.assessment_schedule_id, []).append(row.group_code)
+    for assessment_id, codes in compositions.items():
+        conn.execute(
+            sa.text("UPDATE assessment_schedules SET groups_composition = :value WHERE id = :id"),
+            {"value": ", ".join(codes), "id": assessment_id},
+        )
+
+    op.drop_index('ix_assessment_schedule_groups_group_code', table_name='assessment_schedule_groups')
+    op.drop_index(op.f('ix_assessment_schedule_groups_id'), table_name='assessment_schedule_groups')
+    op.drop_table('assessment_schedule_groups')
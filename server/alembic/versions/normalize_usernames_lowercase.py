@@ -0,0 +1,53 @@
+"""normalize_usernames_lowercase
+
+Revision ID: normalize_username_lower
+Revises: fix_assessment_schedules
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'normalize_username_lower'
+down_revision: Union[str, Sequence[str], None] = 'fix_assessment_schedules'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - normalize usernames to lowercase and add unique index on lower(username)."""
+    conn = op.get_bind()
+
+    # Verifică dacă există username-uri care diferă doar prin majuscule sau spații la capete
+    # (aceeași normalizare ca în UPDATE; ar încălca indexul unic)
+    duplicates = conn.execute(sa.text(
+        "SELECT lower(trim(username)) AS normalized, COUNT(*) AS total "
+        "FROM users GROUP BY lower(trim(username)) HAVING COUNT(*) > 1"
+    )).fetchall()
+    if duplicates:
+        details = ", ".join(f"{row.normalized} ({row.total})" for row in duplicates)
+        raise RuntimeError(
+            "Există utilizatori care diferă doar prin majuscule sau spații; rezolvă-i manual înainte de migrare: "
+            + details
+        )
+
+    # Normalizează username-urile existente
+    conn.execute(sa.text(
+        "UPDATE users SET username = lower(trim(username)) WHERE username <> lower(trim(username))"
+    ))
+
+    op.create_index(
+        'ix_users_username_lower',
+        'users',
+        [sa.text('lower(username)')],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - remove the lower(username) index (usernames stay normalized)."""
+    op.drop_index('ix_users_username_lower', table_name='users')
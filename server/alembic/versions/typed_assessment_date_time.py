@@ -0,0 +1,130 @@
+"""typed_assessment_date_time
+
+Revision ID: typed_assessment_date_time
+Revises: normalize_assessment_groups
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'typed_assessment_date_time'
+down_revision: Union[str, Sequence[str], None] = 'normalize_assessment_groups'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y", "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%y")
+TIME_FORMATS = ("%H:%M", "%H.%M", "%H:%M:%S", "%H")
+
+
+def _parse(value, formats, convert):
+    """Returnează (valoare_parsată, ok). Șirul gol este valid și devine None."""
+    text = (value or "").strip()
+    if not text:
+        return None, True
+    for fmt in formats:
+        try:
+            return convert(datetime.strptime(text, fmt)), True
+        except ValueError:
+            continue
+    return None, False
+
+
+def upgrade() -> None:
+    """Upgrade schema - convert assessment_date/assessment_time from text to DATE/TIME."""
+    with op.batch_alter_table('assessment_schedules', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('assessment_date_value', sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column('assessment_time_value', sa.Time(), nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        "SELECT id, assessment_date, assessment_time FROM assessment_schedules"
+    )).fetchall()
+
+    update_stmt = sa.text(
+        "UPDATE assessment_schedules "
+        "SET assessment_date_value = :date_value, assessment_time_value = :time_value "
+        "WHERE id = :id"
+    ).bindparams(
+        sa.bindparam('date_value', type_=sa.Date()),
+        sa.bindparam('time_value', type_=sa.Time()),
+    )
+
+    unparseable = []
+    for row in rows:
+        date_value, date_ok = _parse(row.assessment_date, DATE_FORMATS, lambda d: d.date())
+        # Pentru intervale ("14:00-15:30") se păstrează ora de început
+        time_text = (row.assessment_time or "").replace("–", "-").split("-")[0]
+        time_value, time_ok = _parse(time_text, TIME_FORMATS, lambda d: d.time())
+        if not date_ok:
+            unparseable.append((row.id, 'assessment_date', row.assessment_date))
+        if not time_ok:
+            unparseable.append((row.id, 'assessment_time', row.assessment_time))
+        conn.execute(update_stmt, {"id": row.id, "date_value": date_value, "time_value": time_value})
+
+    if unparseable:
+        print(f"⚠️ {len(unparseable)} valori de dată/oră nu au putut fi interpretate și au fost setate la NULL:")
+        for assessment_id, column, value in unparseable:
+            print(f"   - assessment_schedules.id={assessment_id} {column}={value!r}")
+
+    # Folosim batch mode pentru SQLite
+    with op.batch_alter_table('assessment_schedules', schema=None) as batch_op:
+        batch_op.drop_column('assessment_date')
+        batch_op.drop_column('assessment_time')
+        batch_op.alter_column('assessment_date_value', new_column_name='assessment_date')
+        batch_op.alter_column('assessment_time_value', new_column_name='assessment_time')
+
+    op.create_index(
+        'ix_assessment_schedules_calendar',
+        'assessment_schedules',
+        ['academic_year', 'semester', 'assessment_date'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_assessment_schedules_assessment_date',
+        'assessment_schedules',
+        ['assessment_date'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - convert assessment_date/assessment_time back to text."""
+    op.drop_index('ix_assessment_schedules_assessment_date', table_name='assessment_schedules')
+    op.drop_index('ix_assessment_schedules_calendar', table_name='assessment_schedules')
+
+    with op.batch_alter_table('assessment_schedules', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('assessment_date_text', sa.String(), nullable=False, server_default=''))
+        batch_op.add_column(sa.Column('assessment_time_text', sa.String(), nullable=False, server_default=''))
+
+    conn = op.get_bind()
+    select_stmt = sa.text(
+        "SELECT id, assessment_date, assessment_time FROM assessment_schedules"
+    ).columns(
+        sa.column('id', sa.Integer()),
+        sa.column('assessment_date', sa.Date()),
+        sa.column('assessment_time', sa.Time()),
+    )
+    for row in conn.execute(select_stmt).fetchall():
+        conn.execute(
+            sa.text(
+                "UPDATE assessment_schedules "
+                "SET assessment_date_text = :date_text, assessment_time_text = :time_text WHERE id = :id"
+            ),
+            {
+                "id": row.id,
+                "date_text": row.assessment_date.isoformat() if row.assessment_date else "",
+                "time_text": row.assessment_time.strftime("%H:%M") if row.assessment_time else "",
+            },
+        )
+
+    with op.batch_alter_table('assessment_schedules', schema=None) as batch_op:
+        batch_op.drop_column('assessment_date')
+        batch_op.drop_column('assessment_time')
+        batch_op.alter_column('assessment_date_text', new_column_name='assessment_date')
+        batch_op.alter_column('assessment_time_text', new_column_name='assessment_time')
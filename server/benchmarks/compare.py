@@ -0,0 +1,93 @@
+"""
+Compară două rezultate ale benchmarks/api_hot_paths.py (ex: main vs. branch).
+
+Pentru fiecare scenariu afișează debitul și latențele p50/p95/p99 din ambele rulări și
+diferența procentuală; o creștere a latenței sau o scădere a debitului peste --threshold
+este marcată ca regresie.
+
+Utilizare (din directorul server/):
+    python benchmarks/compare.py rezultate/main.json rezultate/branch.json
+    python benchmarks/compare.py base.json new.json --threshold 10 --fail-on-regression
+"""
+import argparse
+import json
+import sys
+
+# (câmp, True dacă o valoare mai mare este mai bună)
+METRICS = [
+    ("throughput_rps", True),
+    ("p50_ms", False),
+    ("p95_ms", False),
+    ("p99_ms", False),
+]
+
+# Configurația care trebuie să coincidă pentru ca rezultatele să fie comparabile
+COMPARABLE_META = ["size", "backend", "target", "response_cache", "concurrency", "cpu_count"]
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def change_percent(base: float, new: float) -> float:
+    if not base:
+        return 0.0
+    return (new - base) / base * 100
+
+
+def compare(base: dict, new: dict, threshold: float):
+    """Întoarce rândurile tabelului și lista regresiilor."""
+    rows, regressions = [], []
+    for scenario, base_result in base["scenarios"].items():
+        new_result = new["scenarios"].get(scenario)
+        if new_result is None:
+            continue
+        for metric, higher_is_better in METRICS:
+            before, after = base_result.get(metric, 0.0), new_result.get(metric, 0.0)
+            change = change_percent(before, after)
+            worse = -change if higher_is_better else change
+            regressed = worse > threshold
+            rows.append((scenario, metric, before, after, change, regressed))
+            if regressed:
+                regressions.append(f"{scenario}.{metric}: {before} -> {after} ({change:+.1f}%)")
+        if new_result.get("errors", 0) > base_result.get("errors", 0):
+            regressions.append(f"{scenario}.errors: {base_result.get('errors', 0)} -> {new_result['errors']}")
+    return rows, regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compară două rezultate ale benchmark-ului API.")
+    parser.add_argument("base", help="Rezultatul de referință (JSON)")
+    parser.add_argument("new", help="Rezultatul nou (JSON)")
+    parser.add_argument("--threshold", type=float, default=5.0, help="Pragul de regresie, în procente")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Cod de ieșire 1 la regresii")
+    args = parser.parse_args()
+
+    base, new = load(args.base), load(args.new)
+    for label, report in (("base", base), ("new", new)):
+        meta = report.get("meta", {})
+        dirty = " (modificări necomise)" if meta.get("dirty") else ""
+        print(f"{label}: {meta.get('commit') or '?'}{dirty} {meta.get('backend', '?')} {meta.get('timestamp', '')}")
+    for key in COMPARABLE_META:
+        if base.get("meta", {}).get(key) != new.get("meta", {}).get(key):
+            print(f"Atenție: rulările diferă la {key} (rezultatele nu sunt direct comparabile)")
+    print()
+
+    rows, regressions = compare(base, new, args.threshold)
+    print(f"{'scenariu':<20} {'metrică':<15} {'base':>10} {'new':>10} {'diferență':>10}")
+    for scenario, metric, before, after, change, regressed in rows:
+        marker = "  REGRESIE" if regressed else ""
+        print(f"{scenario:<20} {metric:<15} {before:>10} {after:>10} {change:>+9.1f}%{marker}")
+
+    if regressions:
+        print(f"\nRegresii peste {args.threshold:g}%:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1 if args.fail_on_regression else 0
+    print(f"\nNicio regresie peste {args.threshold:g}%.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
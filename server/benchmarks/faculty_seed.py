@@ -0,0 +1,186 @@
+"""
+Date sintetice de dimensiunea unei facultăți, pentru benchmark-urile API.
+
+Inserează grupe, discipline, profesori, săli, studenți (cu grupa asociată), un admin,
+orarul fiecărei grupe (cu alternanțe pară/impară) și evaluări periodice. Încărcarea folosește
+scripts/generate_data.py (COPY pe PostgreSQL, executemany pe SQLite), iar toți utilizatorii au
+aceeași parolă, deci hash-ul Argon2 se calculează o singură dată.
+
+Folosit de benchmarks/api_hot_paths.py; poate fi rulat și separat:
+    python benchmarks/faculty_seed.py --url sqlite:///./bench.db --groups 120
+"""
+import argparse
+import os
+import random
+import sys
+from dataclasses import asdict, dataclass
+from datetime import date, time, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DAYS = ["Luni", "Marți", "Miercuri", "Joi", "Vineri"]
+HOURS = ["8.00-9.30", "9.45-11.15", "11.30-13.00", "13.30-15.00", "15.15-16.45", "17.00-18.30", "18.45-20.15"]
+BENCH_PASSWORD = "Benchmark-2024!"
+ADMIN_USERNAME = "bench-admin@example.com"
+
+
+@dataclass
+class FacultySize:
+    groups: int = 120
+    subjects: int = 80
+    professors: int = 150
+    rooms: int = 60
+    students_per_group: int = 25
+    sessions_per_group: int = 20
+    odd_week_share: float = 0.25  # proporția orelor cu alternanță pară/impară
+    assessments_per_year: int = 40
+
+
+def group_code(index: int) -> str:
+    year = index % 4 + 1
+    return f"TI-{year}{index // 4 + 1:02d}"
+
+
+def student_username(group_index: int, student_index: int) -> str:
+    return f"student{group_index:04d}.{student_index:03d}@example.com"
+
+
+def seed_faculty(engine, size: FacultySize, seed: int = 1) -> dict:
+    """Inserează datele sintetice într-o bază goală; întoarce numărul de rânduri per tabelă."""
+    from core.security import get_password_hash
+    from models.assessment_schedule import AssessmentSchedule
+    from models.assessment_schedule_group import AssessmentScheduleGroup
+    from models.group import Group
+    from models.professor import Professor
+    from models.room import Room
+    from models.schedule import Schedule, SessionStatus, SessionType
+    from models.subject import Subject
+    from models.user import User, UserRole
+    from models.user_group import UserGroup
+    from scripts.generate_data import load_dataset
+
+    rng = random.Random(seed)
+    password_hash = get_password_hash(BENCH_PASSWORD)
+
+    groups = [
+        {"id": i + 1, "code": group_code(i), "year": i % 4 + 1, "faculty": "FCIM", "specialization": "TI"}
+        for i in range(size.groups)
+    ]
+    subjects = [
+        {"id": i + 1, "name": f"Disciplina {i + 1}", "code": f"D{i + 1:03d}", "semester": "semester1"}
+        for i in range(size.subjects)
+    ]
+    professors = [
+        {"id": i + 1, "full_name": f"Profesor {i + 1}", "department": f"Dep. {i % 6 + 1}", "email": f"prof{i + 1}@example.com"}
+        for i in range(size.professors)
+    ]
+    rooms = [
+        {"id": i + 1, "code": f"{i % 4 + 1}-{100 + i}", "building": f"Blocul {i % 4 + 1}", "capacity": rng.choice([30, 60, 120])}
+        for i in range(size.rooms)
+    ]
+
+    users = [{"id": 1, "username": ADMIN_USERNAME, "password_hash": password_hash, "role": UserRole.ADMIN, "is_active": True}]
+    user_groups = []
+    for g in range(size.groups):
+        for s in range(size.students_per_group):
+            user_id = len(users) + 1
+            users.append({
+                "id": user_id,
+                "username": student_username(g, s),
+                "password_hash": password_hash,
+                "role": UserRole.STUDENT,
+                "is_active": True,
+            })
+            user_groups.append({"user_id": user_id, "group_id": g + 1})
+
+    slots = [(day, hour) for day in DAYS for hour in HOURS]
+    schedules = []
+    for group in groups:
+        for day, hour in rng.sample(slots, min(size.sessions_per_group, len(slots))):
+            row = {
+                "group_id": group["id"],
+                "subject_id": rng.randint(1, size.subjects),
+                "professor_id": rng.randint(1, size.professors),
+                "room_id": rng.randint(1, size.rooms),
+                "day": day,
+                "hour": hour,
+                "session_type": rng.choice(list(SessionType)),
+                "status": SessionStatus.NORMAL,
+                "notes": None,
+                "version": 1,
+                "odd_week_subject_id": None,
+                "odd_week_professor_id": None,
+                "odd_week_room_id": None,
+                "academic_year": group["year"],
+                "semester": "semester1",
+                "cycle_type": "F",
+            }
+            if rng.random() < size.odd_week_share:
+                row["odd_week_subject_id"] = rng.randint(1, size.subjects)
+                row["odd_week_professor_id"] = rng.randint(1, size.professors)
+                row["odd_week_room_id"] = rng.randint(1, size.rooms)
+            schedules.append(row)
+
+    assessments = []
+    assessment_groups = []
+    start = date(2024, 10, 7)
+    for year in range(1, 5):
+        year_groups = [g["code"] for g in groups if g["year"] == year]
+        for _ in range(size.assessments_per_year if year_groups else 0):
+            assessment_id = len(assessments) + 1
+            assessments.append({
+                "id": assessment_id,
+                "subject": f"Disciplina {rng.randint(1, size.subjects)}",
+                "professor_name": f"Profesor {rng.randint(1, size.professors)}",
+                "assessment_date": start + timedelta(days=rng.randint(0, 60)),
+                "assessment_time": time(rng.choice([8, 9, 11, 13, 15]), rng.choice([0, 45])),
+                "room_code": rng.choice(rooms)["code"],
+                "academic_year": year,
+                "semester": "assessments1",
+                "cycle_type": "F",
+            })
+            for position, code in enumerate(rng.sample(year_groups, min(len(year_groups), rng.randint(1, 4)))):
+                assessment_groups.append({"assessment_schedule_id": assessment_id, "group_code": code, "position": position})
+
+    tables = [
+        (Group, groups),
+        (Subject, subjects),
+        (Professor, professors),
+        (Room, rooms),
+        (User, users),
+        (UserGroup, user_groups),
+        (Schedule, schedules),
+        (AssessmentSchedule, assessments),
+        (AssessmentScheduleGroup, assessment_groups),
+    ]
+    return load_dataset(engine, tables)
+
+
+def reset_schema(engine) -> None:
+    """Recreează toate tabelele (doar pentru baze dedicate benchmark-ului)."""
+    import models  # noqa: F401  (înregistrează modelele în metadata)
+    from core.database import Base
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Populează o bază de date cu o facultate sintetică.")
+    parser.add_argument("--url", required=True, help="DATABASE_URL al unei baze dedicate (tabelele sunt recreate)")
+    parser.add_argument("--seed", type=int, default=1)
+    for field, value in asdict(FacultySize()).items():
+        parser.add_argument(f"--{field.replace('_', '-')}", type=type(value), default=value)
+    args = parser.parse_args()
+
+    from core.database import create_database_engine
+
+    engine = create_database_engine(args.url)
+    size = FacultySize(**{field: getattr(args, field) for field in asdict(FacultySize())})
+    reset_schema(engine)
+    print(seed_faculty(engine, size, args.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+Benchmark pentru costul importurilor la pornirea unui worker (`python -X importtime`).
+
+Fiecare rulare pornește un proces nou cu `-X importtime -c "import main"` și agregă timpii
+raportați de interpretor: totalul importului aplicației, timpul propriu (self) pe pachet de
+nivel superior (fastapi, sqlalchemy, pydantic, core, routers...), importurile directe din
+main.py și modulele cele mai lente. Se raportează mediana pe rulări.
+
+Spre deosebire de startup_time.py (durata totală, măsurată fără instrumentare), aici se vede
+unde se duce timpul; cu --baseline se compară cu un rezultat anterior, iar cu --max-ms
+scriptul iese cu cod 1 dacă importul depășește pragul (pentru CI).
+
+Utilizare (din directorul server/):
+    python benchmarks/import_time.py --runs 7
+    python benchmarks/import_time.py --output rezultate/import-main.json
+    python benchmarks/import_time.py --baseline rezultate/import-main.json --max-ms 1500
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# "import time:       self |  cumulative | <indentare>modul"
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+
+
+def parse_importtime(stderr: str) -> list:
+    """Liniile raportului: (modul, adâncime, self_us, cumulative_us), în ordinea din raport."""
+    entries = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, (len(indent) - 1) // 2, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def measure_once(server_dir: str, env: dict, module: str) -> dict:
+    """Importă modulul într-un proces nou și agregă raportul -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=server_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = parse_importtime(result.stderr)
+
+    # Raportul listează dependențele înaintea modulului care le importă: importurile directe
+    # ale modulului măsurat sunt intrările de adâncime 1 dintre intrarea precedentă de adâncime 0
+    # și intrarea modulului
+    start = 0
+    for index, (name, depth, _, _) in enumerate(entries):
+        if depth == 0 and name != module:
+            start = index + 1
+        if name == module and depth == 0:
+            end = index
+            break
+    else:
+        raise RuntimeError(f"Modulul {module} nu apare în raportul -X importtime")
+
+    by_package = defaultdict(int)
+    for name, _, self_us, _ in entries[start:end + 1]:
+        by_package[name.split(".")[0]] += self_us
+    return {
+        "total_us": entries[end][3],
+        "module_count": end + 1 - start,
+        "by_package": dict(by_package),
+        "direct_imports": {name: cumulative for name, depth, _, cumulative in entries[start:end] if depth == 1},
+        "modules": {name: self_us for name, _, self_us, _ in entries[start:end + 1]},
+    }
+
+
+def _median_ms(samples: list, key: str) -> dict:
+    names = {name for sample in samples for name in sample[key]}
+    medians = {name: statistics.median(sample[key].get(name, 0) for sample in samples) / 1000 for name in names}
+    return {name: round(value, 1) for name, value in sorted(medians.items(), key=lambda item: -item[1])}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Costul importurilor la pornirea unui worker (-X importtime).")
+    parser.add_argument("--runs", type=int, default=5, help="Numărul de rulări (implicit 5)")
+    parser.add_argument("--module", default="main", help="Modulul importat (implicit main, ca uvicorn)")
+    parser.add_argument("--top", type=int, default=15, help="Câte pachete/module se afișează")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="DATABASE_URL folosit de worker")
+    parser.add_argument("--server-dir", default=SERVER_DIR, help="Directorul server/ care se măsoară")
+    parser.add_argument("--baseline", help="Rezultat JSON anterior, pentru comparație")
+    parser.add_argument("--max-ms", type=float, help="Cod de ieșire 1 dacă mediana importului depășește pragul")
+    parser.add_argument("--output", help="Fișier JSON în care se scriu rezultatele")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.database_url:
+        env["DATABASE_URL"] = args.database_url
+
+    # Prima rulare încălzește cache-ul de bytecode și nu este inclusă în statistici
+    measure_once(args.server_dir, env, args.module)
+    samples = [measure_once(args.server_dir, env, args.module) for _ in range(args.runs)]
+    totals = [sample["total_us"] / 1000 for sample in samples]
+
+    summary = {
+        "server_dir": os.path.abspath(args.server_dir),
+        "module": args.module,
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+        "import_ms": {
+            "min": round(min(totals), 1),
+            "p50": round(statistics.median(totals), 1),
+            "max": round(max(totals), 1),
+        },
+        # Determinist (nu depinde de zgomotul mașinii): util pentru a urmări importurile eliminate
+        "modules_imported": samples[0]["module_count"],
+        "self_ms_by_package": _median_ms(samples, "by_package"),
+        "direct_imports_ms": _median_ms(samples, "direct_imports"),
+        "slowest_modules_ms": dict(list(_median_ms(samples, "modules").items())[:args.top]),
+    }
+
+    print(
+        f"Import {args.module}: p50 {summary['import_ms']['p50']} ms "
+        f"(min {summary['import_ms']['min']}, max {summary['import_ms']['max']}), "
+        f"{summary['modules_imported']} de module"
+    )
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        before = baseline["import_ms"]["p50"]
+        print(
+            f"Față de baseline: {before} ms -> {summary['import_ms']['p50']} ms "
+            f"({summary['import_ms']['p50'] - before:+.1f} ms), "
+            f"module: {baseline.get('modules_imported', '?')} -> {summary['modules_imported']}"
+        )
+
+    for title, key in (("Timp propriu pe pachet", "self_ms_by_package"), ("Importuri directe", "direct_imports_ms")):
+        print(f"\n{title} (ms):")
+        for name, value in list(summary[key].items())[:args.top]:
+            delta = ""
+            if baseline is not None:
+                delta = f"  ({value - baseline.get(key, {}).get(name, 0):+.1f})"
+            print(f"  {name:<40} {value:>8}{delta}")
+    print("\nModulele cele mai lente (timp propriu, ms):")
+    for name, value in summary["slowest_modules_ms"].items():
+        print(f"  {name:<40} {value:>8}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+    if args.max_ms is not None and summary["import_ms"]["p50"] > args.max_ms:
+        print(f"\nImportul depășește pragul de {args.max_ms:g} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Benchmark pentru indexul de suprapuneri (core/schedule_conflicts.py) pe un orar sintetic
+de facultate, fără bază de date: construirea indexului, raportul complet și verificările
+individuale ("ce suprapuneri produce această modificare").
+
+Utilizare (din directorul server/):
+    python benchmarks/schedule_conflicts.py
+    python benchmarks/schedule_conflicts.py --groups 160 --sessions-per-group 22 --checks 20000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.schedule_conflicts import SlotIndex, schedule_bookings  # noqa: E402
+
+DAYS = ["Luni", "Marți", "Miercuri", "Joi", "Vineri", "Sâmbătă"]
+HOURS = ["8.00-9.30", "9.45-11.15", "11.30-13.00", "13.30-15.00", "15.15-16.45", "17.00-18.30", "18.45-20.15"]
+
+
+def generate_timetable(groups: int, sessions_per_group: int, professors: int, rooms: int, seed: int):
+    """Generează ore de curs aleatoare; ~20% au alternanță pe săptămâna impară."""
+    rng = random.Random(seed)
+    rows = []
+    for group_id in range(1, groups + 1):
+        for _ in range(sessions_per_group):
+            alternate = rng.random() < 0.2
+            rows.append(SimpleNamespace(
+                id=len(rows) + 1,
+                subject_id=rng.randint(1, 400),
+                professor_id=rng.randint(1, professors),
+                room_id=rng.randint(1, rooms),
+                day=rng.choice(DAYS),
+                hour=rng.choice(HOURS),
+                status="normal",
+                odd_week_subject_id=rng.randint(1, 400) if alternate else None,
+                odd_week_professor_id=rng.randint(1, professors) if alternate else None,
+                odd_week_room_id=rng.randint(1, rooms) if alternate else None,
+                academic_year=(group_id % 4) + 1,
+                semester="semester1",
+                cycle_type="F",
+            ))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pentru indexul de suprapuneri.")
+    parser.add_argument("--groups", type=int, default=120)
+    parser.add_argument("--sessions-per-group", type=int, default=24)
+    parser.add_argument("--professors", type=int, default=250)
+    parser.add_argument("--rooms", type=int, default=90)
+    parser.add_argument("--checks", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Fișier JSON în care se scriu rezultatele")
+    args = parser.parse_args()
+
+    rows = generate_timetable(args.groups, args.sessions_per_group, args.professors, args.rooms, args.seed)
+
+    started = time.perf_counter()
+    index = SlotIndex()
+    for row in rows:
+        index.add(row.id, schedule_bookings(row), row.academic_year)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    conflicts = index.all_conflicts()
+    scan_ms = (time.perf_counter() - started) * 1000
+
+    rng = random.Random(args.seed + 1)
+    candidates = [rng.choice(rows) for _ in range(args.checks)]
+    started = time.perf_counter()
+    for candidate in candidates:
+        index.conflicts_for(schedule_bookings(candidate), candidate.id)
+    check_us = (time.perf_counter() - started) * 1_000_000 / args.checks
+
+    started = time.perf_counter()
+    for candidate in candidates[:1000]:
+        index.add(candidate.id, schedule_bookings(candidate), candidate.academic_year)
+    update_us = (time.perf_counter() - started) * 1_000_000 / min(1000, args.checks)
+
+    summary = {
+        "schedules": len(rows),
+        "occupied_cells": len(index.cells),
+        "conflicts": len(conflicts),
+        "build_ms": round(build_ms, 2),
+        "full_scan_ms": round(scan_ms, 2),
+        "check_us": round(check_us, 2),
+        "update_us": round(update_us, 2),
+    }
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(summary, output_file, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
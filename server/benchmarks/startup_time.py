@@ -0,0 +1,95 @@
+"""
+Benchmark pentru timpul de pornire (cold start) al unui worker.
+
+Fiecare măsurătoare pornește un proces Python nou care importă `main` (exact ce face
+uvicorn pentru fiecare worker) și raportează durata importului, precum și numărul de
+conexiuni și interogări făcute la baza de date în timpul importului.
+
+Utilizare (din directorul server/):
+    python benchmarks/startup_time.py
+    python benchmarks/startup_time.py --runs 20 --database-url sqlite:////tmp/bench.db
+    python benchmarks/startup_time.py --server-dir /cale/catre/alt/checkout/server --output rezultat.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Rulat în procesul copil: atașează contoarele pe engine înainte de importul aplicației
+CHILD_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+from sqlalchemy import event
+from core.database import engine
+counters = {"connections": 0, "queries": 0}
+event.listen(engine, "connect", lambda *args: counters.__setitem__("connections", counters["connections"] + 1))
+event.listen(engine, "before_cursor_execute", lambda *args: counters.__setitem__("queries", counters["queries"] + 1))
+import main
+counters["import_seconds"] = time.perf_counter() - started
+sys.stdout.write("@@" + json.dumps(counters))
+"""
+
+
+def measure_once(server_dir: str, env: dict) -> dict:
+    """Pornește un proces nou, importă aplicația și întoarce măsurătorile."""
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        cwd=server_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.rsplit("@@", 1)[1])
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Măsoară timpul de pornire al unui worker FastAPI.")
+    parser.add_argument("--runs", type=int, default=10, help="Numărul de porniri măsurate (implicit 10)")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="DATABASE_URL folosit de worker")
+    parser.add_argument("--server-dir", default=SERVER_DIR, help="Directorul server/ care se măsoară")
+    parser.add_argument("--output", help="Fișier JSON în care se scriu rezultatele")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.database_url:
+        env["DATABASE_URL"] = args.database_url
+
+    # Prima pornire încălzește cache-ul de bytecode și nu este inclusă în statistici
+    measure_once(args.server_dir, env)
+    samples = [measure_once(args.server_dir, env) for _ in range(args.runs)]
+    durations = [sample["import_seconds"] * 1000 for sample in samples]
+
+    summary = {
+        "server_dir": os.path.abspath(args.server_dir),
+        "database_url": env.get("DATABASE_URL", "sqlite:///./schedule.db"),
+        "runs": args.runs,
+        "import_ms": {
+            "min": round(min(durations), 1),
+            "p50": round(statistics.median(durations), 1),
+            "p95": round(percentile(durations, 95), 1),
+            "max": round(max(durations), 1),
+        },
+        "db_connections_per_worker": max(sample["connections"] for sample in samples),
+        "db_queries_per_worker": max(sample["queries"] for sample in samples),
+    }
+
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(summary, output_file, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
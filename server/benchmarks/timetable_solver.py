@@ -0,0 +1,125 @@
+"""
+Benchmark pentru solver-ul de orar (core/timetable_solver.py) pe instanțe sintetice de
+dimensiunea unei facultăți, fără bază de date.
+
+Instanțe:
+    year     - un an de studiu: 2 serii × 4 grupe, ~75 de ore de plasat
+    faculty  - 4 ani × 2 serii × 4 grupe, ~300 de ore, cu săli parțial ocupate de alte facultăți
+
+Fiecare disciplină are curs pe serie (sală mare), seminar sau laborator pe grupă (unele doar
+la două săptămâni, perechi pară/impară), profesori comuni între ani și indisponibilități.
+
+Utilizare (din directorul server/):
+    python benchmarks/timetable_solver.py --instance faculty --time-limit 20 --workers 4
+    python benchmarks/timetable_solver.py --instance year --workers 1 --output rezultat.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.timetable_solver import (  # noqa: E402
+    EVEN,
+    ODD,
+    PROFESSOR,
+    ROOM,
+    SOLVER_DAYS,
+    SOLVER_HOURS,
+    SessionUnit,
+    TimetableProblem,
+    solve_timetable,
+)
+
+INSTANCES = {
+    "year": {"years": 1, "series": 2, "groups_per_series": 4, "subjects": 7, "professors": 22, "rooms": 20},
+    "faculty": {"years": 4, "series": 2, "groups_per_series": 4, "subjects": 7, "professors": 70, "rooms": 45},
+}
+
+
+def generate_problem(instance: str, seed: int) -> TimetableProblem:
+    spec = INSTANCES[instance]
+    rng = random.Random(seed)
+    slot_count = len(SOLVER_DAYS) * len(SOLVER_HOURS)
+
+    # Săli: amfiteatre (serii), săli de seminar, laboratoare; crescător după capacitate
+    capacities = {}
+    for room_id in range(1, spec["rooms"] + 1):
+        kind = room_id % 5
+        capacities[room_id] = 120 if kind == 0 else (30 if kind in (1, 2) else 25)
+    labs = tuple(sorted((r for r, c in capacities.items() if c == 25), key=capacities.get))
+    seminar_rooms = tuple(sorted((r for r, c in capacities.items() if c >= 30), key=capacities.get))
+    halls = tuple(r for r, c in capacities.items() if c >= 120)
+
+    units = []
+    group_id = 0
+    requirement = 0
+    for _ in range(spec["years"]):
+        for _ in range(spec["series"]):
+            groups = tuple(range(group_id + 1, group_id + spec["groups_per_series"] + 1))
+            group_id += spec["groups_per_series"]
+            for _ in range(spec["subjects"]):
+                course_professor = rng.randint(1, spec["professors"])
+                for _ in range(rng.choice((1, 2))):
+                    units.append(SessionUnit(requirement, groups, course_professor, (EVEN, ODD), halls))
+                requirement += 1
+                applied_professor = rng.randint(1, spec["professors"])
+                lab = rng.random() < 0.4
+                biweekly = rng.random() < 0.3
+                for group in groups:
+                    parities = ((EVEN,) if group % 2 else (ODD,)) if biweekly else (EVEN, ODD)
+                    units.append(SessionUnit(requirement, (group,), applied_professor, parities, labs if lab else seminar_rooms))
+                requirement += 1
+
+    # Ocupare existentă: alte facultăți folosesc ~25% din săli, profesorii au indisponibilități
+    occupied = {}
+    for room_id in capacities:
+        for slot in rng.sample(range(slot_count), slot_count // 4):
+            for parity in (EVEN, ODD):
+                occupied[(ROOM, room_id, slot, parity)] = 1
+    for professor_id in range(1, spec["professors"] + 1):
+        for slot in rng.sample(range(slot_count), 4):
+            for parity in (EVEN, ODD):
+                occupied[(PROFESSOR, professor_id, slot, parity)] = 1
+
+    return TimetableProblem(days=list(SOLVER_DAYS), hours=list(SOLVER_HOURS), units=units, occupied=occupied)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pentru solver-ul de orar.")
+    parser.add_argument("--instance", choices=sorted(INSTANCES), default="faculty")
+    parser.add_argument("--time-limit", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Fișier JSON în care se scriu rezultatele")
+    args = parser.parse_args()
+
+    problem = generate_problem(args.instance, args.seed)
+    started = time.perf_counter()
+    solution = solve_timetable(problem, args.time_limit, seed=args.seed, workers=args.workers)
+    wall_seconds = time.perf_counter() - started
+
+    result = {
+        "instance": args.instance,
+        "sessions": len(problem.units),
+        "slots": problem.slot_count,
+        "workers": solution.workers,
+        "time_limit_seconds": args.time_limit,
+        "wall_seconds": round(wall_seconds, 2),
+        "iterations": solution.iterations,
+        "iterations_per_second": round(solution.iterations / max(wall_seconds, 1e-9)),
+        "cost": solution.cost,
+        **solution.breakdown,
+    }
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
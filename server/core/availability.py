@@ -0,0 +1,108 @@
+"""
+Căutarea sălilor și profesorilor liberi într-un slot (zi × interval × paritate).
+
+Ocuparea vine din bitmap-urile indexului de orar (core/schedule_conflicts.py), actualizate
+incremental la scrieri; lista sălilor/profesorilor este ținută în memorie și invalidată la
+modificările din routerele de săli/profesori. O căutare nu atinge baza de date când datele
+sunt proaspete: un AND pe bitmap și o trecere prin sălile cu capacitatea suficientă.
+Cu fresh=True (read-your-writes), ocuparea și lista sunt citite din sesiunea primită, fără
+cache-urile worker-ului.
+"""
+import bisect
+import os
+import threading
+import time
+from typing import Callable, Generic, List, TypeVar
+
+from sqlalchemy.orm import Session
+
+from core.schedule_conflicts import RESOURCE_PROFESSOR, RESOURCE_ROOM, schedule_conflict_index
+from models.professor import Professor
+from models.room import Room
+from schemas.reference import ProfessorResponse, RoomResponse
+
+AVAILABILITY_CATALOG_TTL_SECONDS = float(os.getenv("AVAILABILITY_CATALOG_TTL_SECONDS", "60"))
+
+T = TypeVar("T")
+
+
+class ResourceCatalog(Generic[T]):
+    """Lista unei resurse (săli sau profesori) ținută în memorie, reîncărcată după TTL."""
+
+    def __init__(self, loader: Callable[[Session], List[T]], ttl_seconds: float = AVAILABILITY_CATALOG_TTL_SECONDS):
+        self._loader = loader
+        self.ttl_seconds = ttl_seconds
+        self._items: List[T] | None = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, fresh: bool = False) -> List[T]:
+        if fresh:
+            return self._loader(db)
+        with self._lock:
+            if self._items is None or time.monotonic() - self._loaded_at >= self.ttl_seconds:
+                self._items = self._loader(db)
+                self._loaded_at = time.monotonic()
+            return self._items
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._items = None
+
+
+def _load_rooms(db: Session) -> List[RoomResponse]:
+    # Ordonate descrescător după capacitate (sălile fără capacitate la final)
+    rooms = db.query(Room).order_by(Room.capacity.desc().nullslast(), Room.code).all()
+    return [RoomResponse.model_validate(room) for room in rooms]
+
+
+def _load_professors(db: Session) -> List[ProfessorResponse]:
+    professors = db.query(Professor).order_by(Professor.full_name).all()
+    return [ProfessorResponse.model_validate(professor) for professor in professors]
+
+
+room_catalog: ResourceCatalog[RoomResponse] = ResourceCatalog(_load_rooms)
+professor_catalog: ResourceCatalog[ProfessorResponse] = ResourceCatalog(_load_professors)
+
+
+def find_available_rooms(
+    db: Session,
+    day: str,
+    hour: str,
+    semester: str,
+    parity: str | None = None,
+    min_capacity: int | None = None,
+    fresh: bool = False,
+) -> List[RoomResponse]:
+    """
+    Sălile libere în slotul semestrului, în toate tipurile de ciclu (cu parity=None: libere în
+    ambele săptămâni), opțional doar cele cu capacitatea cel puțin `min_capacity`, în ordinea
+    descrescătoare a capacității.
+    """
+    occupied = schedule_conflict_index.occupied_mask(
+        db, RESOURCE_ROOM, day, hour, parity, semester, fresh
+    )
+    rooms = room_catalog.get(db, fresh)
+    if min_capacity is not None:
+        # Sălile sunt ordonate descrescător după capacitate: taie la prima sală prea mică
+        capacities = [-(room.capacity if room.capacity is not None else -1) for room in rooms]
+        rooms = rooms[:bisect.bisect_right(capacities, -min_capacity)]
+    return [room for room in rooms if not (occupied >> room.id) & 1]
+
+
+def find_available_professors(
+    db: Session,
+    day: str,
+    hour: str,
+    semester: str,
+    parity: str | None = None,
+    fresh: bool = False,
+) -> List[ProfessorResponse]:
+    """
+    Profesorii liberi în slotul semestrului, în toate tipurile de ciclu (cu parity=None:
+    liberi în ambele săptămâni).
+    """
+    occupied = schedule_conflict_index.occupied_mask(
+        db, RESOURCE_PROFESSOR, day, hour, parity, semester, fresh
+    )
+    return [professor for professor in professor_catalog.get(db, fresh) if not (occupied >> professor.id) & 1]
@@ -0,0 +1,335 @@
+"""
+Generarea feed-urilor iCalendar (RFC 5545) pentru orarul unei grupe, al unui profesor sau al unei săli.
+
+Orele din `schedules` devin evenimente recurente săptămânale pe durata semestrului; cu
+alternanță, ora principală se repetă din două în două săptămâni începând cu a doua
+săptămână (pară), iar câmpurile odd_week_* din două în două începând cu prima (impară).
+Evaluările periodice cu dată devin evenimente unice.
+
+Datele semestrelor vin din CALENDAR_SEMESTER1_START/END și CALENDAR_SEMESTER2_START/END
+(format ISO); implicit, semestrul 1 începe în săptămâna care conține 1 octombrie și
+semestrul 2 în ultima luni din februarie, fiecare de CALENDAR_SEMESTER_WEEKS săptămâni.
+Prima săptămână a semestrului este impară.
+
+Corpul feed-ului nu depinde de momentul generării (DTSTAMP derivat din date), astfel încât
+ETag-ul rămâne același între regenerări și clienții care sondează feed-ul primesc 304.
+"""
+import os
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+from zoneinfo import ZoneInfo
+
+from core.schedule_conflicts import normalize_day
+
+CALENDAR_TIMEZONE = os.getenv("CALENDAR_TIMEZONE", "Europe/Bucharest")
+CALENDAR_UID_DOMAIN = os.getenv("CALENDAR_UID_DOMAIN", "orar.local")
+CALENDAR_SEMESTER_WEEKS = int(os.getenv("CALENDAR_SEMESTER_WEEKS", "14"))
+# Semestrul folosit pentru orele fără semestru setat
+CALENDAR_DEFAULT_SEMESTER = os.getenv("CALENDAR_DEFAULT_SEMESTER", "semester1")
+CALENDAR_ASSESSMENT_DURATION_MINUTES = int(os.getenv("CALENDAR_ASSESSMENT_DURATION_MINUTES", "90"))
+# Cât de des sunt sfătuiți clienții să reîncarce feed-ul (și max-age pentru cache-urile HTTP)
+CALENDAR_REFRESH_MINUTES = int(os.getenv("CALENDAR_REFRESH_MINUTES", "15"))
+
+DAY_OFFSETS = {"luni": 0, "marti": 1, "miercuri": 2, "joi": 3, "vineri": 4, "sambata": 5, "duminica": 6}
+SESSION_TYPE_LABELS = {"course": "curs", "seminar": "seminar", "lab": "laborator"}
+
+WEEKLY, EVEN_WEEKS, ODD_WEEKS = "weekly", "even", "odd"
+PARITY_LABELS = {WEEKLY: None, EVEN_WEEKS: "Săptămâna pară", ODD_WEEKS: "Săptămâna impară"}
+
+
+def _env_date(name: str) -> date | None:
+    value = os.getenv(name)
+    return date.fromisoformat(value) if value else None
+
+
+def _monday(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _academic_year_start(today: date) -> int:
+    return today.year if today.month >= 8 else today.year - 1
+
+
+def semester_period(semester: str | None, today: date | None = None) -> Tuple[date, date] | None:
+    """Intervalul (prima zi, ultima zi) al unui semestru cu ore săptămânale; None pentru celelalte."""
+    semester = semester or CALENDAR_DEFAULT_SEMESTER
+    year = _academic_year_start(today or date.today())
+    if semester == "semester1":
+        start = _env_date("CALENDAR_SEMESTER1_START") or _monday(date(year, 10, 1))
+        end = _env_date("CALENDAR_SEMESTER1_END")
+    elif semester == "semester2":
+        last_february_day = date(year + 1, 3, 1) - timedelta(days=1)
+        start = _env_date("CALENDAR_SEMESTER2_START") or _monday(last_february_day)
+        end = _env_date("CALENDAR_SEMESTER2_END")
+    else:
+        return None
+    return start, end or start + timedelta(weeks=CALENDAR_SEMESTER_WEEKS, days=-1)
+
+
+def _parse_clock(text: str) -> time | None:
+    text = text.strip().replace(".", ":")
+    if not text:
+        return None
+    hours, _, minutes = text.partition(":")
+    try:
+        return time(int(hours), int(minutes or 0))
+    except ValueError:
+        return None
+
+
+def parse_hour_interval(hour: str) -> Tuple[time, time] | None:
+    """"8.00-9.30" / "08:00–09:45" -> (început, sfârșit); fără sfârșit, ora durează 90 de minute."""
+    parts = (hour or "").replace("–", "-").split("-")
+    start = _parse_clock(parts[0])
+    if start is None:
+        return None
+    end = _parse_clock(parts[1]) if len(parts) > 1 else None
+    if end is None:
+        end = (datetime.combine(date.min, start) + timedelta(minutes=90)).time()
+    return start, end
+
+
+# --- formatare RFC 5545 ---
+
+def _escape(text) -> str:
+    return (
+        str(text or "")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Împarte liniile mai lungi de 75 de octeți (continuarea începe cu un spațiu)."""
+    if len(line.encode("utf-8")) <= 75:
+        return line
+    parts, current, size, limit = [], "", 0, 75
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        if size + char_size > limit:
+            parts.append(current)
+            current, size, limit = "", 0, 74  # Liniile de continuare încep cu spațiu
+        current += char
+        size += char_size
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+def _local(value: datetime) -> str:
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def _utc(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _offset(delta: timedelta) -> str:
+    minutes = int(delta.total_seconds() // 60)
+    sign = "+" if minutes >= 0 else "-"
+    minutes = abs(minutes)
+    return f"{sign}{minutes // 60:02d}{minutes % 60:02d}"
+
+
+@lru_cache(maxsize=16)
+def _vtimezone(tz_name: str, year: int) -> Tuple[str, ...]:
+    """Componenta VTIMEZONE derivată din baza de date IANA (tranzițiile anului dat, repetate anual)."""
+    tz = ZoneInfo(tz_name)
+    transitions = []
+    instant = datetime(year, 1, 1, tzinfo=timezone.utc)
+    previous = instant.astimezone(tz).utcoffset()
+    while instant.year == year:
+        following = instant + timedelta(hours=1)
+        offset = following.astimezone(tz).utcoffset()
+        if offset != previous:
+            transitions.append((following, previous, offset, following.astimezone(tz)))
+            previous = offset
+        instant = following
+
+    lines = ["BEGIN:VTIMEZONE", f"TZID:{tz_name}"]
+    if not transitions:
+        offset = _offset(previous)
+        lines += [
+            "BEGIN:STANDARD", "DTSTART:19700101T000000",
+            f"TZOFFSETFROM:{offset}", f"TZOFFSETTO:{offset}", "END:STANDARD",
+        ]
+    for utc_instant, offset_from, offset_to, local in transitions:
+        component = "DAYLIGHT" if local.dst() else "STANDARD"
+        wall_time = (utc_instant + offset_from).replace(tzinfo=None)
+        days_in_month = ((wall_time.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)).day
+        week = -1 if wall_time.day + 7 > days_in_month else (wall_time.day - 1) // 7 + 1
+        weekday = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")[wall_time.weekday()]
+        lines += [
+            f"BEGIN:{component}",
+            f"DTSTART:{_local(wall_time)}",
+            f"RRULE:FREQ=YEARLY;BYMONTH={wall_time.month};BYDAY={week}{weekday}",
+            f"TZOFFSETFROM:{_offset(offset_from)}",
+            f"TZOFFSETTO:{_offset(offset_to)}",
+            f"TZNAME:{local.tzname()}",
+            f"END:{component}",
+        ]
+    lines.append("END:VTIMEZONE")
+    return tuple(lines)
+
+
+# --- evenimente ---
+
+def _name(entity, attribute: str) -> str | None:
+    return getattr(entity, attribute, None) if entity is not None else None
+
+
+def _schedule_sessions(schedule) -> List[Tuple[str, object, object, object]]:
+    """(paritate, disciplină, profesor, sală) pentru fiecare variantă a unei ore."""
+    if schedule.odd_week_subject_id is not None and schedule.odd_week_professor_id is not None:
+        odd_room = schedule.odd_week_room if schedule.odd_week_room_id is not None else schedule.room
+        return [
+            (EVEN_WEEKS, schedule.subject, schedule.professor, schedule.room),
+            (ODD_WEEKS, schedule.odd_week_subject, schedule.odd_week_professor, odd_room),
+        ]
+    return [(WEEKLY, schedule.subject, schedule.professor, schedule.room)]
+
+
+def _schedule_events(schedules: Iterable, professor_id: int | None, room_id: int | None, today: date) -> List[List[str]]:
+    """
+    Evenimentele recurente ale orelor; cu professor_id/room_id, doar variantele (pară/impară)
+    în care apare resursa. Aceeași oră a mai multor grupe (curs pe serie) devine un singur eveniment.
+    """
+    tz = ZoneInfo(CALENDAR_TIMEZONE)
+    merged: Dict[tuple, dict] = {}
+    for schedule in schedules:
+        status = getattr(schedule.status, "value", schedule.status)
+        if status == "canceled":
+            continue
+        period = semester_period(schedule.semester, today)
+        day_offset = DAY_OFFSETS.get(normalize_day(schedule.day))
+        interval = parse_hour_interval(schedule.hour)
+        if period is None or day_offset is None or interval is None:
+            continue
+        for parity, subject, professor, room in _schedule_sessions(schedule):
+            if professor_id is not None and _name(professor, "id") != professor_id:
+                continue
+            if room_id is not None and _name(room, "id") != room_id:
+                continue
+            session_type = getattr(schedule.session_type, "value", schedule.session_type)
+            key = (
+                schedule.semester, schedule.day, schedule.hour, parity, session_type,
+                _name(subject, "id"), _name(professor, "id"), _name(room, "id"),
+            )
+            event = merged.get(key)
+            if event is None:
+                merged[key] = event = {
+                    "id": schedule.id, "version": schedule.version, "parity": parity,
+                    "period": period, "day_offset": day_offset, "interval": interval,
+                    "session_type": session_type, "subject": subject, "professor": professor,
+                    "room": room, "groups": [], "notes": schedule.notes, "status": status,
+                }
+            event["id"] = min(event["id"], schedule.id)
+            event["version"] = max(event["version"] or 1, schedule.version or 1)
+            group_code = _name(schedule.group, "code")
+            if group_code and group_code not in event["groups"]:
+                event["groups"].append(group_code)
+
+    events = []
+    for event in sorted(merged.values(), key=lambda e: (e["period"][0], e["day_offset"], e["interval"][0], e["id"])):
+        start_date, end_date = event["period"]
+        first = _monday(start_date) + timedelta(days=event["day_offset"])
+        step = 1 if event["parity"] == WEEKLY else 2
+        if event["parity"] == EVEN_WEEKS:
+            first += timedelta(weeks=1)
+        while first < start_date:
+            first += timedelta(weeks=step)
+
+        start_time, end_time = event["interval"]
+        starts = datetime.combine(first, start_time)
+        ends = datetime.combine(first, end_time)
+        until = datetime.combine(end_date, time(23, 59, 59), tzinfo=tz)
+        subject_name = _name(event["subject"], "name") or ""
+        type_label = SESSION_TYPE_LABELS.get(event["session_type"], event["session_type"])
+        description = [
+            f"Profesor: {_name(event['professor'], 'full_name') or '-'}",
+            f"Grupe: {', '.join(sorted(event['groups']))}" if event["groups"] else None,
+            PARITY_LABELS[event["parity"]],
+            "Oră mutată" if event["status"] == "moved" else None,
+            event["notes"],
+        ]
+        events.append([
+            "BEGIN:VEVENT",
+            f"UID:schedule-{event['id']}-{event['parity']}@{CALENDAR_UID_DOMAIN}",
+            f"DTSTAMP:{_utc(datetime.combine(start_date, time(), tzinfo=timezone.utc))}",
+            f"SEQUENCE:{event['version']}",
+            f"DTSTART;TZID={CALENDAR_TIMEZONE}:{_local(starts)}",
+            f"DTEND;TZID={CALENDAR_TIMEZONE}:{_local(ends)}",
+            f"RRULE:FREQ=WEEKLY;INTERVAL={step};UNTIL={_utc(until)}",
+            f"SUMMARY:{_escape(f'{subject_name} ({type_label})')}",
+            f"LOCATION:{_escape(_name(event['room'], 'code'))}",
+            f"DESCRIPTION:{_escape(chr(10).join(line for line in description if line))}",
+            "END:VEVENT",
+        ])
+    return events
+
+
+def _assessment_events(assessments: Iterable) -> List[List[str]]:
+    """Evaluările periodice cu dată, ca evenimente unice (toată ziua dacă nu au oră)."""
+    events = []
+    for assessment in assessments:
+        if assessment.assessment_date is None:
+            continue
+        stamp = _utc(datetime.combine(assessment.assessment_date, time(), tzinfo=timezone.utc))
+        if assessment.assessment_time is not None:
+            starts = datetime.combine(assessment.assessment_date, assessment.assessment_time)
+            ends = starts + timedelta(minutes=CALENDAR_ASSESSMENT_DURATION_MINUTES)
+            timing = [
+                f"DTSTART;TZID={CALENDAR_TIMEZONE}:{_local(starts)}",
+                f"DTEND;TZID={CALENDAR_TIMEZONE}:{_local(ends)}",
+            ]
+        else:
+            timing = [
+                f"DTSTART;VALUE=DATE:{assessment.assessment_date.strftime('%Y%m%d')}",
+                f"DTEND;VALUE=DATE:{(assessment.assessment_date + timedelta(days=1)).strftime('%Y%m%d')}",
+            ]
+        description = [f"Profesor: {assessment.professor_name}", f"Grupe: {assessment.groups_composition}"]
+        events.append([
+            "BEGIN:VEVENT",
+            f"UID:assessment-{assessment.id}@{CALENDAR_UID_DOMAIN}",
+            f"DTSTAMP:{stamp}",
+            *timing,
+            f"SUMMARY:{_escape('Evaluare: ' + assessment.subject)}",
+            f"LOCATION:{_escape(assessment.room_code)}",
+            f"DESCRIPTION:{_escape(chr(10).join(description))}",
+            "END:VEVENT",
+        ])
+    return events
+
+
+def render_calendar(
+    name: str,
+    schedules: Iterable = (),
+    assessments: Iterable = (),
+    professor_id: int | None = None,
+    room_id: int | None = None,
+    today: date | None = None,
+) -> bytes:
+    """Feed-ul iCalendar complet (UTF-8, linii CRLF)."""
+    today = today or date.today()
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//proiect-ACS//Orar//RO",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(name)}",
+        f"X-WR-TIMEZONE:{CALENDAR_TIMEZONE}",
+        f"REFRESH-INTERVAL;VALUE=DURATION:PT{CALENDAR_REFRESH_MINUTES}M",
+        f"X-PUBLISHED-TTL:PT{CALENDAR_REFRESH_MINUTES}M",
+    ]
+    semester_start = semester_period("semester1", today)[0]
+    lines.extend(_vtimezone(CALENDAR_TIMEZONE, semester_start.year))
+    for event in _schedule_events(schedules, professor_id, room_id, today):
+        lines.extend(event)
+    for event in _assessment_events(assessments):
+        lines.extend(event)
+    lines.append("END:VCALENDAR")
+    return ("\r\n".join(_fold(line) for line in lines) + "\r\n").encode("utf-8")
@@ -0,0 +1,139 @@
+"""
+Compresia răspunsurilor HTTP (brotli sau gzip, după Accept-Encoding).
+
+- Se comprimă doar tipurile text (JSON, text/*, iCalendar etc.) de cel puțin
+  COMPRESSION_MIN_SIZE octeți: sub prag, câștigul nu acoperă costul CPU.
+- Răspunsurile care au deja Content-Encoding nu sunt atinse. Astfel, răspunsurile din cache
+  (core/response_cache.py), comprimate o singură dată per versiune a orarului, trec prin
+  middleware fără a fi comprimate din nou.
+- Brotli este folosit dacă pachetul `brotli` este instalat și clientul îl acceptă; altfel gzip.
+- Corpurile mari se comprimă pe threadpool, ca să nu blocheze event loop-ul.
+
+Mesajele WebSocket (ex: refresh_all) sunt comprimate separat, prin permessage-deflate,
+negociat implicit de uvicorn.
+"""
+import gzip
+import os
+from typing import Optional
+
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:  # dependență opțională: fără ea se folosește doar gzip
+    brotli = None
+
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+# Peste această dimensiune compresia se face pe threadpool
+COMPRESSION_THREADPOOL_SIZE = 64 * 1024
+
+ENCODING_BROTLI = "br"
+ENCODING_GZIP = "gzip"
+
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    if not content_type:
+        return False
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type == "text/event-stream":
+        return False
+    return media_type.startswith(_COMPRESSIBLE_TYPES) or media_type.endswith("+json")
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Codificarea preferată dintre cele suportate (br, apoi gzip) sau None pentru identity."""
+    if not COMPRESSION_ENABLED or not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+
+    def allowed(coding: str) -> bool:
+        return accepted.get(coding, accepted.get("*", 0.0)) > 0
+
+    if brotli is not None and allowed(ENCODING_BROTLI):
+        return ENCODING_BROTLI
+    if allowed(ENCODING_GZIP):
+        return ENCODING_GZIP
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == ENCODING_BROTLI:
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+    # mtime=0: același conținut produce aceiași octeți (ETag-uri stabile, cache-uri intermediare)
+    return gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def _add_vary(response: Response) -> None:
+    vary = response.headers.get("vary")
+    if not vary:
+        response.headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        response.headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+def _with_body(response: Response, body: bytes) -> Response:
+    """Un răspuns nou cu același status și aceleași header-e (inclusiv Set-Cookie multiple)."""
+    new_response = Response(content=body, status_code=response.status_code, background=response.background)
+    new_response.raw_headers = [
+        (name, value) for name, value in response.raw_headers if name != b"content-length"
+    ] + [(b"content-length", str(len(body)).encode("latin-1"))]
+    return new_response
+
+
+async def compression_middleware(request: Request, call_next):
+    """Comprimă răspunsurile text peste COMPRESSION_MIN_SIZE (dacă clientul acceptă)."""
+    response = await call_next(request)
+    if (
+        not COMPRESSION_ENABLED
+        or request.method == "HEAD"
+        or response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or "content-encoding" in response.headers
+        or not is_compressible(response.headers.get("content-type"))
+    ):
+        return response
+
+    content_length = response.headers.get("content-length")
+    if content_length is not None and int(content_length) < COMPRESSION_MIN_SIZE:
+        return response
+
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    if len(body) < COMPRESSION_MIN_SIZE:
+        return _with_body(response, body)
+    if encoding is None:
+        response = _with_body(response, body)
+        _add_vary(response)
+        return response
+
+    if len(body) >= COMPRESSION_THREADPOOL_SIZE:
+        compressed = await run_in_threadpool(compress, body, encoding)
+    else:
+        compressed = compress(body, encoding)
+    response = _with_body(response, compressed)
+    response.headers["Content-Encoding"] = encoding
+    _add_vary(response)
+    return response
@@ -1,8 +1,9 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
-from core.database import SessionLocal
+from core.database import ReadSessionLocal, SessionLocal
+from core.read_routing import READ_REPLICA_ENABLED, should_read_primary
 from core.security import decode_access_token
 from models.user import UserRole
 from repositories.user_repository import UserRepository
@@ -19,6 +20,19 @@ def get_db():
         db.close()
 
 
+def get_read_db(request: Request):
+    """
+    Dependency pentru rutele care doar citesc: sesiune pe replica de citire (DATABASE_READ_URL),
+    sau pe primar dacă nu există replică ori clientul tocmai a scris (read-your-writes).
+    """
+    use_primary = not READ_REPLICA_ENABLED or should_read_primary(request)
+    db = SessionLocal() if use_primary else ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
@@ -0,0 +1,232 @@
+"""
+Coadă în proces pentru trimiterea asincronă a email-urilor.
+
+Request-urile HTTP doar adaugă email-ul în coadă și primesc un ID de livrare;
+thread-uri de fundal fac conexiunea SMTP și reîncearcă eșecurile cu backoff exponențial.
+Statusul livrărilor este păstrat în memorie (per worker) pentru un număr limitat de intrări.
+"""
+import heapq
+import os
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from core.metrics import email_send_duration_seconds, email_send_total
+
+# Configurare coadă (poate fi setată prin variabile de mediu)
+EMAIL_QUEUE_WORKERS = int(os.getenv("EMAIL_QUEUE_WORKERS", "2"))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "5"))
+EMAIL_RETRY_BASE_SECONDS = float(os.getenv("EMAIL_RETRY_BASE_SECONDS", "2"))
+EMAIL_RETRY_MAX_SECONDS = float(os.getenv("EMAIL_RETRY_MAX_SECONDS", "300"))
+EMAIL_QUEUE_HISTORY_SIZE = int(os.getenv("EMAIL_QUEUE_HISTORY_SIZE", "10000"))
+# Peste acest număr de email-uri în așteptare, cererile noi sunt respinse (load shedding)
+EMAIL_QUEUE_MAX_PENDING = int(os.getenv("EMAIL_QUEUE_MAX_PENDING", "500"))
+
+
+class DeliveryStatus:
+    QUEUED = "queued"
+    SENDING = "sending"
+    RETRYING = "retrying"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+@dataclass
+class EmailDelivery:
+    """O livrare de email din coadă."""
+    id: str
+    kind: str
+    recipient: str
+    send: Callable[[], bool] = field(repr=False)
+    status: str = DeliveryStatus.QUEUED
+    attempts: int = 0
+    max_attempts: int = EMAIL_MAX_ATTEMPTS
+    last_error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+    next_attempt_at: float = 0.0  # time.monotonic()
+
+    def to_dict(self) -> dict:
+        return {
+            "delivery_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "last_error": self.last_error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+class EmailQueue:
+    """
+    Coadă de email-uri cu thread-uri de fundal și retry cu backoff exponențial.
+    Thread-urile sunt pornite leneș, la primul email adăugat în coadă.
+    """
+
+    def __init__(
+        self,
+        workers: int = EMAIL_QUEUE_WORKERS,
+        max_attempts: int = EMAIL_MAX_ATTEMPTS,
+        retry_base_seconds: float = EMAIL_RETRY_BASE_SECONDS,
+        retry_max_seconds: float = EMAIL_RETRY_MAX_SECONDS,
+        history_size: int = EMAIL_QUEUE_HISTORY_SIZE,
+    ):
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.history_size = history_size
+
+        self._condition = threading.Condition()
+        self._heap: List[tuple] = []  # (next_attempt_at, seq, delivery_id)
+        self._seq = 0
+        self._deliveries: "OrderedDict[str, EmailDelivery]" = OrderedDict()
+        self._threads: List[threading.Thread] = []
+
+    def enqueue(self, kind: str, recipient: str, send: Callable[[], bool]) -> str:
+        """
+        Adaugă un email în coadă și returnează imediat ID-ul livrării.
+
+        Args:
+            kind: Tipul email-ului (ex: "verification_code")
+            recipient: Destinatarul (pentru diagnostic)
+            send: Funcție care trimite email-ul și returnează True la succes
+        """
+        delivery = EmailDelivery(
+            id=uuid.uuid4().hex,
+            kind=kind,
+            recipient=recipient,
+            send=send,
+            max_attempts=self.max_attempts,
+        )
+        with self._condition:
+            self._remember(delivery)
+            self._schedule(delivery, delay=0.0)
+            self._ensure_workers()
+        return delivery.id
+
+    def mark_failed(self, kind: str, recipient: str, error: str) -> str:
+        """Înregistrează o livrare eșuată definitiv fără a o pune în coadă (ex: SMTP neconfigurat)."""
+        delivery = EmailDelivery(
+            id=uuid.uuid4().hex,
+            kind=kind,
+            recipient=recipient,
+            send=lambda: False,
+            max_attempts=self.max_attempts,
+            status=DeliveryStatus.FAILED,
+            last_error=error,
+        )
+        email_send_total.inc(kind=kind, outcome="failed")
+        with self._condition:
+            self._remember(delivery)
+        return delivery.id
+
+    def get_status(self, delivery_id: str) -> Optional[dict]:
+        """Returnează statusul unei livrări sau None dacă nu este cunoscută de acest worker."""
+        with self._condition:
+            delivery = self._deliveries.get(delivery_id)
+            return delivery.to_dict() if delivery else None
+
+    def pending_count(self) -> int:
+        """Numărul de email-uri care așteaptă trimiterea sau un retry."""
+        with self._condition:
+            return len(self._heap)
+
+    def _remember(self, delivery: EmailDelivery) -> None:
+        self._deliveries[delivery.id] = delivery
+        # Păstrează doar ultimele N livrări: elimină cele mai vechi încheiate, sărind peste
+        # cele încă în curs (o livrare într-un backoff lung nu blochează curățarea)
+        excess = len(self._deliveries) - self.history_size
+        if excess <= 0:
+            return
+        finished_ids = []
+        for delivery_id, entry in self._deliveries.items():
+            if entry.status in (DeliveryStatus.SENT, DeliveryStatus.FAILED):
+                finished_ids.append(delivery_id)
+                if len(finished_ids) == excess:
+                    break
+        for delivery_id in finished_ids:
+            del self._deliveries[delivery_id]
+
+    def _schedule(self, delivery: EmailDelivery, delay: float) -> None:
+        delivery.next_attempt_at = time.monotonic() + delay
+        self._seq += 1
+        heapq.heappush(self._heap, (delivery.next_attempt_at, self._seq, delivery.id))
+        self._condition.notify()
+
+    def _ensure_workers(self) -> None:
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._worker_loop,
+                name=f"email-queue-{len(self._threads) + 1}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _retry_delay(self, attempts: int) -> float:
+        delay = min(self.retry_base_seconds * (2 ** (attempts - 1)), self.retry_max_seconds)
+        return delay * random.uniform(1.0, 1.1)  # jitter pentru a nu reîncerca toate simultan
+
+    def _next_due(self) -> EmailDelivery:
+        """Blochează până când o livrare devine scadentă și o scoate din coadă."""
+        with self._condition:
+            while True:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                due_at, _, delivery_id = self._heap[0]
+                wait_for = due_at - time.monotonic()
+                if wait_for > 0:
+                    self._condition.wait(timeout=wait_for)
+                    continue
+                heapq.heappop(self._heap)
+                delivery = self._deliveries.get(delivery_id)
+                if delivery is None:
+                    continue
+                delivery.status = DeliveryStatus.SENDING
+                delivery.attempts += 1
+                delivery.updated_at = datetime.utcnow()
+                return delivery
+
+    def _worker_loop(self) -> None:
+        while True:
+            delivery = self._next_due()
+            error = None
+            started = time.perf_counter()
+            try:
+                sent = bool(delivery.send())
+            except Exception as e:
+                sent = False
+                error = f"{type(e).__name__}: {str(e)}"
+            email_send_duration_seconds.observe(time.perf_counter() - started, kind=delivery.kind)
+
+            with self._condition:
+                delivery.updated_at = datetime.utcnow()
+                if sent:
+                    email_send_total.inc(kind=delivery.kind, outcome="sent")
+                    delivery.status = DeliveryStatus.SENT
+                    delivery.last_error = None
+                    delivery.send = lambda: True  # eliberează datele capturate (ex: codul)
+                elif delivery.attempts >= self.max_attempts:
+                    email_send_total.inc(kind=delivery.kind, outcome="failed")
+                    delivery.status = DeliveryStatus.FAILED
+                    delivery.last_error = error or "Trimiterea a eșuat"
+                    delivery.send = lambda: False
+                else:
+                    email_send_total.inc(kind=delivery.kind, outcome="retry")
+                    delivery.status = DeliveryStatus.RETRYING
+                    delivery.last_error = error or "Trimiterea a eșuat"
+                    self._schedule(delivery, delay=self._retry_delay(delivery.attempts))
+
+
+# Instanță globală a cozii de email-uri
+email_queue = EmailQueue()
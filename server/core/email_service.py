@@ -1,38 +1,76 @@
 """
 Serviciu pentru trimiterea de email-uri de notificare.
 Folosește SMTP pentru trimiterea email-urilor.
+
+Setările SMTP (și fișierul .env) se citesc la primul email trimis, nu la importul modulului,
+iar smtplib și email.mime se importă tot atunci: pornirea unui worker nu plătește pentru ele.
 """
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Încarcă variabilele de mediu din fișierul .env (dacă există)
-# Caută fișierul .env în directorul server/ (unde este acest fișier)
-env_path = Path(__file__).parent.parent / '.env'
-if env_path.exists():
-    load_dotenv(dotenv_path=env_path)
-    print(f"✓ Fișier .env încărcat din: {env_path}")
-else:
+from core.metrics import email_send_duration_seconds, email_send_total
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EmailSettings:
+    """Configurare SMTP (variabile de mediu sau .env); suportă Gmail, Outlook/Office 365 etc."""
+    host: Optional[str]  # Ex: smtp.gmail.com sau smtp.office365.com
+    port: Optional[str]  # Port pentru TLS (587) sau SSL (465)
+    user: Optional[str]  # Email-ul de la care se trimit notificările
+    password: Optional[str]  # Parola sau parolă de aplicație
+    email_from: Optional[str]
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.host and self.port and self.user and self.password)
+
+    @property
+    def port_number(self) -> int:
+        return int(self.port) if self.port else 587
+
+
+def _load_env_file() -> None:
+    # Caută fișierul .env în directorul server/ (părintele acestui fișier)
+    env_path = Path(__file__).parent.parent / '.env'
+    if env_path.exists():
+        load_dotenv(dotenv_path=env_path)
+        logger.info("Fișier .env încărcat din: %s", env_path)
+        return
     # Încearcă să încarce din directorul curent și din părinte
     load_dotenv()
     current_dir_env = Path('.env')
     if current_dir_env.exists():
         load_dotenv(dotenv_path=current_dir_env)
-        print(f"✓ Fișier .env încărcat din: {current_dir_env.absolute()}")
+        logger.info("Fișier .env încărcat din: %s", current_dir_env.absolute())
     else:
-        print(f"⚠️ Fișier .env nu a fost găsit. Folosesc variabilele de mediu din sistem.")
+        logger.info("Fișier .env nu a fost găsit. Folosesc variabilele de mediu din sistem.")
+
+
+@lru_cache(maxsize=1)
+def get_email_settings() -> EmailSettings:
+    """Setările SMTP, citite o singură dată (la primul email)."""
+    _load_env_file()
+    user = os.getenv("SMTP_USER")
+    return EmailSettings(
+        host=os.getenv("SMTP_HOST"),
+        port=os.getenv("SMTP_PORT"),
+        user=user,
+        password=os.getenv("SMTP_PASSWORD"),
+        email_from=os.getenv("EMAIL_FROM") or user,
+    )
+
+
+def is_smtp_configured() -> bool:
+    """Verifică dacă toate setările SMTP necesare sunt prezente."""
+    return get_email_settings().configured
 
-# Configurare SMTP (poate fi setată prin variabile de mediu sau config)
-# Suportă: Gmail, Outlook/Office 365, sau alte servere SMTP
-SMTP_HOST = os.getenv("SMTP_HOST")  # Ex: smtp.gmail.com sau smtp.office365.com
-SMTP_PORT = os.getenv("SMTP_PORT")  # Port pentru TLS (587) sau SSL (465)
-SMTP_USER = os.getenv("SMTP_USER")  # Email-ul de la care se trimit notificările
-SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")  # Parola sau parolă de aplicație
-EMAIL_FROM = os.getenv("EMAIL_FROM") or SMTP_USER
 
 def send_schedule_notification_email(
     recipient_email: str,
@@ -50,25 +88,31 @@ def send_schedule_notification_email(
     Returns:
         True dacă email-ul a fost trimis cu succes, False altfel
     """
+    import smtplib
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
+    settings = get_email_settings()
     try:
         # Verifică dacă sunt configurate credențialele SMTP
-        if not SMTP_HOST or not SMTP_PORT or not SMTP_USER or not SMTP_PASSWORD:
-            print(f"⚠️ SMTP nu este configurat complet.")
-            print(f"⚠️ SMTP_HOST: {SMTP_HOST}")
-            print(f"⚠️ SMTP_PORT: {SMTP_PORT}")
-            print(f"⚠️ SMTP_USER: {'Setat' if SMTP_USER else 'Nesetat'}")
-            print(f"⚠️ SMTP_PASSWORD: {'Setat' if SMTP_PASSWORD else 'Nesetat'}")
-            print(f"⚠️ Email-ul către {recipient_email} nu a fost trimis.")
-            print("⚠️ Configurează variabilele de mediu SMTP în fișierul .env sau în run_server.bat")
+        if not settings.configured:
+            logger.warning(
+                "SMTP nu este configurat complet (SMTP_HOST=%s, SMTP_PORT=%s, SMTP_USER %s, SMTP_PASSWORD %s); "
+                "email-ul către %s nu a fost trimis. Configurează variabilele de mediu SMTP în fișierul .env "
+                "sau în run_server.bat",
+                settings.host, settings.port,
+                "setat" if settings.user else "nesetat", "setat" if settings.password else "nesetat",
+                recipient_email,
+            )
             return False
         
         # Creează mesajul
         message = MIMEMultipart("alternative")
         message["Subject"] = subject
-        message["From"] = EMAIL_FROM
+        message["From"] = settings.email_from
         message["To"] = recipient_email
         # Adaugă headers importante pentru a evita spam
-        message["Reply-To"] = EMAIL_FROM
+        message["Reply-To"] = settings.email_from
         message["X-Mailer"] = "Schedule Management System"
         message["X-Priority"] = "3"
         message["Importance"] = "Normal"
@@ -120,10 +164,10 @@ Sistemul de Management al Orarului
         message.attach(part2)
         
         # Trimite email-ul
-        smtp_port = int(SMTP_PORT) if SMTP_PORT else 587
+        smtp_port = settings.port_number
 
         
-        with smtplib.SMTP(SMTP_HOST, smtp_port, timeout=30) as server:
+        with smtplib.SMTP(settings.host, smtp_port, timeout=30) as server:
             # Activează debug logging pentru a vedea ce se întâmplă
             server.set_debuglevel(0)  # Poți seta la 1 pentru debug detaliat
             
@@ -131,7 +175,7 @@ Sistemul de Management al Orarului
             server.starttls()  # Activează criptarea TLS
 
             
-            server.login(SMTP_USER, SMTP_PASSWORD)
+            server.login(settings.user, settings.password)
 
             
             # Trimite email-ul
@@ -146,76 +190,60 @@ Sistemul de Management al Orarului
         error_msg = str(e.smtp_error) if hasattr(e, 'smtp_error') else str(e)
         
         if '535' in str(e) or 'Authentication unsuccessful' in str(e) or 'incorrect' in str(e).lower():
-            print(f"✗ EROARE AUTENTIFICARE pentru {SMTP_USER}:")
-            print(f"  Cod eroare: {error_code}")
-            print(f"  Mesaj: {error_msg}")
-            print(f"")
-            print(f"  🔧 SOLUȚII POSIBILE:")
-            print(f"  1. Verifică că parola este corectă")
-            print(f"  2. Dacă ai autentificare în doi pași (2FA), folosește o 'Parolă de aplicație':")
-            if "gmail.com" in (SMTP_HOST or "").lower():
-                print(f"     → Gmail: https://myaccount.google.com/apppasswords")
+            if "gmail.com" in (settings.host or "").lower():
+                app_passwords = "Gmail: https://myaccount.google.com/apppasswords"
             else:
-                print(f"     → Outlook: https://account.microsoft.com/security/app-passwords")
-                print(f"     → Gmail: https://myaccount.google.com/apppasswords")
-            print(f"  3. Verifică că contul permite acces SMTP")
-            print(f"  4. Contactează administratorul IT pentru aprobare (conturi corporative)")
-            print(f"")
+                app_passwords = (
+                    "Outlook: https://account.microsoft.com/security/app-passwords, "
+                    "Gmail: https://myaccount.google.com/apppasswords"
+                )
+            logger.error(
+                "Eroare autentificare SMTP pentru %s (cod %s: %s); email-ul către %s nu a fost trimis. "
+                "Soluții posibile: verifică parola; cu 2FA folosește o parolă de aplicație (%s); "
+                "verifică că contul permite acces SMTP; pentru conturi corporative contactează administratorul IT",
+                settings.user, error_code, error_msg, recipient_email, app_passwords,
+            )
         else:
-            print(f"✗ Eroare autentificare SMTP: {str(e)}")
-        print(f"  Email-ul către {recipient_email} nu a fost trimis.")
+            logger.error("Eroare autentificare SMTP: %s; email-ul către %s nu a fost trimis", e, recipient_email)
         return False
         
     except smtplib.SMTPRecipientsRefused as e:
-        print(f"✗ EROARE: Destinatar refuzat pentru {recipient_email}")
-        print(f"  Detalii: {str(e)}")
-        print(f"  Posibile cauze:")
-        print(f"    - Adresa email nu există sau este invalidă")
-        print(f"    - Serverul destinatar a refuzat email-ul")
+        logger.error(
+            "Destinatar refuzat pentru %s: %s (adresa nu există sau serverul destinatar a refuzat email-ul)",
+            recipient_email, e,
+        )
         return False
         
     except smtplib.SMTPSenderRefused as e:
-        print(f"✗ EROARE: Expeditor refuzat ({EMAIL_FROM})")
-        print(f"  Cod eroare: {e.smtp_code}")
-        print(f"  Mesaj: {e.smtp_error}")
-        print(f"  Posibile cauze:")
-        print(f"    - Contul Gmail/Outlook nu permite trimiterea")
-        print(f"    - Adresa FROM nu este validată")
+        logger.error(
+            "Expeditor refuzat (%s), cod %s: %s (contul nu permite trimiterea sau adresa FROM nu este validată)",
+            settings.email_from, e.smtp_code, e.smtp_error,
+        )
         return False
         
     except smtplib.SMTPDataError as e:
-        print(f"✗ EROARE: Serverul a refuzat datele email-ului")
-        print(f"  Cod eroare: {e.smtp_code}")
-        print(f"  Mesaj: {e.smtp_error}")
-        print(f"  Posibile cauze:")
-        print(f"    - Email-ul este prea mare")
-        print(f"    - Serverul consideră email-ul spam")
+        logger.error(
+            "Serverul a refuzat datele email-ului, cod %s: %s (email prea mare sau considerat spam)",
+            e.smtp_code, e.smtp_error,
+        )
         return False
         
     except smtplib.SMTPConnectError as e:
-        print(f"✗ EROARE: Nu s-a putut conecta la serverul SMTP")
-        print(f"  Server: {SMTP_HOST}:{SMTP_PORT}")
-        print(f"  Detalii: {str(e)}")
-        print(f"  Posibile cauze:")
-        print(f"    - Serverul SMTP este inaccesibil")
-        print(f"    - Portul este blocat de firewall")
+        logger.error(
+            "Nu s-a putut conecta la serverul SMTP %s:%s: %s (server inaccesibil sau port blocat de firewall)",
+            settings.host, settings.port, e,
+        )
         return False
         
     except smtplib.SMTPException as e:
-        print(f"✗ EROARE SMTP la trimiterea email-ului către {recipient_email}: {str(e)}")
-        print(f"  Tip eroare: {type(e).__name__}")
-        if hasattr(e, 'smtp_code'):
-            print(f"  Cod SMTP: {e.smtp_code}")
-        if hasattr(e, 'smtp_error'):
-            print(f"  Eroare SMTP: {e.smtp_error}")
+        logger.error(
+            "Eroare SMTP (%s) la trimiterea email-ului către %s: %s (cod SMTP: %s)",
+            type(e).__name__, recipient_email, e, getattr(e, "smtp_code", "-"),
+        )
         return False
         
-    except Exception as e:
-        print(f"✗ EROARE NEAȘTEPTATĂ la trimiterea email-ului către {recipient_email}: {str(e)}")
-        print(f"  Tip eroare: {type(e).__name__}")
-        import traceback
-        print(f"  Traceback:")
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Eroare neașteptată la trimiterea email-ului către %s", recipient_email)
         return False
 
 
@@ -245,9 +273,13 @@ def send_schedule_notifications_to_students(
 
 
     for i, email in enumerate(student_emails, 1):
-        print(f"[{i}/{len(student_emails)}] Procesare {email}...")
+        logger.debug("[%d/%d] Procesare %s", i, len(student_emails), email)
 
-        if send_schedule_notification_email(email, group_code):
+        started = time.perf_counter()
+        sent = send_schedule_notification_email(email, group_code)
+        email_send_duration_seconds.observe(time.perf_counter() - started, kind="schedule_notification")
+        email_send_total.inc(kind="schedule_notification", outcome="sent" if sent else "failed")
+        if sent:
             results["sent"] += 1
         else:
             results["failed"] += 1
@@ -256,15 +288,15 @@ def send_schedule_notifications_to_students(
         # Adaugă un mic delay între trimiteri pentru a evita rate limiting
         # Gmail permite maxim ~100 email-uri/zi pentru conturi gratuite fără verificare
         # Delay-ul ajută să nu fie blocat ca spam
-        if i < len(student_emails):  # Nu aștepta după ultimul email
+        # (fără SMTP configurat nu se trimite nimic, deci nu are rost să așteptăm)
+        if i < len(student_emails) and is_smtp_configured():  # Nu aștepta după ultimul email
             time.sleep(0.5)  # 0.5 secunde între email-uri
 
 
 
     if results["errors"]:
-        print(f"  ❌ Email-uri care au eșuat: {', '.join(results['errors'][:5])}")
-        if len(results["errors"]) > 5:
-            print(f"     ... și {len(results['errors']) - 5} altele")
+        more = f" ... și {len(results['errors']) - 5} altele" if len(results["errors"]) > 5 else ""
+        logger.warning("Email-uri care au eșuat pentru grupa %s: %s%s", group_code, ", ".join(results["errors"][:5]), more)
     
     return results
 
@@ -285,18 +317,23 @@ def send_verification_code_email(
     Returns:
         True dacă email-ul a fost trimis cu succes, False altfel
     """
+    import smtplib
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
+    settings = get_email_settings()
     try:
         # Verifică dacă sunt configurate credențialele SMTP
-        if not SMTP_HOST or not SMTP_PORT or not SMTP_USER or not SMTP_PASSWORD:
-            print(f"⚠️ SMTP nu este configurat complet. Codul de verificare nu poate fi trimis către {recipient_email}.")
+        if not settings.configured:
+            logger.warning("SMTP nu este configurat complet. Codul de verificare nu poate fi trimis către %s", recipient_email)
             return False
         
         # Creează mesajul
         message = MIMEMultipart("alternative")
         message["Subject"] = subject
-        message["From"] = EMAIL_FROM
+        message["From"] = settings.email_from
         message["To"] = recipient_email
-        message["Reply-To"] = EMAIL_FROM
+        message["Reply-To"] = settings.email_from
         message["X-Mailer"] = "Schedule Management System"
         
         # Conținutul email-ului în text simplu
@@ -407,18 +444,35 @@ Sistemul de Management al Orarului
         message.attach(part2)
         
         # Trimite email-ul
-        smtp_port = int(SMTP_PORT) if SMTP_PORT else 587
+        smtp_port = settings.port_number
         
-        with smtplib.SMTP(SMTP_HOST, smtp_port, timeout=30) as server:
+        with smtplib.SMTP(settings.host, smtp_port, timeout=30) as server:
             server.set_debuglevel(0)
             server.starttls()
-            server.login(SMTP_USER, SMTP_PASSWORD)
+            server.login(settings.user, settings.password)
             server.send_message(message)
         
-        print(f"✓ Cod de verificare trimis cu succes către {recipient_email}")
+        logger.info("Cod de verificare trimis cu succes către %s", recipient_email)
         return True
         
     except Exception as e:
-        print(f"✗ Eroare la trimiterea codului de verificare către {recipient_email}: {str(e)}")
+        logger.error("Eroare la trimiterea codului de verificare către %s: %s", recipient_email, e)
         return False
 
+
+def queue_verification_code_email(recipient_email: str, code: str) -> str:
+    """
+    Pune în coadă email-ul cu codul de verificare și returnează imediat ID-ul livrării.
+    Trimiterea efectivă (și retry-urile cu backoff) se face pe thread-urile cozii de email-uri.
+    """
+    from core.email_queue import email_queue
+
+    if not is_smtp_configured():
+        logger.warning("SMTP nu este configurat complet. Codul de verificare nu poate fi trimis către %s", recipient_email)
+        return email_queue.mark_failed("verification_code", recipient_email, "SMTP nu este configurat")
+
+    return email_queue.enqueue(
+        "verification_code",
+        recipient_email,
+        lambda: send_verification_code_email(recipient_email, code),
+    )
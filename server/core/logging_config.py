@@ -0,0 +1,157 @@
+"""
+Configurarea logging-ului aplicației.
+
+- Handler-ul atașat logger-ului rădăcină doar pune înregistrarea într-o coadă în memorie
+  (QueueHandler); scrierea efectivă la stderr se face pe thread-ul unui QueueListener, deci
+  logarea nu blochează niciodată event loop-ul. Când coada este plină, înregistrările noi
+  sunt aruncate (și numărate) în loc să aștepte.
+- Fiecare request primește un ID (header-ul X-Request-ID primit sau unul generat), adăugat
+  la toate înregistrările emise în timpul request-ului și întors în răspuns.
+- Evenimentele foarte frecvente (conectări WebSocket, broadcast-uri) se loghează cu
+  `extra=SAMPLED` și sunt păstrate doar în proporția LOG_SAMPLE_RATE.
+
+Formatul este text (implicit) sau JSON, câte un obiect pe linie (LOG_FORMAT=json).
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import re
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from fastapi import Request
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()  # text | json
+# Proporția păstrată din evenimentele marcate SAMPLED (1 = toate, 0 = niciunul)
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "0.1"))
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+REQUEST_ID_HEADER = "X-Request-ID"
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+SAMPLED = {"sampled": True}
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+# Atributele standard ale unui LogRecord; restul provin din `extra` și ajung în JSON
+_RESERVED_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+_listener: QueueListener | None = None
+
+
+class RequestIdFilter(logging.Filter):
+    """Adaugă ID-ul request-ului curent (sau "-") la fiecare înregistrare."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Păstrează doar o parte din înregistrările marcate `sampled` (erorile trec întotdeauna)."""
+
+    def __init__(self, rate: float = LOG_SAMPLE_RATE):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sampled", False) or record.levelno >= logging.WARNING:
+            return True
+        if random.random() >= self.rate:
+            return False
+        record.sample_rate = self.rate
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Un obiect JSON pe linie, cu câmpurile din `extra` la nivelul de sus."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRIBUTES and key != "sampled":
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler care aruncă înregistrarea dacă coada este plină, în loc să blocheze."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Mesajul și traceback-ul se formatează aici (argumentele pot fi mutate ulterior),
+        # dar păstrăm câmpurile din `extra` pentru formatter-ul JSON
+        record = logging.makeLogRecord(record.__dict__)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def setup_logging() -> None:
+    """Configurează logger-ul rădăcină (o singură dată per proces); apelat din main.py."""
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    if LOG_FORMAT == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(
+            "%(asctime)s %(levelname)-7s [%(request_id)s] %(name)s: %(message)s"
+        ))
+
+    queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.addFilter(SamplingFilter())
+
+    root = logging.getLogger()
+    root.setLevel(LOG_LEVEL)
+    root.addHandler(queue_handler)
+
+    _listener = QueueListener(queue_handler.queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+async def request_id_middleware(request: Request, call_next):
+    """Setează ID-ul request-ului pentru log-uri și îl întoarce în header-ul X-Request-ID."""
+    incoming = request.headers.get(REQUEST_ID_HEADER, "")
+    request_id = incoming if _VALID_REQUEST_ID.match(incoming) else uuid.uuid4().hex
+    token = request_id_var.set(request_id)
+    try:
+        response = await call_next(request)
+    finally:
+        request_id_var.reset(token)
+    response.headers[REQUEST_ID_HEADER] = request_id
+    return response
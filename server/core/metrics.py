@@ -0,0 +1,322 @@
+"""
+Metrici în format text Prometheus (expuse la GET /metrics).
+
+Colectează, per proces (fiecare worker uvicorn are propriile valori; Prometheus le agregă):
+- latența și numărul request-urilor HTTP, per rută (șablonul căii, nu URL-ul concret);
+- numărul și durata interogărilor SQL, total și per request (hook-uri SQLAlchemy pe engine);
+- starea pool-ului de conexiuni (conexiuni împrumutate, overflow);
+- conexiunile WebSocket active și durata broadcast-urilor;
+- email-urile trimise / eșuate și durata trimiterii.
+
+Implementarea nu are dependențe externe: valorile sunt ținute în memorie, sub un lock.
+"""
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import Request
+from sqlalchemy import event
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+# Dacă este setat, /metrics cere header-ul Authorization: Bearer <token>
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.samples(),
+        ]
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """Gauge setat explicit sau calculat la fiecare citire (`callback` întoarce {labels: valoare})."""
+    type_name = "gauge"
+
+    def __init__(self, *args, callback: Optional[Callable[[], Dict[Tuple[str, ...], float]]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self.callback = callback
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def samples(self) -> List[str]:
+        if self.callback is not None:
+            items = sorted(self.callback().items())
+        else:
+            with self._lock:
+                items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, *args, buckets: Iterable[float] = LATENCY_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # Per etichete: [contor per bucket (ultimul = +Inf), suma, numărul observațiilor]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[2] if state else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, ([*state[0]], state[1], state[2])) for key, state in self._values.items())
+        lines = []
+        for key, (bucket_counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), bucket_counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.register(Counter(
+    "http_requests_total", "Request-uri HTTP tratate.", ("method", "route", "status"),
+))
+http_request_duration_seconds = registry.register(Histogram(
+    "http_request_duration_seconds", "Durata request-urilor HTTP.", ("method", "route"),
+))
+http_requests_in_progress = registry.register(Gauge(
+    "http_requests_in_progress", "Request-uri HTTP în curs de tratare.",
+))
+db_queries_total = registry.register(Counter(
+    "db_queries_total", "Interogări SQL executate.", ("engine",),
+))
+db_query_duration_seconds = registry.register(Histogram(
+    "db_query_duration_seconds", "Durata interogărilor SQL.", ("engine",), buckets=QUERY_BUCKETS,
+))
+db_queries_per_request = registry.register(Histogram(
+    "db_queries_per_request", "Numărul de interogări SQL per request HTTP.", ("route",), buckets=QUERY_COUNT_BUCKETS,
+))
+db_time_per_request_seconds = registry.register(Histogram(
+    "db_time_per_request_seconds", "Timpul petrecut în interogări SQL per request HTTP.", ("route",),
+))
+websocket_broadcast_duration_seconds = registry.register(Histogram(
+    "websocket_broadcast_duration_seconds", "Durata unui broadcast WebSocket (toți destinatarii).", ("kind",),
+))
+websocket_messages_sent_total = registry.register(Counter(
+    "websocket_messages_sent_total", "Mesaje WebSocket trimise prin broadcast.", ("kind",),
+))
+email_send_total = registry.register(Counter(
+    "email_send_total", "Încercări de trimitere a email-urilor, după rezultat.", ("kind", "outcome"),
+))
+email_send_duration_seconds = registry.register(Histogram(
+    "email_send_duration_seconds", "Durata unei încercări de trimitere a unui email.", ("kind",),
+))
+
+# Contoarele SQL ale request-ului curent: [număr interogări, durată totală]
+_request_db_stats: ContextVar[Optional[list]] = ContextVar("request_db_stats", default=None)
+
+
+def register_callback_gauge(name: str, documentation: str, labelnames: Iterable[str], callback) -> Gauge:
+    """Gauge calculat la fiecare scrape (ex: pool-ul de conexiuni, conexiunile WebSocket)."""
+    return registry.register(Gauge(name, documentation, labelnames, callback=callback))
+
+
+def instrument_engine(engine, label: str) -> None:
+    """Înregistrează hook-urile SQLAlchemy care măsoară interogările și gauge-urile pool-ului."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started_at"].pop()
+        elapsed = time.perf_counter() - started
+        db_queries_total.inc(engine=label)
+        db_query_duration_seconds.observe(elapsed, engine=label)
+        stats = _request_db_stats.get()
+        if stats is not None:
+            stats[0] += 1
+            stats[1] += elapsed
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started_at"):
+            connection.info["query_started_at"].pop()
+
+
+def pool_gauges(engines: Dict[str, object]) -> None:
+    """Gauge-uri pentru pool-urile de conexiuni (doar pool-urile cu dimensiune fixă, ex: QueuePool)."""
+
+    def collect(method: str) -> Callable[[], Dict[Tuple[str, ...], float]]:
+        def callback():
+            values = {}
+            for label, engine in engines.items():
+                pool = engine.pool
+                if hasattr(pool, method):
+                    values[(label,)] = float(getattr(pool, method)())
+            return values
+        return callback
+
+    register_callback_gauge("db_pool_size", "Dimensiunea configurată a pool-ului.", ("engine",), collect("size"))
+    register_callback_gauge("db_pool_checked_out", "Conexiuni împrumutate din pool.", ("engine",), collect("checkedout"))
+    register_callback_gauge("db_pool_checked_in", "Conexiuni libere în pool.", ("engine",), collect("checkedin"))
+    register_callback_gauge("db_pool_overflow", "Conexiuni peste dimensiunea pool-ului (negativ = locuri libere).", ("engine",), collect("overflow"))
+
+
+def _route_label(request: Request) -> str:
+    """Șablonul rutei (ex: /orar/{group_code}); URL-urile fără rută au o etichetă comună."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+async def metrics_middleware(request: Request, call_next):
+    """Măsoară durata și interogările SQL ale fiecărui request HTTP."""
+    if request.url.path == "/metrics":
+        return await call_next(request)
+
+    stats = [0, 0.0]
+    token = _request_db_stats.set(stats)
+    started = time.perf_counter()
+    status_code = 500
+    http_requests_in_progress.inc()
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        elapsed = time.perf_counter() - started
+        _request_db_stats.reset(token)
+        http_requests_in_progress.dec()
+        route = _route_label(request)
+        http_requests_total.inc(method=request.method, route=route, status=str(status_code))
+        http_request_duration_seconds.observe(elapsed, method=request.method, route=route)
+        db_queries_per_request.observe(stats[0], route=route)
+        db_time_per_request_seconds.observe(stats[1], route=route)
+
+
+def setup_metrics() -> None:
+    """Atașează hook-urile pe engine-uri și gauge-urile calculate; apelat o dată, din main.py."""
+    from core.database import engine, read_engine
+    from core.email_queue import email_queue
+    from core.websocket_manager import websocket_manager
+
+    engines = {"primary": engine}
+    if read_engine is not engine:
+        engines["read"] = read_engine
+    for label, instrumented in engines.items():
+        instrument_engine(instrumented, label)
+    pool_gauges(engines)
+
+    register_callback_gauge(
+        "websocket_connections", "Conexiuni WebSocket active.", (),
+        lambda: {(): float(websocket_manager.get_connection_count())},
+    )
+    register_callback_gauge(
+        "email_queue_pending", "Email-uri care așteaptă trimiterea sau un retry.", (),
+        lambda: {(): float(email_queue.pending_count())},
+    )
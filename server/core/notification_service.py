@@ -1,13 +1,17 @@
 """
 Serviciu pentru gestionarea notificărilor către studenți când orarul este modificat.
 """
+import logging
+
 from sqlalchemy.orm import Session
-from typing import List, Set
+from typing import Dict, List, Set, Tuple
 from models.user import User, UserRole
 from models.user_group import UserGroup
 from models.group import Group
 from core.email_service import send_schedule_notifications_to_students
 
+logger = logging.getLogger(__name__)
+
 
 def get_students_by_group_id(db: Session, group_id: int) -> List[User]:
     """
@@ -51,6 +55,34 @@ def get_group_code_by_id(db: Session, group_id: int) -> str | None:
     return group.code if group else None
 
 
+def get_student_emails_by_group_ids(db: Session, group_ids: Set[int]) -> Dict[int, Tuple[str, List[str]]]:
+    """
+    Obține, pentru mai multe grupe deodată, codul grupei și email-urile studenților.
+    Două interogări în total, indiferent de numărul de grupe.
+
+    Returns:
+        {group_id: (group_code, [email, ...])} pentru grupele existente
+    """
+    if not group_ids:
+        return {}
+
+    groups = {
+        group_id: (code, [])
+        for group_id, code in db.query(Group.id, Group.code).filter(Group.id.in_(group_ids)).all()
+    }
+    rows = (
+        db.query(UserGroup.group_id, User.username)
+        .join(User, User.id == UserGroup.user_id)
+        .filter(UserGroup.group_id.in_(groups.keys()))
+        .filter(User.role == UserRole.STUDENT)
+        .order_by(UserGroup.group_id, User.username)
+        .all()
+    )
+    for group_id, username in rows:
+        groups[group_id][1].append(username)
+    return groups
+
+
 def notify_students_for_schedule_changes(
     db: Session,
     modified_group_ids: Set[int]
@@ -73,21 +105,16 @@ def notify_students_for_schedule_changes(
         "groups_without_students": []
     }
     
-    for group_id in modified_group_ids:
-        # Obține codul grupei
-        group_code = get_group_code_by_id(db, group_id)
-        if not group_code:
-            continue
-        
-        # Obține studenții din grupă
-        students = get_students_by_group_id(db, group_id)
+    groups = get_student_emails_by_group_ids(db, modified_group_ids)
+
+    for group_id in sorted(groups):
+        # Email-urile studenților (username = posta corporativă)
+        group_code, student_emails = groups[group_id]
         
-        if not students:
+        if not student_emails:
             results["groups_without_students"].append(group_code)
             continue
         
-        # Extrage email-urile studenților (username = posta corporativă)
-        student_emails = [student.username for student in students]
         results["total_students"] += len(student_emails)
         
         # Trimite notificări
@@ -100,7 +127,9 @@ def notify_students_for_schedule_changes(
         results["emails_failed"] += email_results["failed"]
         results["groups_notified"] += 1
         
-        print(f"📧 Notificări trimise pentru grupă {group_code}: {email_results['sent']}/{email_results['total']} email-uri")
+        logger.info(
+            "Notificări trimise pentru grupa %s: %d/%d email-uri", group_code, email_results["sent"], email_results["total"]
+        )
     
     return results
 
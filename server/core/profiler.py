@@ -0,0 +1,343 @@
+"""
+Profiler prin eșantionare pentru worker-ul care rulează, fără restart și fără dependențe.
+
+Un thread de fundal citește periodic stivele tuturor thread-urilor (sys._current_frames)
+și numără stivele identice. Rezultatul este în formatul "folded" (o stivă pe linie,
+cadrele separate prin ';', urmate de numărul de eșantioane), acceptat direct de
+flamegraph.pl, speedscope și inferno.
+
+Moduri:
+- wall: fiecare thread este eșantionat la fiecare tick (inclusiv așteptările: I/O, lock-uri);
+- cpu: un thread este eșantionat doar dacă a consumat CPU de la tick-ul anterior
+  (ceasul CPU per thread, disponibil pe Linux).
+
+Profilarea per request: cu header-ul X-Profile: <PROFILER_TOKEN> (și opțional
+X-Profile-Mode: cpu), request-ul este profilat, iar rezultatul se păstrează în memorie și
+se citește prin /profiling/requests/{id} (ID-ul vine în header-ul X-Profile-Id al răspunsului).
+Se eșantionează doar thread-ul care rulează endpoint-ul acestui request și doar cât timp
+apelul lui este pe stivă (endpoint-urile sunt învelite de track_request_endpoints), așa că
+request-urile concurente pe aceeași rută nu apar în profil.
+"""
+import functools
+import inspect
+import os
+import secrets
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.routing import APIRoute
+
+PROFILER_MAX_SECONDS = float(os.getenv("PROFILER_MAX_SECONDS", "60"))
+PROFILER_INTERVAL_MS = float(os.getenv("PROFILER_INTERVAL_MS", "5"))
+# Dacă este setat, request-urile cu X-Profile: <token> sunt profilate individual
+PROFILER_TOKEN = os.getenv("PROFILER_TOKEN")
+PROFILER_REQUEST_HISTORY = int(os.getenv("PROFILER_REQUEST_HISTORY", "20"))
+PROFILER_MAX_CONCURRENT_REQUESTS = int(os.getenv("PROFILER_MAX_CONCURRENT_REQUESTS", "2"))
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_MODE_HEADER = "X-Profile-Mode"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+MODE_WALL = "wall"
+MODE_CPU = "cpu"
+CPU_MODE_AVAILABLE = hasattr(time, "pthread_getcpuclockid")
+
+# Funcțiile în care thread-urile inactive își petrec timpul (excluse implicit)
+_IDLE_FUNCTIONS = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+    ("_base.py", "wait"),
+}
+
+_SERVER_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+Stack = Tuple[object, ...]  # obiecte code, de la rădăcină spre frunză
+
+
+def _frame_label(code) -> str:
+    filename = code.co_filename
+    if filename.startswith(_SERVER_ROOT):
+        filename = os.path.relpath(filename, _SERVER_ROOT)
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+
+
+def _stack(frame) -> Stack:
+    codes = []
+    while frame is not None:
+        codes.append(frame.f_code)
+        frame = frame.f_back
+    codes.reverse()
+    return tuple(codes)
+
+
+def _stack_below(frame, root) -> Optional[Stack]:
+    """Stiva de sub cadrul `root` (fără el) sau None dacă `root` nu este pe stivă."""
+    codes = []
+    while frame is not None:
+        if frame is root:
+            codes.reverse()
+            return tuple(codes)
+        codes.append(frame.f_code)
+        frame = frame.f_back
+    return None
+
+
+class RequestTarget:
+    """Thread-ul și cadrul în care rulează endpoint-ul unui request profilat."""
+    __slots__ = ("thread_id", "frame")
+
+    def __init__(self):
+        self.thread_id: Optional[int] = None
+        self.frame = None
+
+
+_request_target: ContextVar[Optional[RequestTarget]] = ContextVar("profiled_request", default=None)
+
+
+def _is_idle(stack: Stack) -> bool:
+    leaf = stack[-1]
+    return (os.path.basename(leaf.co_filename), leaf.co_name) in _IDLE_FUNCTIONS
+
+
+class SamplingProfiler:
+    """Eșantionează stivele thread-urilor până la stop(); rezultatul este un Counter de stive."""
+
+    def __init__(
+        self,
+        mode: str = MODE_WALL,
+        interval_seconds: float = PROFILER_INTERVAL_MS / 1000,
+        include_idle: bool = False,
+        exclude_threads: Iterable[int] = (),
+        target: Optional[RequestTarget] = None,
+    ):
+        if mode not in (MODE_WALL, MODE_CPU):
+            raise ValueError(f"Mod de profilare necunoscut: {mode}")
+        if mode == MODE_CPU and not CPU_MODE_AVAILABLE:
+            raise ValueError("Modul cpu nu este disponibil pe această platformă")
+        self.mode = mode
+        self.interval_seconds = interval_seconds
+        self.include_idle = include_idle
+        self.exclude_threads = set(exclude_threads)
+        # Cu target: doar stivele endpoint-ului unui request (de la endpoint spre frunză)
+        self.target = target
+        self.samples: Counter = Counter()
+        self.ticks = 0
+        self.started_at = 0.0
+        self.elapsed_seconds = 0.0
+        self._cpu_times: Dict[int, float] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SamplingProfiler":
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.elapsed_seconds = time.perf_counter() - self.started_at
+        return self.samples
+
+    def _used_cpu(self, thread_id: int) -> bool:
+        try:
+            cpu_time = time.clock_gettime(time.pthread_getcpuclockid(thread_id))
+        except (OSError, OverflowError):
+            return False
+        previous = self._cpu_times.get(thread_id)
+        self._cpu_times[thread_id] = cpu_time
+        return previous is not None and cpu_time > previous
+
+    def _sample_target(self) -> None:
+        thread_id, root = self.target.thread_id, self.target.frame
+        if root is None:
+            return
+        frame = sys._current_frames().get(thread_id)
+        if frame is None or (self.mode == MODE_CPU and not self._used_cpu(thread_id)):
+            return
+        stack = _stack_below(frame, root)
+        if not stack or (not self.include_idle and _is_idle(stack)):
+            return
+        self.samples[stack] += 1
+
+    def _run(self) -> None:
+        self.exclude_threads.add(threading.get_ident())
+        while not self._stop.wait(self.interval_seconds):
+            self.ticks += 1
+            if self.target is not None:
+                self._sample_target()
+                continue
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id in self.exclude_threads:
+                    continue
+                if self.mode == MODE_CPU and not self._used_cpu(thread_id):
+                    continue
+                stack = _stack(frame)
+                if not stack or (not self.include_idle and _is_idle(stack)):
+                    continue
+                self.samples[stack] += 1
+
+
+def folded(samples: Counter) -> str:
+    """Formatul folded (flamegraph)."""
+    lines: Counter = Counter()
+    for stack, count in samples.items():
+        lines[";".join(_frame_label(code) for code in stack)] += count
+    return "".join(f"{stack} {count}\n" for stack, count in lines.most_common())
+
+
+_profile_lock = threading.Lock()
+
+
+def profile_worker(seconds: float, mode: str, interval_ms: float, include_idle: bool) -> Tuple[str, dict]:
+    """
+    Profilează worker-ul timp de `seconds` (blochează apelantul). Un singur profil simultan:
+    RuntimeError dacă altul rulează deja.
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise RuntimeError("Un profil rulează deja în acest worker")
+    try:
+        profiler = SamplingProfiler(
+            mode=mode,
+            interval_seconds=interval_ms / 1000,
+            include_idle=include_idle,
+            exclude_threads=[threading.get_ident()],
+        ).start()
+        time.sleep(seconds)
+        samples = profiler.stop()
+    finally:
+        _profile_lock.release()
+    return folded(samples), {
+        "mode": mode,
+        "ticks": profiler.ticks,
+        "samples": sum(samples.values()),
+        "elapsed_seconds": round(profiler.elapsed_seconds, 3),
+    }
+
+
+class RequestProfileStore:
+    """Ultimele profile per request (per worker), cu limită de intrări."""
+
+    def __init__(self, max_entries: int = PROFILER_REQUEST_HISTORY):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, entry: dict) -> str:
+        profile_id = uuid.uuid4().hex
+        with self._lock:
+            self._entries[profile_id] = {"id": profile_id, **entry}
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return profile_id
+
+    def get(self, profile_id: str) -> Optional[dict]:
+        with self._lock:
+            return self._entries.get(profile_id)
+
+    def list(self) -> List[dict]:
+        with self._lock:
+            return [
+                {key: value for key, value in entry.items() if key != "folded"}
+                for entry in reversed(self._entries.values())
+            ]
+
+
+request_profiles = RequestProfileStore()
+_request_slots = threading.BoundedSemaphore(max(1, PROFILER_MAX_CONCURRENT_REQUESTS))
+
+
+def _tracked(call: Callable) -> Callable:
+    """Învelește un endpoint ca să-și noteze thread-ul și cadrul când request-ul este profilat."""
+    if inspect.iscoroutinefunction(call):
+        @functools.wraps(call)
+        async def tracked_async(*args, **kwargs):
+            target = _request_target.get()
+            if target is not None:
+                target.thread_id, target.frame = threading.get_ident(), sys._getframe()
+            return await call(*args, **kwargs)
+
+        tracked_async.__profiler_tracked__ = True
+        return tracked_async
+
+    @functools.wraps(call)
+    def tracked(*args, **kwargs):
+        # Contextul request-ului este copiat și în threadpool, deci target-ul este vizibil aici
+        target = _request_target.get()
+        if target is not None:
+            target.thread_id, target.frame = threading.get_ident(), sys._getframe()
+        return call(*args, **kwargs)
+
+    tracked.__profiler_tracked__ = True
+    return tracked
+
+
+def track_request_endpoints(app: FastAPI) -> None:
+    """
+    Învelește endpoint-urile HTTP ale aplicației pentru profilarea per request (doar cu
+    PROFILER_TOKEN setat). Se apelează după ce toate routerele au fost incluse.
+    """
+    if not PROFILER_TOKEN:
+        return
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        call = route.dependant.call
+        if call is not None and not getattr(call, "__profiler_tracked__", False):
+            route.dependant.call = _tracked(call)
+
+
+def _wants_profile(request: Request) -> bool:
+    value = request.headers.get(PROFILE_HEADER)
+    return bool(PROFILER_TOKEN and value and secrets.compare_digest(value, PROFILER_TOKEN))
+
+
+async def request_profiling_middleware(request: Request, call_next):
+    """Profilează request-urile marcate cu X-Profile (dacă token-ul este corect și există loc)."""
+    if not _wants_profile(request) or not _request_slots.acquire(blocking=False):
+        return await call_next(request)
+
+    try:
+        requested_mode = request.headers.get(PROFILE_MODE_HEADER, MODE_WALL).lower()
+        mode = MODE_CPU if requested_mode == MODE_CPU and CPU_MODE_AVAILABLE else MODE_WALL
+        # Un request durează milisecunde: eșantionăm des (cel mult 1 ms), doar pe durata lui
+        target = RequestTarget()
+        token = _request_target.set(target)
+        profiler = SamplingProfiler(
+            mode=mode,
+            interval_seconds=min(PROFILER_INTERVAL_MS, 1.0) / 1000,
+            target=target,
+        ).start()
+        try:
+            response = await call_next(request)
+        finally:
+            samples = profiler.stop()
+            _request_target.reset(token)
+    finally:
+        _request_slots.release()
+
+    profile_id = request_profiles.add({
+        "method": request.method,
+        "path": request.url.path,
+        "route": getattr(request.scope.get("route"), "path", None),
+        "status": response.status_code,
+        "mode": mode,
+        "elapsed_seconds": round(profiler.elapsed_seconds, 4),
+        "samples": sum(samples.values()),
+        "folded": folded(samples),
+    })
+    response.headers[PROFILE_ID_HEADER] = profile_id
+    return response
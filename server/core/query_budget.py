@@ -0,0 +1,165 @@
+"""
+Buget de interogări SQL per request și detector de N+1 (pentru dezvoltare și test).
+
+Fiecare rută poate declara câte interogări are voie să facă:
+
+    @router.get("/")
+    @query_budget(2)
+    def list_users(...): ...
+
+Cu QUERY_BUDGET_MODE=log, middleware-ul numără interogările fiecărui request (hook-uri
+SQLAlchemy pe engine) și afișează un avertisment când bugetul (declarat sau
+QUERY_BUDGET_DEFAULT) este depășit sau când aceeași formă de interogare se repetă de cel
+puțin QUERY_REPEAT_THRESHOLD ori (semnul tipic al unui N+1). Cu QUERY_BUDGET_MODE=raise,
+request-ul respectiv primește 500, ca regresiile să fie observate imediat. Implicit (off)
+nu se instalează niciun hook.
+
+`count_queries()` oferă aceeași numărătoare în scripturi:
+
+    with count_queries() as tracker:
+        client.get("/users/")
+    assert tracker.count <= 2, tracker.report()
+"""
+import logging
+import os
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+QUERY_BUDGET_MODE = os.getenv("QUERY_BUDGET_MODE", "off").lower()  # off | log | raise
+# Bugetul rutelor fără @query_budget; 0 = doar rutele declarate sunt verificate
+QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", "20"))
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", "3"))
+
+_active_tracker: ContextVar[Optional["QueryTracker"]] = ContextVar("query_budget_tracker", default=None)
+# Tracker-ele `count_queries()` văd toate interogările procesului (și cele din thread-urile aplicației)
+_global_trackers: List["QueryTracker"] = []
+_instrumented_engines = set()
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+# Listele IN (...) expandate au un număr variabil de parametri; le reducem la o singură formă
+_PARAMETER_LIST = re.compile(r"\((?:\s*(?:\?|%\(\w+\)s|:\w+|\$\d+)\s*,)+\s*(?:\?|%\(\w+\)s|:\w+|\$\d+)\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Forma unei interogări: fără literali și cu listele de parametri comprimate."""
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _PARAMETER_LIST.sub("(?...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryTracker:
+    """Interogările executate într-un request sau într-un bloc `count_queries()`."""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def repeated_shapes(self, threshold: int = QUERY_REPEAT_THRESHOLD) -> List[tuple]:
+        """Formele care apar de cel puțin `threshold` ori, descrescător după număr."""
+        shapes = Counter(statement_shape(statement) for statement in self.statements)
+        return [(shape, times) for shape, times in shapes.most_common() if times >= threshold]
+
+    def report(self, limit: int = 3) -> str:
+        lines = [f"{self.count} interogări"]
+        for shape, times in self.repeated_shapes()[:limit]:
+            lines.append(f"  {times}x {shape[:200]}")
+        return "\n".join(lines)
+
+
+def query_budget(max_queries: int) -> Callable:
+    """Declară numărul maxim de interogări SQL permise pentru un endpoint."""
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.__query_budget__ = max_queries
+        return endpoint
+    return decorator
+
+
+def instrument_engine(engine) -> None:
+    """Atașează (o singură dată) hook-ul care înregistrează interogările în tracker-ul activ."""
+    if engine in _instrumented_engines:
+        return
+    _instrumented_engines.add(engine)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        tracker = _active_tracker.get()
+        if tracker is not None:
+            tracker.statements.append(statement)
+        for global_tracker in _global_trackers:
+            global_tracker.statements.append(statement)
+
+
+@contextmanager
+def count_queries():
+    """Numără toate interogările executate pe engine-urile aplicației cât timp blocul este activ."""
+    from core.database import engine, read_engine
+
+    instrument_engine(engine)
+    instrument_engine(read_engine)
+    tracker = QueryTracker()
+    _global_trackers.append(tracker)
+    try:
+        yield tracker
+    finally:
+        _global_trackers.remove(tracker)
+
+
+def _budget_for(request: Request) -> int:
+    endpoint = request.scope.get("endpoint")
+    return getattr(endpoint, "__query_budget__", QUERY_BUDGET_DEFAULT)
+
+
+async def query_budget_middleware(request: Request, call_next):
+    """Verifică bugetul de interogări și formele repetate pentru fiecare request."""
+    tracker = QueryTracker()
+    token = _active_tracker.set(tracker)
+    try:
+        response = await call_next(request)
+    finally:
+        _active_tracker.reset(token)
+
+    budget = _budget_for(request)
+    problems = []
+    if budget and tracker.count > budget:
+        problems.append(f"buget depășit ({tracker.count} > {budget})")
+    repeated = tracker.repeated_shapes()
+    if repeated:
+        problems.append(f"posibil N+1 ({repeated[0][1]}x aceeași interogare)")
+    if not problems:
+        return response
+
+    route = getattr(request.scope.get("route"), "path", request.url.path)
+    message = f"{request.method} {route}: " + "; ".join(problems)
+    logger.warning("Query budget: %s\n%s", message, tracker.report())
+    if QUERY_BUDGET_MODE == "raise":
+        return JSONResponse(
+            status_code=500,
+            content={"detail": f"Query budget: {message}", "queries": tracker.count, "repeated": repeated[:3]},
+        )
+    return response
+
+
+def setup_query_budget(app) -> None:
+    """Activează verificarea conform QUERY_BUDGET_MODE; apelat o dată, din main.py."""
+    if QUERY_BUDGET_MODE not in ("log", "raise"):
+        return
+    from core.database import engine, read_engine
+
+    instrument_engine(engine)
+    instrument_engine(read_engine)
+    app.middleware("http")(query_budget_middleware)
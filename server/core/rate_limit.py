@@ -0,0 +1,231 @@
+"""
+Rate limiting (token bucket) și load shedding pentru endpoint-urile publice de autentificare.
+
+Limitele se aplică atât pe IP-ul clientului, cât și pe email. Backend-ul implicit este în memorie
+(per worker); pentru setup-uri cu mai mulți workeri se poate folosi un backend partajat
+(ex: RATE_LIMIT_BACKEND=redis://localhost:6379/0, necesită pachetul `redis`).
+"""
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+LOAD_SHEDDING_ENABLED = os.getenv("LOAD_SHEDDING_ENABLED", "true").lower() == "true"
+# Dacă serverul rulează în spatele unui reverse proxy, IP-ul real vine din X-Forwarded-For
+TRUST_PROXY_HEADERS = os.getenv("TRUST_PROXY_HEADERS", "false").lower() == "true"
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """O regulă de tip token bucket: `capacity` cereri, reîncărcate complet în `period_seconds`."""
+    capacity: int
+    period_seconds: float
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.capacity / self.period_seconds
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimitRule":
+        """Parsează o regulă în formatul "<cereri>/<secunde>" (ex: "30/60")."""
+        count, seconds = value.split("/", 1)
+        return cls(capacity=int(count), period_seconds=float(seconds))
+
+
+def _rule(env_name: str, default: str) -> RateLimitRule:
+    return RateLimitRule.parse(os.getenv(env_name, default))
+
+
+# Reguli per endpoint: (limită per IP, limită per email)
+RATE_LIMIT_RULES: Dict[str, Tuple[RateLimitRule, RateLimitRule]] = {
+    "check-email": (
+        _rule("RATE_LIMIT_CHECK_EMAIL_IP", "60/60"),
+        _rule("RATE_LIMIT_CHECK_EMAIL_EMAIL", "20/60"),
+    ),
+    "send-verification-code": (
+        _rule("RATE_LIMIT_SEND_CODE_IP", "10/60"),
+        _rule("RATE_LIMIT_SEND_CODE_EMAIL", "3/600"),
+    ),
+    "verify-code": (
+        _rule("RATE_LIMIT_VERIFY_CODE_IP", "20/60"),
+        _rule("RATE_LIMIT_VERIFY_CODE_EMAIL", "10/600"),
+    ),
+    "login": (
+        _rule("RATE_LIMIT_LOGIN_IP", "30/60"),
+        _rule("RATE_LIMIT_LOGIN_EMAIL", "10/60"),
+    ),
+}
+
+
+class RateLimitBackend(ABC):
+    """Interfață pentru stocarea stării token bucket-urilor."""
+
+    @abstractmethod
+    def consume(self, key: str, rule: RateLimitRule, cost: float = 1.0) -> Tuple[bool, float]:
+        """
+        Consumă `cost` tokeni din bucket-ul `key`.
+
+        Returns:
+            (allowed, retry_after_seconds)
+        """
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Backend în memorie (per proces), potrivit pentru un singur worker."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # key -> (tokens, updated_at)
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, rule: RateLimitRule, cost: float = 1.0) -> Tuple[bool, float]:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (float(rule.capacity), now))
+            tokens = min(float(rule.capacity), tokens + (now - updated_at) * rule.refill_per_second)
+            if tokens >= cost:
+                self._buckets[key] = (tokens - cost, now)
+                allowed, retry_after = True, 0.0
+            else:
+                self._buckets[key] = (tokens, now)
+                allowed, retry_after = False, (cost - tokens) / rule.refill_per_second
+            if len(self._buckets) > self.max_keys:
+                self._prune(now)
+        return allowed, retry_after
+
+    def _prune(self, now: float) -> None:
+        """Elimină bucket-urile inactive de cel puțin o oră (sunt oricum pline)."""
+        stale = [key for key, (_, updated_at) in self._buckets.items() if now - updated_at > 3600]
+        for key in stale:
+            del self._buckets[key]
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Backend partajat prin Redis; token bucket-ul este actualizat atomic printr-un script Lua."""
+
+    _SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local data = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(data[1]) or capacity
+local ts = tonumber(data[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(retry_after)}
+"""
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "RATE_LIMIT_BACKEND folosește Redis, dar pachetul `redis` nu este instalat (pip install redis)"
+            ) from e
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(self._SCRIPT)
+
+    def consume(self, key: str, rule: RateLimitRule, cost: float = 1.0) -> Tuple[bool, float]:
+        allowed, retry_after = self._script(
+            keys=[self.prefix + key],
+            args=[rule.capacity, rule.refill_per_second, time.time(), cost],
+        )
+        return bool(int(allowed)), float(retry_after)
+
+
+def create_rate_limit_backend(spec: str = RATE_LIMIT_BACKEND) -> RateLimitBackend:
+    """Creează backend-ul din configurare: "memory" sau un URL redis://."""
+    if spec.startswith(("redis://", "rediss://", "unix://")):
+        return RedisRateLimitBackend(spec)
+    return InMemoryRateLimitBackend()
+
+
+_backend: Optional[RateLimitBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """Returnează backend-ul configurat (creat la prima utilizare)."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = create_rate_limit_backend()
+    return _backend
+
+
+def set_rate_limit_backend(backend: RateLimitBackend) -> None:
+    """Înlocuiește backend-ul (ex: pentru un backend partajat personalizat)."""
+    global _backend
+    _backend = backend
+
+
+def get_client_ip(request: Request) -> str:
+    """IP-ul clientului; X-Forwarded-For este folosit doar dacă TRUST_PROXY_HEADERS=true."""
+    if TRUST_PROXY_HEADERS:
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            return forwarded_for.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def _too_many_requests(retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Prea multe cereri. Te rugăm să încerci din nou mai târziu.",
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+def enforce_rate_limit(request: Request, endpoint: str, email: str | None = None) -> None:
+    """
+    Aplică limitele pentru un endpoint, pe IP și (opțional) pe email.
+
+    Raises:
+        HTTPException 429 cu header Retry-After dacă una dintre limite este depășită
+    """
+    if not RATE_LIMIT_ENABLED:
+        return
+
+    ip_rule, email_rule = RATE_LIMIT_RULES[endpoint]
+    backend = get_rate_limit_backend()
+
+    allowed, retry_after = backend.consume(f"{endpoint}:ip:{get_client_ip(request)}", ip_rule)
+    if not allowed:
+        raise _too_many_requests(retry_after)
+
+    if email:
+        allowed, retry_after = backend.consume(f"{endpoint}:email:{email.lower()}", email_rule)
+        if not allowed:
+            raise _too_many_requests(retry_after)
+
+
+def shed_load_if(saturated: bool, detail: str, retry_after: int = 5) -> None:
+    """
+    Respinge cererea imediat (503) când o resursă costisitoare este saturată,
+    înainte de a face orice muncă în baza de date.
+    """
+    if LOAD_SHEDDING_ENABLED and saturated:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -0,0 +1,68 @@
+"""
+Rutarea citirilor către replica de citire (DATABASE_READ_URL), cu read-your-writes.
+
+Replica poate rămâne în urmă față de primar, iar cache-urile din memorie (răspunsurile
+orarului, indexul de suprapuneri) sunt per worker și preiau scrierile celorlalți workeri
+abia după TTL. Pentru ca un admin să-și vadă imediat modificările, după fiecare scriere
+reușită răspunsul primește header-ul X-Read-Primary-Until (timestamp Unix); clientul îl
+retrimite, iar până la acel moment citirile lui merg pe primar și ocolesc cache-urile
+(nici nu le citesc, nici nu le populează). În plus, cu replică, worker-ul care a făcut
+scrierea citește de pe primar câteva secunde, ca să nu pună în cache date vechi de pe replică.
+"""
+import os
+import time
+
+from fastapi import Request
+
+from core.database import engine, read_engine
+
+READ_PRIMARY_HEADER = "X-Read-Primary-Until"
+# Întârzierea maximă acceptată a replicii față de primar
+READ_PRIMARY_STICKY_SECONDS = float(os.getenv("READ_PRIMARY_STICKY_SECONDS", "5"))
+# Cât timp după o scriere clientul ocolește cache-urile workerilor; trebuie să acopere
+# RESPONSE_CACHE_TTL_SECONDS și SCHEDULE_CONFLICT_INDEX_TTL_SECONDS
+READ_YOUR_WRITES_SECONDS = max(
+    float(os.getenv("READ_YOUR_WRITES_SECONDS", "30")),
+    READ_PRIMARY_STICKY_SECONDS,
+)
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+READ_REPLICA_ENABLED = read_engine is not engine
+
+_primary_reads_until = 0.0
+
+
+def record_write() -> float:
+    """Marchează o scriere în acest worker; întoarce momentul până la care citirile clientului merg pe primar."""
+    global _primary_reads_until
+    now = time.time()
+    if READ_REPLICA_ENABLED:
+        _primary_reads_until = max(_primary_reads_until, now + READ_PRIMARY_STICKY_SECONDS)
+    return now + READ_YOUR_WRITES_SECONDS
+
+
+def should_read_primary(request: Request) -> bool:
+    """
+    True dacă cererea (sau worker-ul) se află în fereastra de după o scriere: citirea se face
+    de pe primar, fără cache-urile locale.
+    """
+    now = time.time()
+    if now < _primary_reads_until:
+        return True
+    value = request.headers.get(READ_PRIMARY_HEADER)
+    if not value:
+        return False
+    try:
+        until = float(value)
+    except ValueError:
+        return False
+    # Valorile din viitorul îndepărtat sunt ignorate (clientul nu poate fixa citirile pe primar)
+    return now < until <= now + READ_YOUR_WRITES_SECONDS + 1
+
+
+async def read_your_writes_middleware(request: Request, call_next):
+    """Adaugă X-Read-Primary-Until la răspunsurile scrierilor reușite."""
+    response = await call_next(request)
+    if request.method in WRITE_METHODS and response.status_code < 400:
+        response.headers[READ_PRIMARY_HEADER] = f"{record_write():.3f}"
+    return response
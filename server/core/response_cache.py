@@ -0,0 +1,173 @@
+"""
+Cache în memorie pentru răspunsurile JSON ale citirilor frecvente (orar), cu ETag.
+
+Fiecare răspuns este serializat o singură dată și păstrat ca bytes împreună cu ETag-ul
+(hash-ul conținutului). O cerere cu If-None-Match egal cu ETag-ul curent primește 304 fără
+corp; clienții (inclusiv cache-ul HTTP al browserului, datorită `Cache-Control: no-cache`)
+revalidează astfel fără să descarce din nou orarul.
+
+Variantele comprimate (br/gzip, core/compression.py) se calculează la prima cerere care le
+acceptă și se păstrează lângă corp: compresia se face o dată per versiune a datelor, nu la
+fiecare request. Fiecare variantă are propriul ETag (ETag-ul corpului + codificarea).
+
+Scrierile invalidează un spațiu de nume întreg (ex: "schedule"). Fiecare worker are propriul
+cache, deci intrările expiră după RESPONSE_CACHE_TTL_SECONDS pentru a prelua scrierile
+celorlalți workeri; ETag-ul depinde doar de conținut, deci este același în toți workerii.
+Cererile din fereastra read-your-writes (core/read_routing.py) ocolesc cache-ul: corpul este
+construit de pe primar și nu este păstrat, așa că intrările vin mereu din aceeași sursă ca
+cererile obișnuite (replica, dacă este configurată).
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from core.compression import COMPRESSION_MIN_SIZE, compress, negotiate_encoding
+from core.read_routing import should_read_primary
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "30"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+
+SCHEDULE_NAMESPACE = "schedule"
+CALENDAR_NAMESPACE = "calendar"
+
+# Spațiile de nume construite din datele altui spațiu, invalidate odată cu el
+NAMESPACE_DEPENDENTS: Dict[str, Tuple[str, ...]] = {
+    SCHEDULE_NAMESPACE: (CALENDAR_NAMESPACE,),
+}
+
+
+class CachedBody:
+    """Un răspuns serializat: corpul, ETag-ul lui și variantele comprimate deja calculate."""
+
+    __slots__ = ("body", "etag", "created_at", "encoded")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        self.created_at = time.monotonic()
+        self.encoded: Dict[str, bytes] = {}
+
+    def etag_for(self, encoding: str | None) -> str:
+        """ETag-ul variantei (fiecare codificare este o reprezentare diferită)."""
+        return self.etag if encoding is None else f'{self.etag[:-1]}-{encoding}"'
+
+    def body_for(self, encoding: str | None) -> bytes:
+        """Corpul în codificarea dată (None = necomprimat), comprimat o singură dată."""
+        if encoding is None:
+            return self.body
+        body = self.encoded.get(encoding)
+        if body is None:
+            # Două cereri simultane pot comprima de două ori; rezultatul este identic
+            body = self.encoded[encoding] = compress(self.body, encoding)
+        return body
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Acceptă și variantele slabe (W/"...") trimise de proxy-uri
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+class ResponseCache:
+    """Cache LRU pe spații de nume, invalidat la scrieri și reîmprospătat după TTL."""
+
+    def __init__(self, ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], CachedBody]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, namespace: str, key: Hashable, build: Callable[[], bytes]) -> CachedBody:
+        """Întoarce corpul din cache sau îl construiește (build() -> bytes)."""
+        cache_key = (namespace, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and time.monotonic() - entry.created_at < self.ttl_seconds:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry
+            generation = self._generations.get(namespace, 0)
+
+        entry = CachedBody(build())
+        with self._lock:
+            self.misses += 1
+            # O scriere făcută în timpul construirii face rezultatul nesigur: nu se păstrează
+            if RESPONSE_CACHE_ENABLED and self._generations.get(namespace, 0) == generation:
+                self._entries[cache_key] = entry
+                self._entries.move_to_end(cache_key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, namespace: str) -> None:
+        """Șterge toate intrările unui spațiu de nume și ale celor dependente (apelat după scrieri)."""
+        namespaces = {namespace, *NAMESPACE_DEPENDENTS.get(namespace, ())}
+        with self._lock:
+            for name in namespaces:
+                self._generations[name] = self._generations.get(name, 0) + 1
+            for cache_key in [cache_key for cache_key in self._entries if cache_key[0] in namespaces]:
+                del self._entries[cache_key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+response_cache = ResponseCache()
+
+
+def cached_response(
+    request: Request,
+    namespace: str,
+    key: Hashable,
+    build: Callable[[], bytes],
+    media_type: str,
+    cache_control: str = "no-cache",
+) -> Response:
+    """
+    Răspuns servit din cache, cu ETag. Întoarce 304 dacă clientul are deja versiunea curentă.
+    Excepțiile din build() (ex: HTTPException 404) se propagă și nu sunt puse în cache.
+    După o scriere (read-your-writes), corpul este construit direct, fără cache.
+    """
+    if should_read_primary(request):
+        entry = CachedBody(build())
+    else:
+        entry = response_cache.get_or_build(namespace, key, build)
+    encoding = None
+    headers = {"Cache-Control": cache_control}
+    if len(entry.body) >= COMPRESSION_MIN_SIZE:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        headers["Vary"] = "Accept-Encoding"
+    headers["ETag"] = entry.etag_for(encoding)
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=entry.body_for(encoding), media_type=media_type, headers=headers)
+
+
+def cached_json_response(
+    request: Request,
+    namespace: str,
+    key: Hashable,
+    build: Callable[[], Any],
+) -> Response:
+    """Ca cached_response, pentru date serializabile JSON (build() -> listă/dict/modele)."""
+    def build_body() -> bytes:
+        return json.dumps(jsonable_encoder(build()), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    return cached_response(request, namespace, key, build_body, "application/json")
@@ -0,0 +1,418 @@
+"""
+Detectarea suprapunerilor în orar (sală sau profesor ocupat de două ori în același interval).
+
+Indexul ține în memorie, pentru fiecare domeniu (semestru, peste toți anii și toate tipurile
+de ciclu: o sală sau un profesor este aceeași resursă pentru F și FR), ocuparea sloturilor sală×zi×oră×paritate și profesor×zi×oră×paritate. Verificarea unei
+modificări înseamnă câteva căutări în dicționar (O(1)), iar raportul pentru un semestru
+întreg parcurge doar celulele ocupate. Tot aici se țin bitmap-urile de ocupare per slot
+folosite de căutarea sălilor și profesorilor liberi (core/availability.py).
+
+Reguli:
+- Fără alternanță, câmpurile principale ocupă ambele săptămâni (pară și impară); cu
+  alternanță, câmpurile principale ocupă săptămâna pară, iar odd_week_* pe cea impară.
+- Mai multe grupe cu aceeași disciplină, profesor și sală în același slot formează un curs
+  comun (serie), nu o suprapunere.
+- Orele anulate (status "canceled") nu ocupă sloturi.
+
+Fiecare worker are propriul index: este actualizat la scrierile făcute de worker și
+reconstruit din baza de date după SCHEDULE_CONFLICT_INDEX_TTL_SECONDS, pentru a prelua
+scrierile celorlalți workeri. Cu fresh=True (cererile din fereastra read-your-writes, vezi
+core/read_routing.py) se construiește un index temporar din sesiunea primită, fără a-l păstra.
+Indexul păstrat se construiește doar din sesiuni pe primar (rutele folosesc get_db).
+"""
+import os
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models.schedule import Schedule, SessionStatus
+
+# "off" - fără verificare, "warn" - doar raportează, "reject" - respinge scrierile cu 409
+SCHEDULE_CONFLICT_MODE = os.getenv("SCHEDULE_CONFLICT_MODE", "warn").lower()
+SCHEDULE_CONFLICT_INDEX_TTL_SECONDS = float(os.getenv("SCHEDULE_CONFLICT_INDEX_TTL_SECONDS", "30"))
+
+PARITY_EVEN = "even"
+PARITY_ODD = "odd"
+RESOURCE_ROOM = "room"
+RESOURCE_PROFESSOR = "professor"
+
+Domain = Optional[str]  # semester
+Cell = Tuple[str, int, str, str, str]  # (tip resursă, id resursă, zi normalizată, începutul intervalului, paritate)
+SlotKey = Tuple[str, str, str, str]  # (tip resursă, zi normalizată, începutul intervalului, paritate)
+SessionKey = Tuple[int, int, int]  # (subject_id, professor_id, room_id)
+
+# Denumirile zilelor în rapoarte, după forma normalizată (normalize_day)
+DAY_LABELS = {
+    "luni": "Luni",
+    "marti": "Marți",
+    "miercuri": "Miercuri",
+    "joi": "Joi",
+    "vineri": "Vineri",
+    "sambata": "Sâmbătă",
+    "duminica": "Duminică",
+}
+
+# Coloanele necesare indexului (fără relații ORM)
+_INDEX_COLUMNS = (
+    Schedule.id,
+    Schedule.subject_id,
+    Schedule.professor_id,
+    Schedule.room_id,
+    Schedule.day,
+    Schedule.hour,
+    Schedule.status,
+    Schedule.odd_week_subject_id,
+    Schedule.odd_week_professor_id,
+    Schedule.odd_week_room_id,
+    Schedule.academic_year,
+    Schedule.semester,
+    Schedule.cycle_type,
+)
+
+
+@dataclass
+class SlotConflict:
+    """O resursă ocupată de mai multe ore diferite în același slot."""
+    resource_type: str
+    resource_id: int
+    day: str
+    hour: str
+    parity: str
+    schedule_ids: List[int] = field(default_factory=list)
+
+
+def normalize_day(day: str) -> str:
+    """Ziua fără majuscule și diacritice ("Marți", "marti " -> "marti")."""
+    text = unicodedata.normalize("NFKD", (day or "").strip().lower())
+    return "".join(char for char in text if not unicodedata.combining(char))
+
+
+def slot_start(hour: str) -> str:
+    """Începutul intervalului orar normalizat ("08:00-09:30", "8.00" -> "8.00")."""
+    start = (hour or "").replace("–", "-").split("-")[0].strip().replace(":", ".")
+    return start.lstrip("0") or start
+
+
+def schedule_domain(schedule) -> Domain:
+    """Domeniul în care se caută suprapuneri pentru o oră de curs."""
+    return schedule.semester
+
+
+def _status_value(status) -> str | None:
+    return getattr(status, "value", status)
+
+
+def schedule_bookings(schedule) -> List[Tuple[Cell, SessionKey]]:
+    """
+    Sloturile ocupate de o oră de curs (obiect ORM, rând sau orice obiect cu aceleași atribute).
+    Întoarce o listă goală pentru orele anulate. Ziua și ora sunt normalizate (normalize_day,
+    slot_start), ca "Marți 8.00-9.30" și "Marti 08:00-09:30" să fie același slot, ca în
+    bitmap-urile de ocupare.
+    """
+    if _status_value(schedule.status) == SessionStatus.CANCELED.value:
+        return []
+
+    day = normalize_day(schedule.day)
+    hour = slot_start(schedule.hour)
+    main_session = (schedule.subject_id, schedule.professor_id, schedule.room_id)
+    has_alternate = schedule.odd_week_subject_id is not None and schedule.odd_week_professor_id is not None
+
+    weeks = [(PARITY_EVEN, main_session)]
+    if has_alternate:
+        odd_room_id = schedule.odd_week_room_id if schedule.odd_week_room_id is not None else schedule.room_id
+        weeks.append((PARITY_ODD, (schedule.odd_week_subject_id, schedule.odd_week_professor_id, odd_room_id)))
+    else:
+        weeks.append((PARITY_ODD, main_session))
+
+    bookings = []
+    for parity, session in weeks:
+        _, professor_id, room_id = session
+        bookings.append(((RESOURCE_ROOM, room_id, day, hour, parity), session))
+        bookings.append(((RESOURCE_PROFESSOR, professor_id, day, hour, parity), session))
+    return bookings
+
+
+class SlotIndex:
+    """Ocuparea sloturilor dintr-un singur domeniu."""
+
+    def __init__(self):
+        # celulă -> sesiune -> ID-urile orelor care o compun (ex: grupele unei serii)
+        self.cells: Dict[Cell, Dict[SessionKey, Set[int]]] = defaultdict(lambda: defaultdict(set))
+        self.bookings_by_schedule: Dict[int, List[Tuple[Cell, SessionKey]]] = {}
+        self.academic_years: Dict[int, int | None] = {}
+        self.cycle_types: Dict[int, str | None] = {}
+        # Bitmap de ocupare per slot: bitul `id` este setat dacă resursa `id` este ocupată
+        self.occupancy: Dict[SlotKey, int] = defaultdict(int)
+        self._occupied_cells: Dict[Tuple[SlotKey, int], int] = defaultdict(int)
+
+    @staticmethod
+    def _slot_key(cell: Cell) -> Tuple[SlotKey, int]:
+        resource_type, resource_id, day, hour, parity = cell
+        return (resource_type, day, hour, parity), resource_id
+
+    def occupied_mask(self, resource_type: str, day: str, hour: str, parity: str) -> int:
+        """Bitmap-ul resurselor de tipul dat ocupate în slot."""
+        return self.occupancy.get((resource_type, normalize_day(day), slot_start(hour), parity), 0)
+
+    def add(
+        self,
+        schedule_id: int,
+        bookings: List[Tuple[Cell, SessionKey]],
+        academic_year: int | None = None,
+        cycle_type: str | None = None,
+    ):
+        self.remove(schedule_id)
+        if not bookings:
+            return
+        for cell, session in bookings:
+            sessions = self.cells[cell]
+            if not sessions:
+                self._mark_occupied(cell, 1)
+            sessions[session].add(schedule_id)
+        self.bookings_by_schedule[schedule_id] = bookings
+        self.academic_years[schedule_id] = academic_year
+        self.cycle_types[schedule_id] = cycle_type
+
+    def remove(self, schedule_id: int):
+        bookings = self.bookings_by_schedule.pop(schedule_id, None)
+        self.academic_years.pop(schedule_id, None)
+        self.cycle_types.pop(schedule_id, None)
+        if not bookings:
+            return
+        for cell, session in bookings:
+            sessions = self.cells.get(cell)
+            if sessions is None:
+                continue
+            ids = sessions.get(session)
+            if ids is not None:
+                ids.discard(schedule_id)
+                if not ids:
+                    del sessions[session]
+            if not sessions:
+                del self.cells[cell]
+                self._mark_occupied(cell, -1)
+
+    def _mark_occupied(self, cell: Cell, delta: int):
+        """Actualizează bitmap-ul când o celulă devine ocupată (+1) sau liberă (-1)."""
+        slot_key, resource_id = self._slot_key(cell)
+        count_key = (slot_key, resource_id)
+        count = self._occupied_cells[count_key] + delta
+        if count > 0:
+            self._occupied_cells[count_key] = count
+            self.occupancy[slot_key] |= 1 << resource_id
+        else:
+            self._occupied_cells.pop(count_key, None)
+            mask = self.occupancy.get(slot_key, 0) & ~(1 << resource_id)
+            if mask:
+                self.occupancy[slot_key] = mask
+            else:
+                self.occupancy.pop(slot_key, None)
+
+    def conflicts_for(self, bookings: List[Tuple[Cell, SessionKey]], schedule_id: int | None = None) -> List[SlotConflict]:
+        """Suprapunerile pe care le-ar produce sloturile date (ignorând ora `schedule_id` însăși)."""
+        conflicts = []
+        for cell, session in bookings:
+            sessions = self.cells.get(cell)
+            if not sessions:
+                continue
+            other_ids = sorted(
+                other_id
+                for other_session, ids in sessions.items()
+                if other_session != session
+                for other_id in ids
+                if other_id != schedule_id
+            )
+            if other_ids:
+                resource_type, resource_id, day, hour, parity = cell
+                own_ids = [schedule_id] if schedule_id is not None else []
+                conflicts.append(
+                    SlotConflict(resource_type, resource_id, DAY_LABELS.get(day, day), hour, parity, own_ids + other_ids)
+                )
+        return conflicts
+
+    def all_conflicts(self, academic_year: int | None = None, cycle_type: str | None = None) -> List[SlotConflict]:
+        """
+        Toate celulele ocupate de mai multe sesiuni diferite (opțional, doar cele care implică
+        o oră din anul sau tipul de ciclu dat).
+        """
+        conflicts = []
+        for cell, sessions in self.cells.items():
+            if len(sessions) < 2:
+                continue
+            schedule_ids = sorted(schedule_id for ids in sessions.values() for schedule_id in ids)
+            if academic_year is not None and all(
+                self.academic_years.get(schedule_id) != academic_year for schedule_id in schedule_ids
+            ):
+                continue
+            if cycle_type is not None and all(
+                self.cycle_types.get(schedule_id) != cycle_type for schedule_id in schedule_ids
+            ):
+                continue
+            resource_type, resource_id, day, hour, parity = cell
+            conflicts.append(
+                SlotConflict(resource_type, resource_id, DAY_LABELS.get(day, day), hour, parity, schedule_ids)
+            )
+        conflicts.sort(key=lambda c: (c.day, c.hour, c.parity, c.resource_type, c.resource_id))
+        return conflicts
+
+
+class ScheduleConflictIndex:
+    """Indexurile pe domenii, construite leneș din baza de date și reîmprospătate după TTL."""
+
+    def __init__(self, ttl_seconds: float = SCHEDULE_CONFLICT_INDEX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._domains: Dict[Domain, Tuple[SlotIndex, float]] = {}
+        self._schedule_domains: Dict[int, Domain] = {}
+        # Momentul ultimei reconstruiri complete: până la expirare, domeniile lipsă sunt goale
+        self._all_built_at: float | None = None
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _load(db: Session, domains: Iterable[Domain] | None = None) -> Dict[Domain, SlotIndex]:
+        """Construiește indexurile domeniilor date (sau ale tuturor) cu o singură interogare pe coloane."""
+        query = select(*_INDEX_COLUMNS).where(Schedule.status != SessionStatus.CANCELED)
+        domain_list = list(domains) if domains is not None else None
+        if domain_list is not None and len(domain_list) == 1:
+            semester = domain_list[0]
+            query = query.where(Schedule.semester.is_(None) if semester is None else Schedule.semester == semester)
+
+        built: Dict[Domain, SlotIndex] = {domain: SlotIndex() for domain in (domain_list or [])}
+        for row in db.execute(query):
+            domain = schedule_domain(row)
+            if domain_list is not None and domain not in built:
+                continue
+            index = built.get(domain)
+            if index is None:
+                index = built[domain] = SlotIndex()
+            index.add(row.id, schedule_bookings(row), row.academic_year, row.cycle_type)
+        return built
+
+    def _build(self, db: Session, domains: Iterable[Domain] | None = None) -> None:
+        """Reconstruiește și păstrează domeniile date (sau toate)."""
+        domain_list = list(domains) if domains is not None else None
+        built = self._load(db, domain_list)
+        now = time.monotonic()
+        with self._lock:
+            if domain_list is None:
+                self._domains.clear()
+                self._schedule_domains.clear()
+                self._all_built_at = now
+            for domain, index in built.items():
+                for schedule_id, schedule_domain_key in list(self._schedule_domains.items()):
+                    if schedule_domain_key == domain:
+                        del self._schedule_domains[schedule_id]
+                self._domains[domain] = (index, now)
+                for schedule_id in index.bookings_by_schedule:
+                    self._schedule_domains[schedule_id] = domain
+
+    def _is_fresh(self, domain: Domain) -> bool:
+        entry = self._domains.get(domain)
+        return entry is not None and time.monotonic() - entry[1] < self.ttl_seconds
+
+    def _all_fresh(self) -> bool:
+        return self._all_built_at is not None and time.monotonic() - self._all_built_at < self.ttl_seconds
+
+    def _all_domain_indexes(self, db: Session, fresh: bool = False) -> Dict[Domain, SlotIndex]:
+        """Indexurile tuturor domeniilor (reconstruite complet dacă reconstruirea completă a expirat)."""
+        if fresh:
+            return self._load(db)
+        with self._lock:
+            if not self._all_fresh() or not all(self._is_fresh(domain) for domain in self._domains):
+                self._build(db)
+            return {domain: index for domain, (index, _) in self._domains.items()}
+
+    def _domain_index(self, db: Session, domain: Domain, fresh: bool = False) -> SlotIndex:
+        if fresh:
+            return self._load(db, [domain])[domain]
+        with self._lock:
+            if not self._is_fresh(domain):
+                self._build(db, [domain])
+            return self._domains[domain][0]
+
+    def check(self, db: Session, schedule, schedule_id: int | None = None, fresh: bool = False) -> List[SlotConflict]:
+        """Suprapunerile pe care le-ar produce ora dată (creată sau actualizată)."""
+        bookings = schedule_bookings(schedule)
+        if not bookings:
+            return []
+        with self._lock:
+            return self._domain_index(db, schedule_domain(schedule), fresh).conflicts_for(bookings, schedule_id)
+
+    def find_conflicts(
+        self,
+        db: Session,
+        semester: str | None = None,
+        cycle_type: str | None = None,
+        academic_year: int | None = None,
+        all_domains: bool = False,
+        fresh: bool = False,
+    ) -> List[SlotConflict]:
+        """
+        Toate suprapunerile dintr-un semestru (sau din toate, cu all_domains=True); cu
+        `cycle_type`, doar cele care implică o oră din acel tip de ciclu.
+        """
+        with self._lock:
+            if not all_domains:
+                return self._domain_index(db, semester, fresh).all_conflicts(academic_year, cycle_type)
+            conflicts = []
+            for index in self._all_domain_indexes(db, fresh).values():
+                conflicts.extend(index.all_conflicts(academic_year, cycle_type))
+            return conflicts
+
+    def occupied_mask(
+        self,
+        db: Session,
+        resource_type: str,
+        day: str,
+        hour: str,
+        parity: str | None,
+        semester: str,
+        fresh: bool = False,
+    ) -> int:
+        """
+        Bitmap-ul resurselor ocupate într-un slot al semestrului (în oricare tip de ciclu); cu
+        parity=None, resursele ocupate în cel puțin una dintre săptămâni (libere = libere în ambele).
+        """
+        with self._lock:
+            index = self._domain_index(db, semester, fresh)
+            parities = (parity,) if parity else (PARITY_EVEN, PARITY_ODD)
+            mask = 0
+            for week in parities:
+                mask |= index.occupied_mask(resource_type, day, hour, week)
+            return mask
+
+    def record(self, schedule) -> None:
+        """Actualizează indexul după o creare/actualizare (doar domeniile deja încărcate)."""
+        with self._lock:
+            self.forget(schedule.id)
+            domain = schedule_domain(schedule)
+            entry = self._domains.get(domain)
+            if entry is None:
+                if not self._all_fresh():
+                    return
+                # Domeniu nou după o reconstruire completă: altfel ar lipsi până la expirare
+                entry = self._domains[domain] = (SlotIndex(), time.monotonic())
+            entry[0].add(schedule.id, schedule_bookings(schedule), schedule.academic_year, schedule.cycle_type)
+            self._schedule_domains[schedule.id] = domain
+
+    def forget(self, schedule_id: int) -> None:
+        """Scoate o oră din index (după ștergere sau înainte de re-indexare)."""
+        with self._lock:
+            domain = self._schedule_domains.pop(schedule_id, None)
+            if domain is not None and domain in self._domains:
+                self._domains[domain][0].remove(schedule_id)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._domains.clear()
+            self._schedule_domains.clear()
+            self._all_built_at = None
+
+
+# Instanță globală a indexului de suprapuneri
+schedule_conflict_index = ScheduleConflictIndex()
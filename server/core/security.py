@@ -1,15 +1,64 @@
 """
 Module pentru securitate: hash-uri de parole, JWT tokens, etc.
 """
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any
+import logging
 import os
+import threading
 import jwt
-from passlib.context import CryptContext
 from passlib.exc import UnknownHashError
 
-# Configurare pentru hash-ul parolelor
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _password_context():
+    """Contextul de hash al parolelor, creat la primul login (passlib costă ~30 ms la import)."""
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["argon2"], deprecated="auto")
+
+
+def warm_up_password_hashing() -> None:
+    """Creează contextul de hash și încarcă backend-ul Argon2 (în fundal, după pornirea worker-ului)."""
+    _password_context().handler().get_backend()
+
+
+# Limitează numărul de operații Argon2 simultane (CPU și memorie intensive).
+# Cererile peste limită așteaptă; dacă și coada de așteptare e plină, login-ul este respins (load shedding).
+ARGON2_MAX_CONCURRENCY = int(os.getenv("ARGON2_MAX_CONCURRENCY", str(os.cpu_count() or 2)))
+ARGON2_MAX_WAITING = int(os.getenv("ARGON2_MAX_WAITING", str(ARGON2_MAX_CONCURRENCY * 4)))
+_argon2_slots = threading.BoundedSemaphore(ARGON2_MAX_CONCURRENCY)
+_argon2_lock = threading.Lock()
+_argon2_pending = 0  # operații Argon2 în curs + în așteptare
+
+
+@contextmanager
+def _argon2_slot():
+    """Ocupă un loc în pool-ul Argon2 pe durata unei operații de hash/verificare."""
+    global _argon2_pending
+    with _argon2_lock:
+        _argon2_pending += 1
+    try:
+        with _argon2_slots:
+            yield
+    finally:
+        with _argon2_lock:
+            _argon2_pending -= 1
+
+
+def argon2_pending_count() -> int:
+    """Numărul de operații Argon2 în curs sau în așteptare."""
+    return _argon2_pending
+
+
+def is_argon2_pool_saturated() -> bool:
+    """True dacă pool-ul Argon2 și coada sa de așteptare sunt pline."""
+    return _argon2_pending >= ARGON2_MAX_CONCURRENCY + ARGON2_MAX_WAITING
+
 
 # Configurare pentru JWT
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")  # Folosește variabilă de mediu sau default
@@ -19,7 +68,8 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 1440  # Token-ul expiră după 24 de ore (1440 min
 
 def get_password_hash(password: str) -> str:
     """Generează hash pentru o parolă."""
-    return pwd_context.hash(password)
+    with _argon2_slot():
+        return _password_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str | None) -> bool:
@@ -38,14 +88,15 @@ def verify_password(plain_password: str, hashed_password: str | None) -> bool:
     
     try:
         # Încearcă să verifice parola
-        return pwd_context.verify(plain_password, hashed_password)
+        with _argon2_slot():
+            return _password_context().verify(plain_password, hashed_password)
     except UnknownHashError:
         # Hash-ul nu poate fi identificat (format invalid sau corupt)
         # Nu afișăm mesajul pentru fiecare încercare de login (prea mult spam)
         return False
     except Exception as e:
         # Altă eroare la verificare
-        print(f"⚠️ Eroare la verificarea parolei: {str(e)}")
+        logger.warning("Eroare la verificarea parolei: %s", e)
         return False
 
 
@@ -0,0 +1,584 @@
+"""
+Solver pentru completarea automată a orarului.
+
+Primește disciplinele de programat (grupe, profesor, tip, număr de ore pe săptămână, paritate)
+și propune pentru fiecare oră o zi, un interval și o sală, ținând cont de orarul existent din
+același domeniu (semestru + tip de ciclu), de capacitatea sălilor și de indisponibilitatea
+profesorilor. Rezultatul este o ciornă (ScheduleCreate) pe care adminul o poate aplica din grilă.
+
+Costul minimizat (ponderi în ordinea importanței):
+- suprapuneri de sală, profesor sau grupă (practic interzise);
+- ferestre în ziua grupelor, aceeași disciplină de mai multe ori pe zi, ferestre la profesori;
+- ore doar pe o paritate rămase fără pereche în slot (nu pot fi scrise ca alternanță).
+
+Căutarea: plasare greedy (cele mai constrânse ore întâi), apoi simulated annealing cu cost
+incremental (se recalculează doar celulele atinse de mutare). Fiecare proces rulează cu alt
+seed până la limita de timp, iar rezultatul cel mai bun câștigă; procesele sunt ținute într-un
+pool persistent (SOLVER_WORKERS), iar un singur calcul rulează la un moment dat per worker HTTP.
+"""
+import logging
+import math
+import multiprocessing
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.schedule_conflicts import PARITY_EVEN, RESOURCE_ROOM, normalize_day, schedule_bookings, slot_start
+from models.group import Group
+from models.professor import Professor
+from models.room import Room
+from models.schedule import Schedule, SessionStatus
+from models.subject import Subject
+from schemas.schedules import ScheduleCreate, ScheduleSolveRequest
+
+logger = logging.getLogger(__name__)
+
+SOLVER_DAYS = [day.strip() for day in os.getenv("SOLVER_DAYS", "Luni,Marți,Miercuri,Joi,Vineri").split(",") if day.strip()]
+SOLVER_HOURS = [hour.strip() for hour in os.getenv(
+    "SOLVER_HOURS", "8.00-9.30,9.45-11.15,11.30-13.00,13.30-15.00,15.15-16.45,17.00-18.30,18.45-20.15"
+).split(",") if hour.strip()]
+SOLVER_TIME_LIMIT_SECONDS = float(os.getenv("SOLVER_TIME_LIMIT_SECONDS", "10"))
+SOLVER_MAX_TIME_LIMIT_SECONDS = float(os.getenv("SOLVER_MAX_TIME_LIMIT_SECONDS", "60"))
+SOLVER_WORKERS = max(1, int(os.getenv("SOLVER_WORKERS", str(min(4, os.cpu_count() or 1)))))
+
+W_CONFLICT = 1000
+W_GROUP_GAP = 10
+W_SAME_DAY = 5
+W_PROFESSOR_GAP = 2
+W_UNPAIRED = 1
+
+ROOM, PROFESSOR, GROUP = 0, 1, 2
+EVEN, ODD = 0, 1
+PARITIES = {"both": (EVEN, ODD), "even": (EVEN,), "odd": (ODD,)}
+
+OccupancyKey = Tuple[int, int, int, int]  # (tip resursă, id, slot, paritate)
+DailyKey = Tuple[int, int, int, int]  # (tip resursă, id, zi, paritate)
+
+
+@dataclass(frozen=True)
+class SessionUnit:
+    """O oră de plasat (o apariție săptămânală a unei discipline)."""
+    requirement: int  # Indexul cerinței din request
+    group_ids: Tuple[int, ...]
+    professor_id: int
+    parities: Tuple[int, ...]
+    rooms: Tuple[int, ...]  # Sălile permise, crescător după capacitate
+
+
+@dataclass
+class TimetableProblem:
+    days: List[str]
+    hours: List[str]
+    units: List[SessionUnit]
+    occupied: Dict[OccupancyKey, int] = field(default_factory=dict)  # Ocuparea existentă (număr de sesiuni)
+
+    @property
+    def slot_count(self) -> int:
+        return len(self.days) * len(self.hours)
+
+
+@dataclass
+class TimetableSolution:
+    slots: List[int]
+    rooms: List[int]
+    cost: int
+    breakdown: Dict[str, int]
+    iterations: int
+    workers: int = 1
+    elapsed_seconds: float = 0.0
+
+
+def _gaps(hour_counts: List[int]) -> int:
+    """Intervalele libere dintre prima și ultima oră ocupată dintr-o zi."""
+    first = last = -1
+    occupied = 0
+    for position, count in enumerate(hour_counts):
+        if count:
+            if first < 0:
+                first = position
+            last = position
+            occupied += 1
+    return 0 if first < 0 else last - first + 1 - occupied
+
+
+class _TimetableState:
+    """Asignarea curentă și structurile pentru costul incremental."""
+
+    def __init__(self, problem: TimetableProblem, rng: random.Random):
+        self.problem = problem
+        self.rng = rng
+        self.hours = len(problem.hours)
+        self.counts: Dict[OccupancyKey, int] = defaultdict(int, problem.occupied)
+        self.same_day: Dict[Tuple[int, int], int] = defaultdict(int)
+        self.slots = [-1] * len(problem.units)
+        self.rooms = [-1] * len(problem.units)
+
+        # Ferestrele se urmăresc doar pentru grupele și profesorii implicați
+        tracked = {
+            GROUP: {group_id for unit in problem.units for group_id in unit.group_ids},
+            PROFESSOR: {unit.professor_id for unit in problem.units},
+        }
+        self.daily: Dict[DailyKey, List[int]] = {}
+        for resource_type, ids in tracked.items():
+            for resource_id in ids:
+                for day in range(len(problem.days)):
+                    for parity in (EVEN, ODD):
+                        self.daily[(resource_type, resource_id, day, parity)] = [0] * self.hours
+        for (resource_type, resource_id, slot, parity), count in problem.occupied.items():
+            hour_counts = self.daily.get((resource_type, resource_id, slot // self.hours, parity))
+            if hour_counts is not None:
+                hour_counts[slot % self.hours] += count
+
+        self.units_by_group: Dict[int, List[int]] = defaultdict(list)
+        for position, unit in enumerate(problem.units):
+            for group_id in unit.group_ids:
+                self.units_by_group[group_id].append(position)
+
+    # --- chei și cost ---
+
+    def _keys(self, position: int, slot: int, room: int, occupancy: Set, daily: Set, halves: Set, same_day: Set):
+        unit = self.problem.units[position]
+        day = slot // self.hours
+        for parity in unit.parities:
+            occupancy.add((ROOM, room, slot, parity))
+            occupancy.add((PROFESSOR, unit.professor_id, slot, parity))
+            daily.add((PROFESSOR, unit.professor_id, day, parity))
+            for group_id in unit.group_ids:
+                occupancy.add((GROUP, group_id, slot, parity))
+                daily.add((GROUP, group_id, day, parity))
+        for group_id in unit.group_ids:
+            halves.add((group_id, slot))
+        same_day.add((unit.requirement, day))
+
+    def _cost(self, occupancy: Set, daily: Set, halves: Set, same_day: Set) -> int:
+        counts = self.counts
+        cost = 0
+        for key in occupancy:
+            count = counts.get(key, 0)
+            if count > 1:
+                cost += W_CONFLICT * (count - 1)
+        for key in daily:
+            gaps = _gaps(self.daily[key])
+            if gaps:
+                cost += (W_GROUP_GAP if key[0] == GROUP else W_PROFESSOR_GAP) * gaps
+        for group_id, slot in halves:
+            if (counts.get((GROUP, group_id, slot, EVEN), 0) > 0) != (counts.get((GROUP, group_id, slot, ODD), 0) > 0):
+                cost += W_UNPAIRED
+        for key in same_day:
+            count = self.same_day.get(key, 0)
+            if count > 1:
+                cost += W_SAME_DAY * (count - 1)
+        return cost
+
+    def _place(self, position: int, slot: int, room: int, sign: int):
+        unit = self.problem.units[position]
+        day, hour = divmod(slot, self.hours)
+        counts = self.counts
+        for parity in unit.parities:
+            counts[(ROOM, room, slot, parity)] += sign
+            counts[(PROFESSOR, unit.professor_id, slot, parity)] += sign
+            self.daily[(PROFESSOR, unit.professor_id, day, parity)][hour] += sign
+            for group_id in unit.group_ids:
+                counts[(GROUP, group_id, slot, parity)] += sign
+                self.daily[(GROUP, group_id, day, parity)][hour] += sign
+        self.same_day[(unit.requirement, day)] += sign
+        if sign > 0:
+            self.slots[position], self.rooms[position] = slot, room
+        else:
+            self.slots[position] = self.rooms[position] = -1
+
+    def move_delta(self, moves: Sequence[Tuple[int, int, int]]) -> Tuple[int, List[Tuple[int, int, int]]]:
+        """
+        Aplică mutările (poziție, slot nou, sală nouă) și întoarce diferența de cost și
+        asignarea veche (pentru revert).
+        """
+        keys = (set(), set(), set(), set())
+        previous = [(position, self.slots[position], self.rooms[position]) for position, _, _ in moves]
+        for position, slot, room in previous:
+            if slot >= 0:
+                self._keys(position, slot, room, *keys)
+        for position, slot, room in moves:
+            self._keys(position, slot, room, *keys)
+        before = self._cost(*keys)
+        for position, slot, room in previous:
+            if slot >= 0:
+                self._place(position, slot, room, -1)
+        for position, slot, room in moves:
+            self._place(position, slot, room, 1)
+        return self._cost(*keys) - before, previous
+
+    def revert(self, moves: Sequence[Tuple[int, int, int]], previous: List[Tuple[int, int, int]]):
+        for position, _, _ in moves:
+            self._place(position, self.slots[position], self.rooms[position], -1)
+        for position, slot, room in previous:
+            if slot >= 0:
+                self._place(position, slot, room, 1)
+
+    def free_room(self, position: int, slot: int) -> int:
+        """Cea mai mică sală permisă liberă în slot (în toate paritățile orei), altfel una aleatoare."""
+        unit = self.problem.units[position]
+        for room in unit.rooms:
+            if self.slots[position] == slot and self.rooms[position] == room:
+                return room
+            if all(self.counts.get((ROOM, room, slot, parity), 0) == 0 for parity in unit.parities):
+                return room
+        return self.rng.choice(unit.rooms)
+
+    def breakdown(self) -> Dict[str, int]:
+        """Componentele costului pentru asignarea curentă."""
+        occupancy, daily, halves, same_day = set(), set(), set(), set()
+        for position, slot in enumerate(self.slots):
+            self._keys(position, slot, self.rooms[position], occupancy, daily, halves, same_day)
+        daily = set(self.daily)
+        return {
+            "conflicts": sum(self.counts.get(key, 0) - 1 for key in occupancy if self.counts.get(key, 0) > 1),
+            "group_gaps": sum(_gaps(self.daily[key]) for key in daily if key[0] == GROUP),
+            "professor_gaps": sum(_gaps(self.daily[key]) for key in daily if key[0] == PROFESSOR),
+            "same_day_repeats": sum(self.same_day[key] - 1 for key in same_day if self.same_day[key] > 1),
+            "unpaired": sum(
+                1 for group_id, slot in halves
+                if (self.counts.get((GROUP, group_id, slot, EVEN), 0) > 0)
+                != (self.counts.get((GROUP, group_id, slot, ODD), 0) > 0)
+            ),
+            "cost": self._cost(occupancy, daily, halves, same_day),
+        }
+
+    # --- căutare ---
+
+    def greedy(self):
+        """Plasează orele una câte una în slotul cu cel mai mic cost, cele mai constrânse întâi."""
+        units = self.problem.units
+        load = defaultdict(int)
+        for unit in units:
+            load[unit.professor_id] += 1
+        order = sorted(
+            range(len(units)),
+            key=lambda position: (
+                len(units[position].rooms),
+                -len(units[position].group_ids),
+                -load[units[position].professor_id],
+                self.rng.random(),
+            ),
+        )
+        slots = list(range(self.problem.slot_count))
+        for position in order:
+            self.rng.shuffle(slots)
+            best = None
+            for slot in slots:
+                room = self.free_room(position, slot)
+                delta, previous = self.move_delta([(position, slot, room)])
+                self.revert([(position, slot, room)], previous)
+                if best is None or delta < best[0]:
+                    best = (delta, slot, room)
+            self.move_delta([(position, best[1], best[2])])
+
+    def random_move(self) -> List[Tuple[int, int, int]]:
+        units = self.problem.units
+        position = self.rng.randrange(len(units))
+        choice = self.rng.random()
+        if choice < 0.45:
+            slot = self.rng.randrange(self.problem.slot_count)
+            return [(position, slot, self.free_room(position, slot))]
+        if choice < 0.65:
+            return [(position, self.rng.randrange(self.problem.slot_count), self.rng.choice(units[position].rooms))]
+        if choice < 0.8:
+            return [(position, self.slots[position], self.rng.choice(units[position].rooms))]
+        # Schimbă între ele sloturile a două ore ale aceleiași grupe
+        candidates = self.units_by_group[self.rng.choice(units[position].group_ids)]
+        other = self.rng.choice(candidates)
+        if other == position or self.slots[other] == self.slots[position]:
+            slot = self.rng.randrange(self.problem.slot_count)
+            return [(position, slot, self.free_room(position, slot))]
+        return [
+            (position, self.slots[other], self.rooms[position]),
+            (other, self.slots[position], self.rooms[other]),
+        ]
+
+
+def _run_search(problem: TimetableProblem, seed: int, deadline: float) -> TimetableSolution:
+    """O căutare completă (greedy + simulated annealing) până la `deadline` (time.time())."""
+    rng = random.Random(seed)
+    state = _TimetableState(problem, rng)
+    started = time.time()
+    if not problem.units:
+        return TimetableSolution([], [], 0, state.breakdown(), 0)
+
+    state.greedy()
+    current = state.breakdown()["cost"]
+    best_cost, best_slots, best_rooms = current, list(state.slots), list(state.rooms)
+
+    temperature_start, temperature_end = 2.0 * W_GROUP_GAP, 0.05
+    search_started = time.time()
+    budget = max(deadline - search_started, 1e-6)
+    temperature = temperature_start
+    iterations = 0
+    while best_cost > 0:
+        if iterations & 255 == 0:
+            now = time.time()
+            if now >= deadline:
+                break
+            progress = (now - search_started) / budget
+            temperature = temperature_start * (temperature_end / temperature_start) ** progress
+        iterations += 1
+
+        moves = state.random_move()
+        delta, previous = state.move_delta(moves)
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            current += delta
+            if current < best_cost:
+                best_cost, best_slots, best_rooms = current, list(state.slots), list(state.rooms)
+        else:
+            state.revert(moves, previous)
+
+    # Reconstruiește cea mai bună asignare pentru componentele costului
+    for position in range(len(problem.units)):
+        state._place(position, state.slots[position], state.rooms[position], -1)
+    for position in range(len(problem.units)):
+        state._place(position, best_slots[position], best_rooms[position], 1)
+    breakdown = state.breakdown()
+    return TimetableSolution(
+        best_slots, best_rooms, breakdown.pop("cost"), breakdown, iterations,
+        elapsed_seconds=time.time() - started,
+    )
+
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_solve_lock = threading.Lock()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # "spawn": procesele nu moștenesc firele și conexiunile serverului
+            _executor = ProcessPoolExecutor(max_workers=SOLVER_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _executor
+
+
+def _reset_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def solve_timetable(
+    problem: TimetableProblem,
+    time_limit_seconds: float | None = None,
+    seed: int | None = None,
+    workers: int = SOLVER_WORKERS,
+) -> TimetableSolution:
+    """
+    Rulează `workers` căutări în paralel (câte una per proces, cu seed-uri diferite) și
+    întoarce soluția cu cel mai mic cost. Durata totală este limitată la `time_limit_seconds`.
+
+    Raises:
+        RuntimeError: Dacă un alt calcul rulează deja în acest worker
+    """
+    time_limit = min(time_limit_seconds or SOLVER_TIME_LIMIT_SECONDS, SOLVER_MAX_TIME_LIMIT_SECONDS)
+    seed = seed if seed is not None else random.randrange(1 << 30)
+    if not _solve_lock.acquire(blocking=False):
+        raise RuntimeError("Un alt calcul de orar este în curs")
+    try:
+        started = time.time()
+        deadline = started + time_limit
+        if workers <= 1 or not problem.units:
+            results = [_run_search(problem, seed, deadline)]
+        else:
+            seeds = [seed + offset for offset in range(workers)]
+            try:
+                results = list(_get_executor().map(_run_search, [problem] * workers, seeds, [deadline] * workers))
+            except BrokenProcessPool:
+                logger.warning("Pool-ul de procese al solver-ului s-a oprit; se continuă într-un singur proces")
+                _reset_executor()
+                results = [_run_search(problem, seed, max(deadline, time.time() + 1))]
+        best = min(results, key=lambda solution: solution.cost)
+        best.iterations = sum(solution.iterations for solution in results)
+        best.workers = len(results)
+        best.elapsed_seconds = time.time() - started
+        return best
+    finally:
+        _solve_lock.release()
+
+
+# --- construirea problemei din baza de date și a ciornei ---
+
+def _status_value(value) -> str | None:
+    return getattr(value, "value", value)
+
+
+def build_problem(db: Session, request: ScheduleSolveRequest) -> TimetableProblem:
+    """
+    Construiește problema pentru domeniul cererii: orele de plasat și ocuparea existentă a
+    sălilor, profesorilor și grupelor implicate.
+
+    Raises:
+        ValueError: Pentru ID-uri inexistente, zile/ore necunoscute sau cerințe fără sală potrivită
+    """
+    days = request.days or SOLVER_DAYS
+    hours = request.hours or SOLVER_HOURS
+    day_index = {normalize_day(day): position for position, day in enumerate(days)}
+    hour_index = {slot_start(hour): position for position, hour in enumerate(hours)}
+
+    def slot_of(day: str, hour: str) -> int | None:
+        day_position = day_index.get(normalize_day(day))
+        hour_position = hour_index.get(slot_start(hour))
+        if day_position is None or hour_position is None:
+            return None
+        return day_position * len(hours) + hour_position
+
+    requirements = request.requirements
+    for model, ids, label in (
+        (Group, {group_id for req in requirements for group_id in req.group_ids}, "Grupele"),
+        (Subject, {req.subject_id for req in requirements}, "Disciplinele"),
+        (Professor, {req.professor_id for req in requirements}, "Profesorii"),
+    ):
+        found = set(db.scalars(select(model.id).where(model.id.in_(ids))))
+        missing = sorted(ids - found)
+        if missing:
+            raise ValueError(f"{label} cu ID {missing} nu există")
+
+    rooms = sorted(
+        db.execute(select(Room.id, Room.capacity)).all(),
+        key=lambda room: (room.capacity is None, room.capacity or 0, room.id),
+    )
+
+    # Orarul existent din semestru (peste toți anii și tipurile de ciclu, ca indexul de suprapuneri:
+    # sălile și profesorii sunt comuni; grupele sunt distincte, deci rândurile altor cicluri nu le ating)
+    query = select(
+        Schedule.id, Schedule.group_id, Schedule.subject_id, Schedule.professor_id, Schedule.room_id,
+        Schedule.day, Schedule.hour, Schedule.session_type, Schedule.status,
+        Schedule.odd_week_subject_id, Schedule.odd_week_professor_id, Schedule.odd_week_room_id,
+    ).where(
+        Schedule.status != SessionStatus.CANCELED,
+        Schedule.semester.is_(None) if request.semester is None else Schedule.semester == request.semester,
+    )
+    sessions_per_cell: Dict[OccupancyKey, Set] = defaultdict(set)
+    occupied: Dict[OccupancyKey, int] = defaultdict(int)
+    existing: Dict[Tuple[int, int, str], int] = defaultdict(int)
+    for row in db.execute(query):
+        session_type = _status_value(row.session_type)
+        existing[(row.group_id, row.subject_id, session_type)] += 1
+        if row.odd_week_subject_id is not None and row.odd_week_subject_id != row.subject_id:
+            existing[(row.group_id, row.odd_week_subject_id, session_type)] += 1
+        slot = slot_of(row.day, row.hour)
+        if slot is None:
+            continue
+        for (resource_type, resource_id, _, _, parity), session in schedule_bookings(row):
+            parity_index = EVEN if parity == PARITY_EVEN else ODD
+            if resource_type == RESOURCE_ROOM:
+                sessions_per_cell[(ROOM, resource_id, slot, parity_index)].add(session)
+                occupied[(GROUP, row.group_id, slot, parity_index)] += 1
+            else:
+                sessions_per_cell[(PROFESSOR, resource_id, slot, parity_index)].add(session)
+    for key, sessions in sessions_per_cell.items():
+        occupied[key] = len(sessions)
+
+    for entry in request.unavailable:
+        if normalize_day(entry.day) not in day_index:
+            raise ValueError(f"Ziua necunoscută în indisponibilități: {entry.day}")
+        entry_hours = [entry.hour] if entry.hour else hours
+        for hour in entry_hours:
+            slot = slot_of(entry.day, hour)
+            if slot is None:
+                raise ValueError(f"Interval necunoscut în indisponibilități: {hour}")
+            for parity in (EVEN, ODD):
+                occupied[(PROFESSOR, entry.professor_id, slot, parity)] += 1
+
+    units: List[SessionUnit] = []
+    for position, req in enumerate(requirements):
+        allowed = set(req.room_ids) if req.room_ids else None
+        candidates = tuple(
+            room.id for room in rooms
+            if (allowed is None or room.id in allowed)
+            and (req.min_capacity is None or (room.capacity is not None and room.capacity >= req.min_capacity))
+        )
+        if not candidates:
+            raise ValueError(f"Cerința {position + 1}: nicio sală nu respectă restricțiile de capacitate/sală")
+
+        count = req.weekly_count
+        if request.skip_scheduled:
+            count -= min(existing.get((group_id, req.subject_id, req.session_type), 0) for group_id in req.group_ids)
+        for _ in range(max(count, 0)):
+            units.append(SessionUnit(
+                requirement=position,
+                group_ids=tuple(dict.fromkeys(req.group_ids)),
+                professor_id=req.professor_id,
+                parities=PARITIES[req.parity],
+                rooms=candidates,
+            ))
+
+    # Doar ocuparea resurselor implicate influențează costul
+    relevant = {
+        ROOM: {room for unit in units for room in unit.rooms},
+        PROFESSOR: {unit.professor_id for unit in units},
+        GROUP: {group_id for unit in units for group_id in unit.group_ids},
+    }
+    return TimetableProblem(
+        days=list(days),
+        hours=list(hours),
+        units=units,
+        occupied={key: count for key, count in occupied.items() if key[1] in relevant[key[0]]},
+    )
+
+
+def build_draft(problem: TimetableProblem, solution: TimetableSolution, request: ScheduleSolveRequest) -> List[ScheduleCreate]:
+    """
+    Transformă soluția în ore ScheduleCreate, câte una per grupă. O oră doar pe săptămâna pară
+    și una doar pe cea impară din același slot devin o singură oră cu alternanță (odd_week_*).
+    """
+    by_group_slot: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for position, unit in enumerate(problem.units):
+        for group_id in unit.group_ids:
+            by_group_slot[(group_id, solution.slots[position])].append(position)
+
+    def entry(group_id: int, slot: int, position: int, odd_position: int | None = None, notes: str | None = None):
+        req = request.requirements[problem.units[position].requirement]
+        day, hour = divmod(slot, len(problem.hours))
+        values = dict(
+            group_id=group_id,
+            subject_id=req.subject_id,
+            professor_id=req.professor_id,
+            room_id=solution.rooms[position],
+            day=problem.days[day],
+            hour=problem.hours[hour],
+            session_type=req.session_type,
+            notes=notes,
+            academic_year=request.academic_year,
+            semester=request.semester,
+            cycle_type=request.cycle_type,
+        )
+        if odd_position is not None:
+            odd_req = request.requirements[problem.units[odd_position].requirement]
+            values.update(
+                odd_week_subject_id=odd_req.subject_id,
+                odd_week_professor_id=odd_req.professor_id,
+                odd_week_room_id=solution.rooms[odd_position],
+            )
+        return ScheduleCreate(**values)
+
+    draft = []
+    for (group_id, slot), positions in sorted(by_group_slot.items(), key=lambda item: (item[0][1], item[0][0])):
+        even = [p for p in positions if problem.units[p].parities == (EVEN,)]
+        odd = [p for p in positions if problem.units[p].parities == (ODD,)]
+        for position in positions:
+            if problem.units[position].parities == (EVEN, ODD):
+                draft.append(entry(group_id, slot, position))
+        for even_position, odd_position in zip(even, odd):
+            draft.append(entry(group_id, slot, even_position, odd_position))
+        for position in even[len(odd):]:
+            draft.append(entry(group_id, slot, position, notes="Doar în săptămâna pară"))
+        for position in odd[len(even):]:
+            draft.append(entry(group_id, slot, position, notes="Doar în săptămâna impară"))
+    return draft
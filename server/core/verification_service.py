@@ -1,33 +1,59 @@
 """
 Serviciu pentru generarea și validarea codurilor de verificare.
 """
-import random
+import asyncio
+import hashlib
+import hmac
+import logging
+import os
+import secrets
 from datetime import datetime, timedelta
+from sqlalchemy import case, delete, or_, select, update
 from sqlalchemy.orm import Session
 
-from models.verification_code import VerificationCode
-from core.email_service import send_verification_code_email
+from core.database import SessionLocal
+from core.security import SECRET_KEY
+from models.verification_code import MAX_ATTEMPTS, VerificationCode
+from core.email_service import queue_verification_code_email
+
+logger = logging.getLogger(__name__)
+
+# Configurare pentru sweeper-ul care șterge codurile expirate sau deja folosite
+SWEEP_INTERVAL_SECONDS = int(os.getenv("VERIFICATION_CODE_SWEEP_INTERVAL_SECONDS", "300"))
+SWEEP_BATCH_SIZE = int(os.getenv("VERIFICATION_CODE_SWEEP_BATCH_SIZE", "500"))
 
 
 def generate_verification_code() -> str:
-    """Generează un cod de verificare de 6 cifre."""
-    return str(random.randint(100000, 999999))
+    """Generează un cod de verificare de 6 cifre (generator criptografic)."""
+    return str(100000 + secrets.randbelow(900000))
+
+
+def hash_verification_code(code: str) -> str:
+    """
+    Calculează hash-ul unui cod de verificare.
+    Folosește HMAC-SHA256 cu SECRET_KEY, astfel încât codurile nu pot fi recuperate din baza de date.
+    """
+    return hmac.new(SECRET_KEY.encode(), code.strip().encode(), hashlib.sha256).hexdigest()
 
 
 def create_verification_code(
     db: Session,
     user_id: int,
     email: str
-) -> VerificationCode:
+) -> tuple[VerificationCode, str]:
     """
     Creează un nou cod de verificare pentru un utilizator.
     Invalidează codurile anterioare nefolosite pentru același utilizator.
+    Email-ul este pus în coadă, nu trimis sincron.
+    
+    Returns:
+        (verification_code, delivery_id) - ID-ul livrării poate fi folosit pentru a interoga statusul email-ului
     """
     # Invalidează codurile anterioare nefolosite
     db.query(VerificationCode).filter(
         VerificationCode.user_id == user_id,
         VerificationCode.verified == 0
-    ).delete()
+    ).delete(synchronize_session=False)
     
     # Generează cod nou
     code = generate_verification_code()
@@ -35,7 +61,7 @@ def create_verification_code(
     
     verification_code = VerificationCode(
         user_id=user_id,
-        code=code,
+        code_hash=hash_verification_code(code),
         email=email,
         expires_at=expires_at,
         used=0,
@@ -46,10 +72,10 @@ def create_verification_code(
     db.commit()
     db.refresh(verification_code)
     
-    # Trimite codul pe email
-    send_verification_code_email(email, code)
+    # Pune email-ul în coadă (codul în clar nu este stocat în baza de date)
+    delivery_id = queue_verification_code_email(email, code)
     
-    return verification_code
+    return verification_code, delivery_id
 
 
 def verify_code(
@@ -58,46 +84,101 @@ def verify_code(
     code: str
 ) -> tuple[bool, str]:
     """
-    Verifică un cod de verificare.
+    Verifică un cod de verificare și contorizează încercarea într-o singură instrucțiune.
+
+    Un singur UPDATE ... RETURNING (indexat pe user_id, verified) marchează codul ca verificat
+    dacă este corect, neexpirat și are încercări disponibile; altfel incrementează numărul de încercări.
     
     Returns:
         (is_valid, message) - True dacă codul este valid, False altfel cu mesaj de eroare
     """
-    verification_code = db.query(VerificationCode).filter(
-        VerificationCode.user_id == user_id,
-        VerificationCode.code == code,
-        VerificationCode.verified == 0
-    ).order_by(VerificationCode.created_at.desc()).first()
+    now = datetime.utcnow()
+    is_match = (
+        (VerificationCode.code_hash == hash_verification_code(code))
+        & (VerificationCode.expires_at > now)
+        & (VerificationCode.used < MAX_ATTEMPTS)
+    )
+    stmt = (
+        update(VerificationCode)
+        .where(
+            VerificationCode.user_id == user_id,
+            VerificationCode.verified == 0,
+        )
+        .values(
+            verified=case((is_match, 1), else_=0),
+            used=case((is_match, VerificationCode.used), else_=VerificationCode.used + 1),
+        )
+        .returning(VerificationCode.verified, VerificationCode.used, VerificationCode.expires_at)
+        .execution_options(synchronize_session=False)
+    )
+    rows = db.execute(stmt).fetchall()
+    db.commit()
     
-    if not verification_code:
+    if not rows:
         return False, "Cod de verificare invalid sau deja folosit."
     
-    if verification_code.is_expired():
+    if any(row.verified == 1 for row in rows):
+        return True, "Cod de verificare valid."
+    
+    row = rows[0]
+    if row.expires_at <= now:
         return False, "Codul de verificare a expirat. Te rugăm să soliciți unul nou."
     
-    if verification_code.is_used_up():
+    if row.used >= MAX_ATTEMPTS:
         return False, "Ai depășit numărul maxim de încercări. Te rugăm să soliciți un cod nou."
     
-    # Marchează codul ca verificat
-    verification_code.verified = 1
-    db.commit()
-    
-    return True, "Cod de verificare valid."
+    return False, "Cod de verificare invalid sau deja folosit."
 
 
-def increment_code_attempts(
-    db: Session,
-    user_id: int,
-    code: str
-) -> None:
-    """Incrementează numărul de încercări pentru un cod."""
-    verification_code = db.query(VerificationCode).filter(
-        VerificationCode.user_id == user_id,
-        VerificationCode.code == code,
-        VerificationCode.verified == 0
-    ).order_by(VerificationCode.created_at.desc()).first()
+def purge_expired_verification_codes(db: Session, batch_size: int = SWEEP_BATCH_SIZE) -> int:
+    """
+    Șterge codurile expirate sau deja verificate, în batch-uri de cel mult `batch_size` rânduri,
+    cu commit după fiecare batch (tranzacții scurte, fără blocarea tabelului).
     
-    if verification_code:
-        verification_code.used += 1
+    Returns:
+        Numărul total de coduri șterse
+    """
+    total_deleted = 0
+    while True:
+        ids_to_delete = (
+            select(VerificationCode.id)
+            .where(or_(
+                VerificationCode.expires_at < datetime.utcnow(),
+                VerificationCode.verified == 1,
+            ))
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = db.execute(
+            delete(VerificationCode)
+            .where(VerificationCode.id.in_(ids_to_delete))
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
+        total_deleted += result.rowcount or 0
+        if not result.rowcount or result.rowcount < batch_size:
+            return total_deleted
+
+
+def _sweep_once() -> int:
+    """Rulează o trecere a sweeper-ului cu o sesiune proprie."""
+    db = SessionLocal()
+    try:
+        return purge_expired_verification_codes(db)
+    finally:
+        db.close()
 
+
+async def run_verification_code_sweeper(interval_seconds: int = SWEEP_INTERVAL_SECONDS) -> None:
+    """
+    Task de fundal care curăță periodic tabelul verification_codes.
+    Munca de bază de date rulează într-un thread separat pentru a nu bloca event loop-ul.
+    """
+    while True:
+        try:
+            deleted = await asyncio.to_thread(_sweep_once)
+            if deleted:
+                logger.info("Coduri de verificare expirate șterse: %d", deleted)
+        except Exception as e:
+            logger.warning("Eroare la curățarea codurilor de verificare: %s", e)
+        await asyncio.sleep(interval_seconds)
@@ -2,9 +2,50 @@
 WebSocket Manager pentru gestionarea conexiunilor WebSocket și broadcast-ului de mesaje.
 """
 from fastapi import WebSocket
-from typing import Dict, List, Set
+from typing import Callable, Dict, Iterable, List, Optional, Set
 import json
 import asyncio
+import logging
+import time
+
+from core.logging_config import SAMPLED
+from core.metrics import websocket_broadcast_duration_seconds, websocket_messages_sent_total
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """
+    Filtrul unei conexiuni pentru mesajele țintite (ex: evaluările periodice).
+    Conexiunile fără abonament primesc toate mesajele.
+    """
+
+    __slots__ = ("groups", "academic_year", "semester")
+
+    def __init__(
+        self,
+        groups: Iterable[str] | None = None,
+        academic_year: int | None = None,
+        semester: str | None = None,
+    ):
+        codes = frozenset(code.strip() for code in (groups or []) if code and code.strip())
+        self.groups: frozenset | None = codes or None
+        self.academic_year = academic_year
+        self.semester = semester
+
+    def key(self) -> tuple:
+        return (self.groups, self.academic_year, self.semester)
+
+    def matches_groups(self, group_codes: Iterable[str]) -> bool:
+        """True dacă abonamentul nu filtrează după grupe sau are o grupă comună."""
+        return self.groups is None or not self.groups.isdisjoint(group_codes)
+
+    def matches_slice(self, academic_year: int | None, semester: str | None) -> bool:
+        """True dacă anul/semestrul se potrivesc (filtrele nesetate acceptă orice)."""
+        return (
+            (self.academic_year is None or self.academic_year == academic_year)
+            and (self.semester is None or self.semester == semester)
+        )
 
 
 class WebSocketManager:
@@ -24,9 +65,10 @@ class WebSocketManager:
         await websocket.accept()
         self.active_connections.append(websocket)
         self.connection_info[websocket] = {
-            "connected_at": None  # Poți adăuga mai multe informații aici
+            "connected_at": None,  # Poți adăuga mai multe informații aici
+            "subscription": None,  # Subscription sau None (primește tot)
         }
-        print(f"✓ WebSocket conectat. Total conexiuni: {len(self.active_connections)}")
+        logger.info("WebSocket conectat. Total conexiuni: %d", len(self.active_connections), extra=SAMPLED)
     
     async def disconnect(self, websocket: WebSocket):
         """Deconectează o conexiune WebSocket."""
@@ -34,14 +76,14 @@ class WebSocketManager:
             self.active_connections.remove(websocket)
         if websocket in self.connection_info:
             del self.connection_info[websocket]
-        print(f"✓ WebSocket deconectat. Total conexiuni: {len(self.active_connections)}")
+        logger.info("WebSocket deconectat. Total conexiuni: %d", len(self.active_connections), extra=SAMPLED)
     
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Trimite un mesaj către un WebSocket specific."""
         try:
             await websocket.send_json(message)
         except Exception as e:
-            print(f"✗ Eroare la trimiterea mesajului personal: {str(e)}")
+            logger.debug("Eroare la trimiterea mesajului personal: %s", e)
             await self.disconnect(websocket)
     
     async def broadcast(self, message: dict):
@@ -53,20 +95,75 @@ class WebSocketManager:
             return
         
         disconnected = []
+        started = time.perf_counter()
+        sent = 0
         
         for connection in self.active_connections:
             try:
                 await connection.send_json(message)
+                sent += 1
             except Exception as e:
-                print(f"✗ Eroare la broadcast către un client: {str(e)}")
+                logger.debug("Eroare la broadcast către un client: %s", e)
                 disconnected.append(connection)
         
         # Elimină conexiunile închise
         for connection in disconnected:
             await self.disconnect(connection)
         
-        print(f"📡 Broadcast trimis către {len(self.active_connections)} clienți")
+        websocket_broadcast_duration_seconds.observe(time.perf_counter() - started, kind="all")
+        websocket_messages_sent_total.inc(sent, kind="all")
+        logger.info(
+            "Broadcast trimis către %d clienți (%d conexiuni închise)", sent, len(disconnected), extra=SAMPLED
+        )
     
+    def subscribe(self, websocket: WebSocket, subscription: Subscription | None) -> None:
+        """Setează (sau elimină, cu None) filtrul conexiunii pentru mesajele țintite."""
+        if websocket in self.connection_info:
+            self.connection_info[websocket]["subscription"] = subscription
+
+    def get_subscription(self, websocket: WebSocket) -> Subscription | None:
+        return self.connection_info.get(websocket, {}).get("subscription")
+
+    async def broadcast_by_subscription(self, build_message: Callable[[Optional[Subscription]], Optional[dict]]):
+        """
+        Trimite fiecărei conexiuni mesajul construit pentru abonamentul ei.
+
+        `build_message(subscription)` primește None pentru conexiunile fără abonament și
+        poate întoarce None pentru a nu trimite nimic. Mesajul se construiește o singură dată
+        pentru fiecare abonament distinct, nu pentru fiecare conexiune.
+        """
+        if not self.active_connections:
+            return
+
+        messages: Dict[tuple | None, Optional[dict]] = {}
+        disconnected = []
+        sent = 0
+        started = time.perf_counter()
+
+        for connection in list(self.active_connections):
+            subscription = self.get_subscription(connection)
+            key = subscription.key() if subscription is not None else None
+            if key not in messages:
+                messages[key] = build_message(subscription)
+            message = messages[key]
+            if message is None:
+                continue
+            try:
+                await connection.send_json(message)
+                sent += 1
+            except Exception as e:
+                logger.debug("Eroare la broadcast către un client: %s", e)
+                disconnected.append(connection)
+
+        for connection in disconnected:
+            await self.disconnect(connection)
+
+        websocket_broadcast_duration_seconds.observe(time.perf_counter() - started, kind="targeted")
+        websocket_messages_sent_total.inc(sent, kind="targeted")
+        logger.info(
+            "Broadcast țintit trimis către %d/%d clienți", sent, len(self.active_connections), extra=SAMPLED
+        )
+
     def get_connection_count(self) -> int:
         """Returnează numărul de conexiuni active."""
         return len(self.active_connections)
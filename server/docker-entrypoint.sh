@@ -53,21 +53,14 @@ except Exception:
     fi
 else
     echo " Detectată bază de date SQLite"
-    # Inițializează baza de date SQLite dacă nu există
-    if [ ! -f "/app/data/schedule.db" ]; then
-        echo " Inițializare baza de date SQLite..."
-        cd /app
-        python init_db.py
-        echo "✓ Baza de date SQLite inițializată!"
-    else
-        echo "✓ Baza de date SQLite deja există, se continuă..."
-    fi
 fi
 
-# Rulează migrările Alembic pentru a crea/actualiza schema
+# Rulează migrările Alembic o singură dată, sub lock (advisory lock PostgreSQL / lock pe fișier SQLite).
+# O bază de date nouă este creată de migrări; una veche, fără alembic_version, este marcată automat.
+# Workerii uvicorn nu mai ating schema la pornire.
 echo " Rulare migrări Alembic..."
 cd /app
-python -m alembic upgrade head || echo "  Atenție: Migrările Alembic au eșuat sau nu există migrări"
+python migrate.py
 
 echo " Pornire server FastAPI..."
 # Rulează comanda primită (uvicorn)
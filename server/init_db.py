@@ -1,10 +1,16 @@
 """
 Script pentru inițializarea bazei de date.
-Creează toate tabelele necesare.
+Creează toate tabelele necesare și marchează schema ca fiind la ultima revizie Alembic.
+
+În deploy se folosește `python migrate.py`; acest script rămâne pentru dezvoltare locală.
 """
+from alembic import command
+
 from core.database import Base, engine
+from migrate import alembic_config
 from models import (
     AssessmentSchedule,
+    AssessmentScheduleGroup,
     Group,
     Professor,
     Room,
@@ -18,9 +24,12 @@ from models import (
 def init_database():
     """Creează toate tabelele în baza de date."""
     print("Creând tabelele în baza de date...")
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        Base.metadata.create_all(bind=connection)
+        # Schema creată este echivalentă cu head; migrate.py nu va mai rula migrările vechi
+        command.stamp(alembic_config(connection), "head")
     print("✓ Baza de date a fost inițializată cu succes!")
-    print("✓ Tabele create/actualizate: groups, professors, subjects, rooms, schedules, users, user_groups, verification_codes, assessment_schedules")
+    print("✓ Tabele create/actualizate: groups, professors, subjects, rooms, schedules, users, user_groups, verification_codes, assessment_schedules, assessment_schedule_groups")
 
 if __name__ == "__main__":
     init_database()
@@ -1,16 +1,26 @@
+from contextlib import asynccontextmanager, suppress
+import asyncio
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
-import os
 
 # Încarcă variabilele de mediu din fișierul .env
 load_dotenv()
 
+# Logging-ul se configurează înaintea importului routerelor (unele module loghează la import)
+from core.logging_config import REQUEST_ID_HEADER, request_id_middleware, setup_logging
+
+setup_logging()
+
 from routers import (
     assessment_schedule_router,
     auth_router,
+    calendar_router,
     group_router,
     orar_router,
+    profiling_router,
     professor_router,
     room_router,
     schedule_notifications,
@@ -19,10 +29,38 @@ from routers import (
     websocket_router,
 )
 
+from core.compression import compression_middleware
+from core.metrics import METRICS_ENABLED, metrics_middleware, setup_metrics
+from core.profiler import PROFILE_ID_HEADER, request_profiling_middleware, track_request_endpoints
+from core.query_budget import setup_query_budget
+from core.read_routing import READ_PRIMARY_HEADER, read_your_writes_middleware
+from core.security import warm_up_password_hashing
+from core.verification_service import run_verification_code_sweeper
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Pornește task-urile de fundal la startup și le oprește la shutdown.
+
+    Inițializările scumpe care nu sunt necesare pentru a accepta request-uri (ex: contextul
+    Argon2, ~30 ms) se fac într-un thread după pornire, nu la importul aplicației.
+    """
+    sweeper = asyncio.create_task(run_verification_code_sweeper())
+    asyncio.get_running_loop().run_in_executor(None, warm_up_password_hashing)
+    try:
+        yield
+    finally:
+        sweeper.cancel()
+        with suppress(asyncio.CancelledError):
+            await sweeper
+
+
 app = FastAPI(
     title="Student Schedule Management API",
     description="API pentru managementul orarului studenților cu autentificare și roluri",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS origins - permite ambele clienți (student și admin)
@@ -37,16 +75,38 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Clientul admin citește header-ul pentru read-your-writes (vezi core/read_routing.py)
+    expose_headers=[READ_PRIMARY_HEADER, REQUEST_ID_HEADER, PROFILE_ID_HEADER],
 )
 
+app.middleware("http")(read_your_writes_middleware)
+# Buget de interogări per request (doar cu QUERY_BUDGET_MODE=log/raise)
+setup_query_budget(app)
+# Profilare per request, la cerere (header-ul X-Profile cu PROFILER_TOKEN)
+app.middleware("http")(request_profiling_middleware)
+# ID-ul request-ului, adăugat la toate log-urile emise în timpul lui
+app.middleware("http")(request_id_middleware)
+# Compresie br/gzip pentru răspunsurile text mari (cele din cache sunt deja comprimate)
+app.middleware("http")(compression_middleware)
+
+if METRICS_ENABLED:
+    from routers import metrics_router
+
+    setup_metrics()
+    # Adăugat ultimul, deci măsoară request-ul complet, inclusiv celelalte middleware-uri
+    app.middleware("http")(metrics_middleware)
+    app.include_router(metrics_router.router)
+
 # Include routerele
 app.include_router(auth_router.router)
 app.include_router(assessment_schedule_router.router)
+app.include_router(calendar_router.router)
 app.include_router(group_router.router)
 app.include_router(professor_router.router)
 app.include_router(subject_router.router)
 app.include_router(room_router.router)
 app.include_router(orar_router.router)
+app.include_router(profiling_router.router)
 app.include_router(schedule_notifications.router)
 app.include_router(user_router.router)
 app.include_router(websocket_router.router)
@@ -60,3 +120,7 @@ def home():
         "docs": "/docs",
         "version": "1.0.0"
     }
+
+
+# După ce toate rutele sunt înregistrate: endpoint-urile își notează thread-ul pentru profilarea per request
+track_request_endpoints(app)
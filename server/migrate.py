@@ -0,0 +1,201 @@
+"""
+Runner pentru migrările bazei de date, rulat o singură dată la deploy (înainte de pornirea workerilor).
+
+Toată gestiunea schemei trece prin Alembic; serverul nu mai inspectează și nu mai
+modifică schema la pornire. Runner-ul:
+  1. ia un lock exclusiv (advisory lock în PostgreSQL, lock pe fișier pentru SQLite),
+     astfel încât mai multe containere pornite simultan să nu ruleze DDL în paralel;
+  2. marchează (stamp) bazele de date vechi, create cu create_all fără tabela
+     alembic_version, cu revizia care corespunde structurii lor;
+  3. rulează `alembic upgrade head` pe aceeași conexiune care ține lock-ul.
+
+Utilizare:
+    python migrate.py            # upgrade la head
+    python migrate.py --check    # doar afișează revizia curentă și dacă sunt migrări în așteptare
+"""
+import argparse
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+import sqlalchemy as sa
+from sqlalchemy import create_engine, inspect, pool, text
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./schedule.db")
+# Cheia advisory lock-ului PostgreSQL (aceeași pentru toate instanțele aplicației)
+MIGRATION_LOCK_ID = int(os.getenv("MIGRATION_LOCK_ID", "7243001"))
+# Fișierul de lock pentru SQLite (implicit lângă fișierul bazei de date)
+MIGRATION_LOCK_FILE = os.getenv("MIGRATION_LOCK_FILE")
+
+
+def alembic_config(connection=None) -> Config:
+    """Construiește configurația Alembic; dacă primește o conexiune, migrările rulează pe ea."""
+    config = Config(os.path.join(BASE_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BASE_DIR, "alembic"))
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def detect_legacy_revision(connection) -> str | None:
+    """
+    Determină revizia corespunzătoare unei baze de date create fără Alembic (create_all).
+
+    Verificările merg de la cea mai nouă structură la cea mai veche; create_all creează
+    întreaga schemă dintr-o dată, deci prima trăsătură găsită indică revizia.
+
+    Returns:
+        Revizia de marcat sau None dacă baza de date este goală
+    """
+    inspector = inspect(connection)
+    tables = set(inspector.get_table_names())
+    if not tables:
+        return None
+
+    def columns(table: str) -> dict:
+        if table not in tables:
+            return {}
+        return {col["name"]: col for col in inspector.get_columns(table)}
+
+    def has_index(table: str, name: str) -> bool:
+        return table in tables and any(ix["name"] == name for ix in inspector.get_indexes(table))
+
+    if has_index("schedules", "ix_schedules_professor_id"):
+        return "add_schedule_resource_indexes"
+
+    assessment_columns = columns("assessment_schedules")
+    assessment_date = assessment_columns.get("assessment_date")
+    if assessment_date is not None and isinstance(assessment_date["type"], sa.Date):
+        return "typed_assessment_date_time"
+    if "assessment_schedule_groups" in tables:
+        return "normalize_assessment_groups"
+    if "code_hash" in columns("verification_codes"):
+        return "hash_verification_codes"
+    if has_index("users", "ix_users_username_lower"):
+        return "normalize_username_lower"
+    if "cycle_type" in assessment_columns and "professor_name" in assessment_columns:
+        return "fix_assessment_schedules"
+    if assessment_columns:
+        return "add_assessment_schedules"
+
+    schedule_columns = columns("schedules")
+    if "academic_year" in schedule_columns:
+        return "add_academic_year_fields"
+    if "odd_week_subject_id" in schedule_columns:
+        return "add_odd_week_fields"
+    return "2f94fa87e2f8"
+
+
+def _sqlite_lock_path() -> str:
+    if MIGRATION_LOCK_FILE:
+        return MIGRATION_LOCK_FILE
+    database = sa.engine.make_url(DATABASE_URL).database
+    if database and database != ":memory:":
+        return os.path.abspath(database) + ".migrate.lock"
+    return os.path.join(BASE_DIR, ".migrate.lock")
+
+
+@contextmanager
+def _file_lock(path: str):
+    """Lock exclusiv pe fișier (blochează până când celălalt proces termină)."""
+    with open(path, "a+") as lock_file:
+        try:
+            import fcntl
+        except ImportError:  # Windows
+            import msvcrt
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.5)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def migration_lock(engine):
+    """
+    Deschide o tranzacție ținând lock-ul de migrare și o returnează.
+
+    PostgreSQL: pg_advisory_xact_lock, eliberat automat la commit/rollback.
+    Alte baze de date (SQLite): lock pe fișier, ținut până la închiderea tranzacției.
+    """
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as connection:
+            connection.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": MIGRATION_LOCK_ID})
+            yield connection
+    else:
+        with _file_lock(_sqlite_lock_path()):
+            with engine.begin() as connection:
+                yield connection
+
+
+def _current_revision(connection) -> str | None:
+    return MigrationContext.configure(connection).get_current_revision()
+
+
+def run_migrations(check_only: bool = False) -> int:
+    """Rulează migrările sub lock. Returnează codul de ieșire al procesului."""
+    engine = create_engine(DATABASE_URL, poolclass=pool.NullPool)
+    head = ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+    started = time.perf_counter()
+    with migration_lock(engine) as connection:
+        config = alembic_config(connection)
+        current = _current_revision(connection)
+
+        if current is None:
+            legacy_revision = detect_legacy_revision(connection)
+            if legacy_revision is not None:
+                if check_only:
+                    print(f"⚠️ Bază de date fără alembic_version; structura corespunde reviziei {legacy_revision}")
+                    current = legacy_revision
+                else:
+                    print(f"⚠️ Bază de date fără alembic_version. Se marchează revizia {legacy_revision}...")
+                    command.stamp(config, legacy_revision)
+                    current = legacy_revision
+
+        if check_only:
+            pending = current != head
+            print(f"Revizie curentă: {current or '(niciuna)'} | head: {head}")
+            print("⚠️ Există migrări în așteptare" if pending else "✓ Schema este la zi")
+            return 1 if pending else 0
+
+        if current == head:
+            print(f"✓ Schema este deja la zi (revizia {head})")
+            return 0
+
+        print(f" Rulare migrări: {current or '(bază de date goală)'} -> {head}")
+        command.upgrade(config, "head")
+
+    print(f"✓ Migrări aplicate în {time.perf_counter() - started:.2f}s (revizia {head})")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rulează migrările Alembic sub lock exclusiv.")
+    parser.add_argument("--check", action="store_true", help="Nu modifică schema; iese cu 1 dacă există migrări în așteptare")
+    args = parser.parse_args()
+    return run_migrations(check_only=args.check)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
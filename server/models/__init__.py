@@ -1,5 +1,6 @@
 # Models package
 from .assessment_schedule import AssessmentSchedule
+from .assessment_schedule_group import AssessmentScheduleGroup
 from .group import Group
 from .professor import Professor
 from .room import Room
@@ -11,6 +12,7 @@ from .verification_code import VerificationCode
 
 __all__ = [
     "AssessmentSchedule",
+    "AssessmentScheduleGroup",
     "Group",
     "Professor",
     "Room",
@@ -1,23 +1,76 @@
-from sqlalchemy import Column, Integer, String
+from typing import List
+
+from sqlalchemy import Column, Date, Index, Integer, String, Time
+from sqlalchemy.orm import relationship
 
 from core.database import Base
+from models.assessment_schedule_group import AssessmentScheduleGroup
+
+
+def parse_groups_composition(value: str | None) -> List[str]:
+    """
+    Împarte componența seriei ("TI-221, TI-222") în coduri de grupă,
+    eliminând spațiile, intrările goale și duplicatele (păstrând ordinea).
+    """
+    codes: List[str] = []
+    for part in (value or "").split(","):
+        code = part.strip()
+        if code and code not in codes:
+            codes.append(code)
+    return codes
 
 
 class AssessmentSchedule(Base):
     """
     Tabel pentru evaluările periodice.
     Un rând = o disciplină cu toate datele (grupe, profesor, dată, oră, sală).
-    Toate grupele sunt într-un singur câmp text, separate prin virgulă.
+    Grupele sunt stocate normalizat în assessment_schedule_groups; `groups_composition`
+    rămâne disponibil ca text separat prin virgulă, calculat din acestea.
     """
     __tablename__ = "assessment_schedules"
+    __table_args__ = (
+        # Interogările pe interval de date într-un an/semestru sunt scanări de interval pe index
+        Index("ix_assessment_schedules_calendar", "academic_year", "semester", "assessment_date"),
+        Index("ix_assessment_schedules_assessment_date", "assessment_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     subject = Column(String, nullable=False)  # Numele disciplinei (scris manual)
-    groups_composition = Column(String, nullable=False)  # Componența seriei - grupele separate prin virgulă (ex: "TI-221, TI-222, TI-223")
     professor_name = Column(String, nullable=False)  # Cadrul didactic titular (scris manual)
-    assessment_date = Column(String, nullable=False)  # Data evaluării (scris manual, ex: "2024-01-15")
-    assessment_time = Column(String, nullable=False)  # Ora evaluării (scris manual, ex: "14:00")
+    assessment_date = Column(Date, nullable=True)  # Data evaluării (ex: 2024-01-15), NULL dacă nu este stabilită
+    assessment_time = Column(Time, nullable=True)  # Ora evaluării (ex: 14:00), NULL dacă nu este stabilită
     room_code = Column(String, nullable=False)  # Codul sălii (scris manual)
     academic_year = Column(Integer, nullable=False)  # Anul academic (1, 2, 3, 4)
     semester = Column(String, nullable=False)  # "assessments1" sau "assessments2"
     cycle_type = Column(String, nullable=True)  # "F" sau "FR"
+
+    # Grupele din componența seriei, în ordinea în care au fost scrise
+    group_links = relationship(
+        AssessmentScheduleGroup,
+        back_populates="assessment_schedule",
+        order_by=AssessmentScheduleGroup.position,
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
+
+    @property
+    def group_codes(self) -> List[str]:
+        """Codurile grupelor din componența seriei."""
+        return [link.group_code for link in self.group_links]
+
+    @property
+    def groups_composition(self) -> str:
+        """Componența seriei - grupele separate prin virgulă (ex: "TI-221, TI-222, TI-223")."""
+        return ", ".join(self.group_codes)
+
+    @groups_composition.setter
+    def groups_composition(self, value: str) -> None:
+        # Refolosește asocierile existente pentru grupele care rămân (evită conflictul
+        # cu constrângerea unică între INSERT-ul nou și DELETE-ul vechi la flush)
+        existing = {link.group_code: link for link in self.group_links}
+        links = []
+        for position, code in enumerate(parse_groups_composition(value)):
+            link = existing.get(code) or AssessmentScheduleGroup(group_code=code)
+            link.position = position
+            links.append(link)
+        self.group_links = links
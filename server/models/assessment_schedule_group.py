@@ -0,0 +1,31 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import relationship
+
+from core.database import Base
+
+
+class AssessmentScheduleGroup(Base):
+    """
+    Tabelă de asociere între evaluările periodice și grupele din componența seriei.
+    Un rând = o grupă dintr-o evaluare (ex: "TI-221" pentru seria "TI-221, TI-222").
+    """
+    __tablename__ = "assessment_schedule_groups"
+    __table_args__ = (
+        UniqueConstraint(
+            "assessment_schedule_id", "group_code",
+            name="uq_assessment_schedule_groups_assessment_group",
+        ),
+        # Căutarea "ce evaluări are grupa X" este o căutare indexată după group_code
+        Index("ix_assessment_schedule_groups_group_code", "group_code", "assessment_schedule_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    assessment_schedule_id = Column(
+        Integer,
+        ForeignKey("assessment_schedules.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    group_code = Column(String, nullable=False)  # Codul grupei, așa cum a fost scris (ex: "TI-221")
+    position = Column(Integer, nullable=False, default=0)  # Ordinea grupei în componența seriei
+
+    assessment_schedule = relationship("AssessmentSchedule", back_populates="group_links")
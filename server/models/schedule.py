@@ -1,6 +1,6 @@
 import enum
 
-from sqlalchemy import Column, Enum, ForeignKey, Integer, String
+from sqlalchemy import Column, Enum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from core.database import Base
@@ -20,6 +20,14 @@ class SessionStatus(str, enum.Enum):
 
 class Schedule(Base):
     __tablename__ = "schedules"
+    __table_args__ = (
+        # Vederile per grupă / profesor / sală (inclusiv câmpurile săptămânii impare) sunt căutări indexate
+        Index("ix_schedules_group_id", "group_id"),
+        Index("ix_schedules_professor_id", "professor_id"),
+        Index("ix_schedules_odd_week_professor_id", "odd_week_professor_id"),
+        Index("ix_schedules_room_id", "room_id"),
+        Index("ix_schedules_odd_week_room_id", "odd_week_room_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     group_id = Column(Integer, ForeignKey("groups.id"), nullable=False)
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, String, Enum, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Enum, Boolean, DateTime, Index, func
 
 from core.database import Base
 
@@ -24,3 +24,8 @@ class User(Base):
     def has_password_set(self) -> bool:
         """Verifică dacă utilizatorul are parolă setată."""
         return self.password_hash is not None and self.password_hash != ''
+
+
+# Index unic pe forma normalizată (lowercase) a username-ului - toate căutările
+# de autentificare filtrează după lower(username), deci sunt căutări indexate.
+Index("ix_users_username_lower", func.lower(User.username), unique=True)
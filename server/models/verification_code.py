@@ -6,14 +6,17 @@ from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 
 from core.database import Base
 
+# Numărul maxim de încercări pentru un cod
+MAX_ATTEMPTS = 3
+
 
 class VerificationCode(Base):
-    """Cod de verificare de 6 cifre pentru setarea parolei."""
+    """Cod de verificare de 6 cifre pentru setarea parolei (stocat doar ca hash)."""
     __tablename__ = "verification_codes"
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    code = Column(String(6), nullable=False)  # Cod de 6 cifre
+    code_hash = Column(String(64), nullable=False)  # HMAC-SHA256 (hex) al codului de 6 cifre
     email = Column(String, nullable=False)  # Email-ul la care a fost trimis codul
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     expires_at = Column(DateTime, nullable=False)  # Expiră după 10 minute
@@ -21,8 +24,10 @@ class VerificationCode(Base):
     verified = Column(Integer, default=0, nullable=False)  # 0 = neverificat, 1 = verificat
     
     __table_args__ = (
-        Index('ix_verification_codes_user_id', 'user_id'),
-        Index('ix_verification_codes_code', 'code'),
+        # Acoperă lookup-ul de verificare (user_id, verified=0, cel mai recent) și ștergerea codurilor anterioare
+        Index('ix_verification_codes_user_verified_created', 'user_id', 'verified', 'created_at'),
+        # Folosit de sweeper-ul care șterge codurile expirate
+        Index('ix_verification_codes_expires_at', 'expires_at'),
     )
     
     def is_expired(self) -> bool:
@@ -31,9 +36,8 @@ class VerificationCode(Base):
     
     def is_used_up(self) -> bool:
         """Verifică dacă s-au epuizat încercările (max 3)."""
-        return self.used >= 3
+        return self.used >= MAX_ATTEMPTS
     
     def is_verified(self) -> bool:
         """Verifică dacă codul a fost deja folosit pentru setarea parolei."""
         return self.verified == 1
-
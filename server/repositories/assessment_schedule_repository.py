@@ -1,12 +1,19 @@
+from datetime import date
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Dict, List, Tuple
 
-from models.assessment_schedule import AssessmentSchedule
+from models.assessment_schedule import AssessmentSchedule, parse_groups_composition
+from models.assessment_schedule_group import AssessmentScheduleGroup
 from schemas.assessment_schedules import (
+    AssessmentScheduleBatchRequest,
     AssessmentScheduleCreate,
     AssessmentScheduleUpdate,
 )
 
+# Coloane care nu acceptă NULL: o valoare None trimisă într-un batch este ignorată
+_REQUIRED_COLUMNS = {"subject", "professor_name", "room_code", "academic_year", "semester"}
+
 
 class AssessmentScheduleRepository:
     """Repository class responsible for all database operations related to assessment schedules."""
@@ -17,12 +24,52 @@ class AssessmentScheduleRepository:
         academic_year: int | None = None,
         semester: str | None = None,
         cycle_type: str | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
     ) -> List[AssessmentSchedule]:
         """
-        Obține toate evaluările periodice, opțional filtrate după an academic, semestru și tip de ciclu.
+        Obține toate evaluările periodice, opțional filtrate după an academic, semestru, tip de ciclu
+        și interval de date (inclusiv). Cu interval, rezultatele sunt ordonate cronologic.
         """
         query = db.query(AssessmentSchedule)
 
+        if academic_year is not None:
+            query = query.filter(AssessmentSchedule.academic_year == academic_year)
+        if semester is not None:
+            query = query.filter(AssessmentSchedule.semester == semester)
+        if cycle_type is not None:
+            query = query.filter(AssessmentSchedule.cycle_type == cycle_type)
+        if date_from is not None:
+            query = query.filter(AssessmentSchedule.assessment_date >= date_from)
+        if date_to is not None:
+            query = query.filter(AssessmentSchedule.assessment_date <= date_to)
+
+        if date_from is not None or date_to is not None:
+            return query.order_by(
+                AssessmentSchedule.assessment_date,
+                AssessmentSchedule.assessment_time,
+                AssessmentSchedule.subject,
+            ).all()
+        return query.order_by(AssessmentSchedule.subject).all()
+
+    def get_by_group_code(
+        self,
+        db: Session,
+        group_code: str,
+        academic_year: int | None = None,
+        semester: str | None = None,
+        cycle_type: str | None = None,
+    ) -> List[AssessmentSchedule]:
+        """
+        Obține evaluările periodice ale unei grupe printr-o căutare indexată
+        în assessment_schedule_groups (fără a parcurge toate evaluările).
+        """
+        query = (
+            db.query(AssessmentSchedule)
+            .join(AssessmentScheduleGroup, AssessmentScheduleGroup.assessment_schedule_id == AssessmentSchedule.id)
+            .filter(AssessmentScheduleGroup.group_code == group_code.strip())
+        )
+
         if academic_year is not None:
             query = query.filter(AssessmentSchedule.academic_year == academic_year)
         if semester is not None:
@@ -32,10 +79,42 @@ class AssessmentScheduleRepository:
 
         return query.order_by(AssessmentSchedule.subject).all()
 
+    def get_by_professor_name(self, db: Session, professor_name: str) -> List[AssessmentSchedule]:
+        """Evaluările unui cadru didactic (numele este scris manual, deci comparația ignoră majusculele)."""
+        return (
+            db.query(AssessmentSchedule)
+            .filter(func.lower(AssessmentSchedule.professor_name) == professor_name.strip().lower())
+            .order_by(AssessmentSchedule.assessment_date, AssessmentSchedule.assessment_time)
+            .all()
+        )
+
+    def get_by_room_code(self, db: Session, room_code: str) -> List[AssessmentSchedule]:
+        """Evaluările dintr-o sală."""
+        return (
+            db.query(AssessmentSchedule)
+            .filter(AssessmentSchedule.room_code == room_code.strip())
+            .order_by(AssessmentSchedule.assessment_date, AssessmentSchedule.assessment_time)
+            .all()
+        )
+
     def get_by_id(self, db: Session, assessment_schedule_id: int) -> AssessmentSchedule | None:
         """Obține o evaluare periodică după ID."""
         return db.query(AssessmentSchedule).filter(AssessmentSchedule.id == assessment_schedule_id).first()
 
+    def get_group_codes(self, db: Session, assessment_schedule_ids: List[int]) -> Dict[int, List[str]]:
+        """Grupele curente ale evaluărilor date, cu o singură interogare pe tabela de asociere."""
+        if not assessment_schedule_ids:
+            return {}
+        group_codes: Dict[int, List[str]] = {assessment_id: [] for assessment_id in assessment_schedule_ids}
+        rows = db.execute(
+            select(AssessmentScheduleGroup.assessment_schedule_id, AssessmentScheduleGroup.group_code)
+            .where(AssessmentScheduleGroup.assessment_schedule_id.in_(assessment_schedule_ids))
+            .order_by(AssessmentScheduleGroup.assessment_schedule_id, AssessmentScheduleGroup.position)
+        )
+        for assessment_id, group_code in rows:
+            group_codes[assessment_id].append(group_code)
+        return group_codes
+
     def create(self, db: Session, assessment_data: AssessmentScheduleCreate) -> AssessmentSchedule:
         """Creează o nouă evaluare periodică."""
         new_assessment = AssessmentSchedule(
@@ -65,25 +144,12 @@ class AssessmentScheduleRepository:
         if not assessment:
             return None
 
-        # Actualizează câmpurile
-        if update_data.subject is not None:
-            assessment.subject = update_data.subject
-        if update_data.groups_composition is not None:
-            assessment.groups_composition = update_data.groups_composition
-        if update_data.professor_name is not None:
-            assessment.professor_name = update_data.professor_name
-        if update_data.assessment_date is not None:
-            assessment.assessment_date = update_data.assessment_date
-        if update_data.assessment_time is not None:
-            assessment.assessment_time = update_data.assessment_time
-        if update_data.room_code is not None:
-            assessment.room_code = update_data.room_code
-        if update_data.academic_year is not None:
-            assessment.academic_year = update_data.academic_year
-        if update_data.semester is not None:
-            assessment.semester = update_data.semester
-        if update_data.cycle_type is not None:
-            assessment.cycle_type = update_data.cycle_type
+        # Actualizează câmpurile trimise explicit, ca în batch: None (sau "" pentru dată/oră)
+        # golește coloanele opționale, iar pentru cele obligatorii înseamnă "neschimbat"
+        for key, value in update_data.model_dump(exclude_unset=True).items():
+            if value is None and (key in _REQUIRED_COLUMNS or key == "groups_composition"):
+                continue
+            setattr(assessment, key, value)
 
         db.commit()
         db.refresh(assessment)
@@ -98,3 +164,107 @@ class AssessmentScheduleRepository:
         db.delete(assessment)
         db.commit()
         return assessment
+
+    def apply_batch(
+        self,
+        db: Session,
+        batch: AssessmentScheduleBatchRequest,
+    ) -> Tuple[List[AssessmentSchedule], List[AssessmentSchedule], List[int]]:
+        """
+        Aplică într-o singură tranzacție ștergerile, actualizările și creările din batch,
+        folosind instrucțiuni bulk (un DELETE, un UPDATE executemany, un INSERT multi-rând
+        pentru evaluări și unul pentru grupe), indiferent de numărul de rânduri.
+
+        Returns:
+            (evaluări create, evaluări actualizate, ID-uri șterse)
+
+        Raises:
+            LookupError: Dacă unele ID-uri de actualizat/șters nu există (nu se aplică nimic)
+            ValueError: Dacă același ID apare de mai multe ori în batch
+        """
+        update_ids = [item.id for item in batch.update]
+        delete_ids = list(dict.fromkeys(batch.delete))
+        target_ids = update_ids + delete_ids
+        if len(set(target_ids)) != len(target_ids):
+            raise ValueError("Un ID apare de mai multe ori în actualizări/ștergeri")
+
+        try:
+            if target_ids:
+                existing_ids = set(
+                    db.scalars(select(AssessmentSchedule.id).where(AssessmentSchedule.id.in_(target_ids)))
+                )
+                missing_ids = [item_id for item_id in target_ids if item_id not in existing_ids]
+                if missing_ids:
+                    raise LookupError(f"Evaluările periodice cu ID {missing_ids} nu au fost găsite")
+
+            # Ștergeri (grupele explicit, pentru SQLite fără foreign_keys=ON)
+            if delete_ids:
+                db.execute(
+                    delete(AssessmentScheduleGroup).where(AssessmentScheduleGroup.assessment_schedule_id.in_(delete_ids))
+                )
+                db.execute(delete(AssessmentSchedule).where(AssessmentSchedule.id.in_(delete_ids)))
+
+            # Actualizări - UPDATE după cheia primară, grupat de SQLAlchemy după setul de coloane
+            column_updates = []
+            group_rows = []
+            regrouped_ids = []
+            for item in batch.update:
+                values = item.model_dump(exclude_unset=True, exclude={"id"})
+                groups_composition = values.pop("groups_composition", None)
+                values = {
+                    key: value for key, value in values.items()
+                    if value is not None or key not in _REQUIRED_COLUMNS
+                }
+                if values:
+                    column_updates.append({"id": item.id, **values})
+                if groups_composition is not None:
+                    regrouped_ids.append(item.id)
+                    group_rows.extend(self._group_rows(item.id, groups_composition))
+
+            if column_updates:
+                db.execute(update(AssessmentSchedule), column_updates)
+            if regrouped_ids:
+                db.execute(
+                    delete(AssessmentScheduleGroup).where(AssessmentScheduleGroup.assessment_schedule_id.in_(regrouped_ids))
+                )
+
+            # Creări - INSERT multi-rând cu RETURNING în ordinea parametrilor
+            created_ids: List[int] = []
+            if batch.create:
+                created_ids = list(db.scalars(
+                    insert(AssessmentSchedule).returning(AssessmentSchedule.id, sort_by_parameter_order=True),
+                    [item.model_dump(exclude={"groups_composition"}) for item in batch.create],
+                ))
+                for assessment_id, item in zip(created_ids, batch.create):
+                    group_rows.extend(self._group_rows(assessment_id, item.groups_composition))
+
+            if group_rows:
+                db.execute(insert(AssessmentScheduleGroup), group_rows)
+
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        # Citește rezultatul (evaluările + grupele lor prin selectin) cu două interogări
+        result_ids = created_ids + update_ids
+        rows_by_id = {}
+        if result_ids:
+            db.expire_all()
+            rows_by_id = {
+                row.id: row
+                for row in db.scalars(select(AssessmentSchedule).where(AssessmentSchedule.id.in_(result_ids)))
+            }
+        return (
+            [rows_by_id[item_id] for item_id in created_ids],
+            [rows_by_id[item_id] for item_id in update_ids],
+            delete_ids,
+        )
+
+    @staticmethod
+    def _group_rows(assessment_schedule_id: int, groups_composition: str) -> List[dict]:
+        """Rândurile assessment_schedule_groups pentru componența unei serii."""
+        return [
+            {"assessment_schedule_id": assessment_schedule_id, "group_code": code, "position": position}
+            for position, code in enumerate(parse_groups_composition(groups_composition))
+        ]
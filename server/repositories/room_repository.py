@@ -11,6 +11,9 @@ class RoomRepository:
     def get_by_id(self, db: Session, room_id: int):
         return db.query(Room).filter(Room.id == room_id).first()
 
+    def get_by_code(self, db: Session, code: str):
+        return db.query(Room).filter(Room.code == code.strip()).first()
+
     def create(self, db: Session, data: RoomCreate):
         room = Room(
             code=data.code,
@@ -1,3 +1,4 @@
+from sqlalchemy import or_
 from sqlalchemy.orm import Session, selectinload
 
 from models.group import Group
@@ -38,17 +39,18 @@ class ScheduleRepository:
         """
         Obține toate schedule-urile, opțional filtrate după an academic, semestru și tip de ciclu.
         """
-        query = self._base_query(db)
-        
-        # Aplică filtrele doar dacă sunt specificate
+        query = self._apply_filters(self._base_query(db), academic_year, semester, cycle_type)
+        return query.order_by(Schedule.day, Schedule.hour).all()
+
+    def _apply_filters(self, query, academic_year: int | None, semester: str | None, cycle_type: str | None):
+        """Aplică filtrele de an academic, semestru și tip de ciclu doar dacă sunt specificate."""
         if academic_year is not None:
             query = query.filter(Schedule.academic_year == academic_year)
         if semester is not None:
             query = query.filter(Schedule.semester == semester)
         if cycle_type is not None:
             query = query.filter(Schedule.cycle_type == cycle_type)
-        
-        return query.order_by(Schedule.day, Schedule.hour).all()
+        return query
 
     def get_by_group_code(self, db: Session, group_code: str):
         """
@@ -61,6 +63,42 @@ class ScheduleRepository:
             .all()
         )
 
+    def get_by_professor(
+        self,
+        db: Session,
+        professor_id: int,
+        academic_year: int | None = None,
+        semester: str | None = None,
+        cycle_type: str | None = None,
+    ):
+        """
+        Orele unui profesor, inclusiv cele în care predă doar în săptămâna impară
+        (odd_week_professor_id). Ambele coloane sunt indexate.
+        """
+        query = self._base_query(db).filter(
+            or_(Schedule.professor_id == professor_id, Schedule.odd_week_professor_id == professor_id)
+        )
+        query = self._apply_filters(query, academic_year, semester, cycle_type)
+        return query.order_by(Schedule.day, Schedule.hour).all()
+
+    def get_by_room(
+        self,
+        db: Session,
+        room_id: int,
+        academic_year: int | None = None,
+        semester: str | None = None,
+        cycle_type: str | None = None,
+    ):
+        """
+        Orele dintr-o sală, inclusiv cele ținute acolo doar în săptămâna impară
+        (odd_week_room_id). Ambele coloane sunt indexate.
+        """
+        query = self._base_query(db).filter(
+            or_(Schedule.room_id == room_id, Schedule.odd_week_room_id == room_id)
+        )
+        query = self._apply_filters(query, academic_year, semester, cycle_type)
+        return query.order_by(Schedule.day, Schedule.hour).all()
+
     def get_by_id(self, db: Session, schedule_id: int):
         return self._base_query(db).filter(Schedule.id == schedule_id).first()
 
@@ -1,16 +1,66 @@
+import logging
+
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from models.group import Group
 from models.user import User, UserRole
 from models.user_group import UserGroup
 from core.security import get_password_hash
 
+logger = logging.getLogger(__name__)
+
+
+def normalize_username(username: str) -> str:
+    """Forma canonică a username-ului (email): fără spații la capete, lowercase."""
+    return username.strip().lower()
+
 
 class UserRepository:
     """Repository class responsible for all database operations related to users."""
 
-    def list(self, db: Session):
-        """Returnează toți utilizatorii cu grupele asociate."""
-        return db.query(User).order_by(User.username).all()
+    def _with_group_query(self, db: Session):
+        """
+        Query de bază care aduce utilizatorul împreună cu ID-ul și codul grupei
+        printr-un singur LEFT JOIN (fără interogări suplimentare per utilizator).
+        """
+        return (
+            db.query(User, UserGroup.group_id, Group.code)
+            .outerjoin(UserGroup, UserGroup.user_id == User.id)
+            .outerjoin(Group, Group.id == UserGroup.group_id)
+        )
+
+    def list(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int | None = None,
+        search: str | None = None,
+        role: str | UserRole | None = None,
+    ):
+        """
+        Returnează utilizatorii cu grupele asociate, într-o singură interogare.
+
+        Fiecare element este un tuplu (user, group_id, group_code).
+        Opțional: paginare (skip/limit), căutare după prefixul username-ului și filtrare după rol.
+        """
+        query = self._with_group_query(db)
+
+        if search:
+            # Escapează wildcard-urile LIKE pentru ca prefixul să fie căutat literal
+            prefix = search.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            query = query.filter(User.username.like(f"{prefix}%", escape="\\"))
+        if role is not None:
+            query = query.filter(User.role == (role if isinstance(role, UserRole) else UserRole(role)))
+
+        query = query.order_by(User.username).offset(skip)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def get_with_group(self, db: Session, user_id: int):
+        """Returnează (user, group_id, group_code) pentru un utilizator sau None."""
+        return self._with_group_query(db).filter(User.id == user_id).first()
     
     def get_user_group(self, db: Session, user_id: int):
         """Obține grupă asociată unui utilizator."""
@@ -34,8 +84,15 @@ class UserRepository:
             db.commit()
 
     def get_by_username(self, db: Session, username: str):
-        """Găsește un utilizator după username."""
-        return db.query(User).filter(User.username == username).first()
+        """
+        Găsește un utilizator după username (case-insensitive).
+        Filtrul pe lower(username) folosește indexul unic ix_users_username_lower.
+        """
+        return (
+            db.query(User)
+            .filter(func.lower(User.username) == normalize_username(username))
+            .first()
+        )
 
     def get_by_id(self, db: Session, user_id: int):
         """Găsește un utilizator după ID."""
@@ -65,7 +122,7 @@ class UserRepository:
             role = UserRole(role)
 
         new_user = User(
-            username=username.lower(),  # Normalizare email
+            username=normalize_username(username),  # Normalizare email
             password_hash=hashed_password,
             role=role,
             is_active=is_active
@@ -96,8 +153,10 @@ class UserRepository:
         if not user:
             return None
 
-        if username and username != user.username:
-            if self.get_by_username(db, username):
+        if username and normalize_username(username) != user.username:
+            username = normalize_username(username)
+            existing = self.get_by_username(db, username)
+            if existing and existing.id != user.id:
                 return None
             user.username = username
         if password:
@@ -127,6 +186,6 @@ class UserRepository:
             return user
         except Exception as e:
             db.rollback()
-            print(f"Eroare la ștergerea utilizatorului {user_id}: {str(e)}")
+            logger.error("Eroare la ștergerea utilizatorului %s: %s", user_id, e)
             raise
 
@@ -1,55 +1,83 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from sqlalchemy import inspect
-from typing import List
+from typing import Dict, List
+import asyncio
+import logging
 
-from core.dependencies import get_admin_user, get_db
-from core.database import Base, engine
-from core.websocket_manager import websocket_manager
+from core.dependencies import get_admin_user, get_db, get_read_db
+from core.response_cache import CALENDAR_NAMESPACE, response_cache
+from core.websocket_manager import Subscription, websocket_manager
+from models.assessment_schedule import parse_groups_composition
 from models.user import User
-from models.assessment_schedule import AssessmentSchedule
 from repositories.assessment_schedule_repository import AssessmentScheduleRepository
 from schemas.assessment_schedules import (
+    AssessmentScheduleBatchRequest,
+    AssessmentScheduleBatchResponse,
     AssessmentScheduleCreate,
     AssessmentScheduleResponse,
     AssessmentScheduleUpdate,
 )
 
-# Verifică și creează tabelele dacă nu există
-def ensure_tables_exist():
-    """Creează tabelele dacă nu există sau le actualizează dacă structura este veche."""
-    try:
-        inspector = inspect(engine)
-        table_names = inspector.get_table_names()
-        
-        if 'assessment_schedules' not in table_names:
-            print("⚠️ Tabelul assessment_schedules nu există. Se creează...")
-            Base.metadata.create_all(bind=engine, tables=[AssessmentSchedule.__table__])
-            print("✓ Tabelul assessment_schedules a fost creat!")
-        else:
-            # Verifică dacă tabelul are structura corectă
-            columns = [col['name'] for col in inspector.get_columns('assessment_schedules')]
-            required_columns = ['groups_composition', 'professor_name', 'assessment_date', 
-                              'assessment_time', 'room_code', 'academic_year', 'semester', 'cycle_type']
-            
-            missing_columns = [col for col in required_columns if col not in columns]
-            
-            if missing_columns:
-                print(f"⚠️ Tabelul assessment_schedules are structură veche (lipsesc: {missing_columns}). Se șterge și se recreează...")
-                # Șterge tabelul vechi
-                AssessmentSchedule.__table__.drop(engine, checkfirst=True)
-                # Creează tabelul cu noua structură
-                Base.metadata.create_all(bind=engine, tables=[AssessmentSchedule.__table__])
-                print("✓ Tabelul assessment_schedules a fost recreat cu noua structură!")
-    except Exception as e:
-        print(f"⚠️ Eroare la verificarea/crearea tabelelor: {str(e)}")
-        import traceback
-        traceback.print_exc()
+router = APIRouter(prefix="/assessment-schedules", tags=["Assessment Schedules"])
 
-# Verifică la import
-ensure_tables_exist()
+logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/assessment-schedules", tags=["Assessment Schedules"])
+
+def _broadcast_assessment_changes(
+    action: str,
+    upserted: List[AssessmentScheduleResponse],
+    previous_groups: Dict[int, List[str]] | None = None,
+):
+    """
+    Trimite modificările evaluărilor ca delte prin WebSocket (non-blocking).
+
+    Fiecare conexiune primește doar evaluările care o privesc: cele create/modificate care
+    se potrivesc abonamentului ei ajung în "upserted", iar cele șterse sau mutate în afara
+    abonamentului (după grupele avute înainte de modificare) ajung în "deleted".
+    Conexiunile fără abonament (ex: panoul admin) primesc toate modificările.
+
+    Args:
+        action: "create", "update", "delete" sau "batch"
+        upserted: Evaluările create sau actualizate
+        previous_groups: Grupele dinainte de modificare, pentru evaluările actualizate/șterse
+    """
+    previous_groups = previous_groups or {}
+    upserted_payload = [
+        (assessment, parse_groups_composition(assessment.groups_composition), assessment.model_dump(mode="json"))
+        for assessment in upserted
+    ]
+    upserted_ids = {assessment.id for assessment in upserted}
+    deleted_ids = [assessment_id for assessment_id in previous_groups if assessment_id not in upserted_ids]
+
+    def build_message(subscription: Subscription | None) -> dict | None:
+        if subscription is None:
+            items = [payload for _, _, payload in upserted_payload]
+            removed = deleted_ids
+        else:
+            items = []
+            visible_ids = set()
+            for assessment, group_codes, payload in upserted_payload:
+                if subscription.matches_groups(group_codes) and subscription.matches_slice(
+                    assessment.academic_year, assessment.semester
+                ):
+                    items.append(payload)
+                    visible_ids.add(assessment.id)
+            removed = [
+                assessment_id for assessment_id, group_codes in previous_groups.items()
+                if assessment_id not in visible_ids and subscription.matches_groups(group_codes)
+            ]
+        if not items and not removed:
+            return None
+        return {
+            "type": "assessment_schedule_update",
+            "action": action,
+            "upserted": items,
+            "deleted": removed,
+        }
+
+    asyncio.create_task(websocket_manager.broadcast_by_subscription(build_message))
 
 
 @router.get("/", response_model=List[AssessmentScheduleResponse])
@@ -57,10 +85,13 @@ def get_all_assessment_schedules(
     academic_year: int | None = None,
     semester: str | None = None,
     cycle_type: str | None = None,
-    db: Session = Depends(get_db),
+    date_from: date | None = Query(None, alias="from", description="Data de început (inclusiv), AAAA-LL-ZZ"),
+    date_to: date | None = Query(None, alias="to", description="Data de sfârșit (inclusiv), AAAA-LL-ZZ"),
+    db: Session = Depends(get_read_db),
 ):
     """
-    Obține toate evaluările periodice, opțional filtrate după an academic, semestru și tip de ciclu.
+    Obține toate evaluările periodice, opțional filtrate după an academic, semestru, tip de ciclu
+    și interval de date (?from=2024-01-15&to=2024-01-21).
     """
     try:
         repo = AssessmentScheduleRepository()
@@ -69,23 +100,45 @@ def get_all_assessment_schedules(
             academic_year=academic_year,
             semester=semester,
             cycle_type=cycle_type,
+            date_from=date_from,
+            date_to=date_to,
         )
         return [AssessmentScheduleResponse.model_validate(assessment) for assessment in assessments]
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"❌ Eroare la încărcarea evaluărilor periodice: {str(e)}")
-        print(f"Traceback: {error_trace}")
+        logger.exception("Eroare la încărcarea evaluărilor periodice")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Eroare la încărcarea evaluărilor periodice: {str(e)}",
         )
 
 
+@router.get("/by-group/{group_code}", response_model=List[AssessmentScheduleResponse])
+def get_assessment_schedules_by_group(
+    group_code: str,
+    academic_year: int | None = None,
+    semester: str | None = None,
+    cycle_type: str | None = None,
+    db: Session = Depends(get_read_db),
+):
+    """
+    Obține doar evaluările periodice ale unei grupe (ex: pentru clientul student),
+    opțional filtrate după an academic, semestru și tip de ciclu.
+    """
+    repo = AssessmentScheduleRepository()
+    assessments = repo.get_by_group_code(
+        db,
+        group_code,
+        academic_year=academic_year,
+        semester=semester,
+        cycle_type=cycle_type,
+    )
+    return [AssessmentScheduleResponse.model_validate(assessment) for assessment in assessments]
+
+
 @router.get("/{assessment_id}", response_model=AssessmentScheduleResponse)
 def get_assessment_schedule_by_id(
     assessment_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Obține o evaluare periodică după ID."""
     repo = AssessmentScheduleRepository()
@@ -109,15 +162,47 @@ async def create_assessment_schedule(
     """Creează o nouă evaluare periodică."""
     repo = AssessmentScheduleRepository()
     new_assessment = repo.create(db, item)
-    
-    # Emite WebSocket update (opțional - dacă vrei actualizare în timp real)
-    # await websocket_manager.broadcast({
-    #     "type": "assessment_schedule_update",
-    #     "action": "create",
-    #     "assessment": AssessmentScheduleResponse.model_validate(new_assessment).model_dump(),
-    # })
-    
-    return AssessmentScheduleResponse.model_validate(new_assessment)
+    response_cache.invalidate(CALENDAR_NAMESPACE)
+    serialized = AssessmentScheduleResponse.model_validate(new_assessment)
+
+    # Emite WebSocket update doar către abonații grupelor afectate
+    _broadcast_assessment_changes("create", [serialized])
+
+    return serialized
+
+
+@router.post("/batch", response_model=AssessmentScheduleBatchResponse)
+async def batch_assessment_schedules(
+    batch: AssessmentScheduleBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_admin_user),
+):
+    """
+    Aplică o diferență completă (creări, actualizări, ștergeri) pentru evaluările periodice
+    într-o singură tranzacție și trimite o singură notificare WebSocket.
+    Dacă o operație eșuează, nu se aplică nimic.
+    """
+    repo = AssessmentScheduleRepository()
+    # Grupele dinainte de modificare, pentru a anunța și abonații care pierd evaluarea
+    previous_groups = repo.get_group_codes(db, [item.id for item in batch.update] + list(batch.delete))
+    try:
+        created, updated, deleted_ids = repo.apply_batch(db, batch)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    response_cache.invalidate(CALENDAR_NAMESPACE)
+
+    result = AssessmentScheduleBatchResponse(
+        created=[AssessmentScheduleResponse.model_validate(assessment) for assessment in created],
+        updated=[AssessmentScheduleResponse.model_validate(assessment) for assessment in updated],
+        deleted=deleted_ids,
+    )
+
+    if created or updated or deleted_ids:
+        _broadcast_assessment_changes("batch", result.created + result.updated, previous_groups)
+
+    return result
 
 
 @router.put("/{assessment_id}", response_model=AssessmentScheduleResponse)
@@ -129,6 +214,7 @@ async def update_assessment_schedule(
 ):
     """Actualizează o evaluare periodică."""
     repo = AssessmentScheduleRepository()
+    previous_groups = repo.get_group_codes(db, [assessment_id])
     updated_assessment = repo.update(db, assessment_id, item)
 
     if not updated_assessment:
@@ -136,15 +222,14 @@ async def update_assessment_schedule(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Evaluarea periodică nu a fost găsită",
         )
+    response_cache.invalidate(CALENDAR_NAMESPACE)
+
+    serialized = AssessmentScheduleResponse.model_validate(updated_assessment)
 
-    # Emite WebSocket update (opțional)
-    # await websocket_manager.broadcast({
-    #     "type": "assessment_schedule_update",
-    #     "action": "update",
-    #     "assessment": AssessmentScheduleResponse.model_validate(updated_assessment).model_dump(),
-    # })
+    # Emite WebSocket update (inclusiv către grupele scoase din componența seriei)
+    _broadcast_assessment_changes("update", [serialized], previous_groups)
 
-    return AssessmentScheduleResponse.model_validate(updated_assessment)
+    return serialized
 
 
 @router.delete("/{assessment_id}", response_model=dict)
@@ -155,6 +240,7 @@ async def delete_assessment_schedule(
 ):
     """Șterge o evaluare periodică."""
     repo = AssessmentScheduleRepository()
+    previous_groups = repo.get_group_codes(db, [assessment_id])
     deleted_assessment = repo.delete(db, assessment_id)
 
     if not deleted_assessment:
@@ -162,12 +248,9 @@ async def delete_assessment_schedule(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Evaluarea periodică nu a fost găsită",
         )
+    response_cache.invalidate(CALENDAR_NAMESPACE)
 
-    # Emite WebSocket update (opțional)
-    # await websocket_manager.broadcast({
-    #     "type": "assessment_schedule_update",
-    #     "action": "delete",
-    #     "assessment_id": assessment_id,
-    # })
+    # Emite WebSocket update doar către abonații grupelor care aveau evaluarea
+    _broadcast_assessment_changes("delete", [], previous_groups)
 
     return {"message": f"Evaluarea periodică cu ID {assessment_id} a fost ștearsă cu succes!"}
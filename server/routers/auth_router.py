@@ -1,21 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
 from core.database import SessionLocal
 from core.dependencies import get_db, get_admin_user, get_current_user
-from core.security import verify_password, create_access_token
+from core.security import verify_password, create_access_token, is_argon2_pool_saturated
+from core.query_budget import query_budget
+from core.email_queue import EMAIL_QUEUE_MAX_PENDING, email_queue
+from core.rate_limit import enforce_rate_limit, shed_load_if
 from core.verification_service import (
     create_verification_code,
     verify_code,
-    increment_code_attempts
 )
 from models.user import UserRole, User
 from repositories.user_repository import UserRepository
-from repositories.group_repository import GroupRepository
 from schemas.users import UserCreate, UserLogin, UserResponse, Token
 from schemas.auth import (
     CheckEmailRequest,
     CheckEmailResponse,
+    EmailDeliveryStatusResponse,
     SendVerificationCodeRequest,
     SendVerificationCodeResponse,
     VerifyCodeAndSetPasswordRequest,
@@ -27,10 +29,12 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.post("/check-email", response_model=CheckEmailResponse)
-def check_email(request: CheckEmailRequest, db: Session = Depends(get_db)):
+def check_email(request: CheckEmailRequest, http_request: Request, db: Session = Depends(get_db)):
     """
     Verifică dacă un email există în baza de date și dacă utilizatorul are parolă setată.
     """
+    enforce_rate_limit(http_request, "check-email", request.email)
+
     user_repo = UserRepository()
     user = user_repo.get_by_username(db, request.email.lower())
 
@@ -58,10 +62,17 @@ def check_email(request: CheckEmailRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/send-verification-code", response_model=SendVerificationCodeResponse)
-def send_verification_code(request: SendVerificationCodeRequest, db: Session = Depends(get_db)):
+def send_verification_code(request: SendVerificationCodeRequest, http_request: Request, db: Session = Depends(get_db)):
     """
     Trimite un cod de verificare pe email pentru setarea parolei.
     """
+    shed_load_if(
+        email_queue.pending_count() >= EMAIL_QUEUE_MAX_PENDING,
+        "Serviciul de email este supraîncărcat. Te rugăm să încerci din nou în câteva momente.",
+        retry_after=30,
+    )
+    enforce_rate_limit(http_request, "send-verification-code", request.email)
+
     user_repo = UserRepository()
     user = user_repo.get_by_username(db, request.email.lower())
 
@@ -78,10 +89,11 @@ def send_verification_code(request: SendVerificationCodeRequest, db: Session = D
         )
 
     try:
-        create_verification_code(db, user.id, request.email.lower())
+        _, delivery_id = create_verification_code(db, user.id, request.email.lower())
         return SendVerificationCodeResponse(
             success=True,
-            message="Cod de verificare trimis cu succes pe email."
+            message="Codul de verificare a fost generat și este în curs de trimitere pe email.",
+            delivery_id=delivery_id,
         )
     except Exception as e:
         raise HTTPException(
@@ -90,15 +102,37 @@ def send_verification_code(request: SendVerificationCodeRequest, db: Session = D
         )
 
 
+@router.get("/verification-code-status/{delivery_id}", response_model=EmailDeliveryStatusResponse)
+def get_verification_code_status(delivery_id: str):
+    """
+    Returnează statusul livrării email-ului cu codul de verificare
+    (queued, sending, retrying, sent sau failed).
+    """
+    delivery = email_queue.get_status(delivery_id)
+    if not delivery:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Livrarea nu a fost găsită."
+        )
+    return EmailDeliveryStatusResponse(**delivery)
+
+
 @router.post("/verify-code-and-set-password", response_model=VerifyCodeAndSetPasswordResponse)
 def verify_code_and_set_password(
     request: VerifyCodeAndSetPasswordRequest,
+    http_request: Request,
     db: Session = Depends(get_db)
 ):
     """
     Verifică codul de verificare și setează parola pentru utilizator.
     După setarea parolei, returnează token JWT pentru login automat.
     """
+    shed_load_if(
+        is_argon2_pool_saturated(),
+        "Serverul este supraîncărcat. Te rugăm să încerci din nou în câteva momente.",
+    )
+    enforce_rate_limit(http_request, "verify-code", request.email)
+
     user_repo = UserRepository()
     user = user_repo.get_by_username(db, request.email.lower())
 
@@ -114,12 +148,10 @@ def verify_code_and_set_password(
             detail="Utilizatorul are deja parolă setată. Folosește login normal."
         )
 
-    # Verifică codul
+    # Verifică codul (încercările eșuate sunt contorizate în aceeași instrucțiune)
     is_valid, message = verify_code(db, user.id, request.code)
 
     if not is_valid:
-        # Incrementează numărul de încercări
-        increment_code_attempts(db, user.id, request.code)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=message
@@ -149,11 +181,17 @@ def verify_code_and_set_password(
 
 
 @router.post("/login", response_model=Token)
-def login(credentials: LoginRequest, db: Session = Depends(get_db)):
+def login(credentials: LoginRequest, http_request: Request, db: Session = Depends(get_db)):
     """
     Autentificare utilizator cu email și parolă.
     Funcționează doar pentru utilizatorii care au deja parolă setată.
     """
+    shed_load_if(
+        is_argon2_pool_saturated(),
+        "Serverul este supraîncărcat. Te rugăm să încerci din nou în câteva momente.",
+    )
+    enforce_rate_limit(http_request, "login", credentials.email)
+
     user_repo = UserRepository()
     user = user_repo.get_by_username(db, credentials.email.lower())
 
@@ -187,6 +225,7 @@ def login(credentials: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
+@query_budget(2)  # utilizatorul curent + grupa lui (join)
 def get_current_user_info(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -195,18 +234,9 @@ def get_current_user_info(
     Returnează informațiile utilizatorului curent, inclusiv grupa asociată (dacă există).
     Poate fi folosit de clientul student pentru a afla codul grupei proprii.
     """
-    user_repo = UserRepository()
-    group_repo = GroupRepository()
-
-    user_group = user_repo.get_user_group(db, current_user.id)
-    group_id = None
-    group_code = None
-
-    if user_group:
-        group_id = user_group.group_id
-        group = group_repo.get_by_id(db, group_id)
-        if group:
-            group_code = group.code
+    # Grupa asociată, într-o singură interogare (join user_groups + groups)
+    row = UserRepository().get_with_group(db, current_user.id)
+    group_id, group_code = (row[1], row[2]) if row else (None, None)
 
     return UserResponse(
         id=current_user.id,
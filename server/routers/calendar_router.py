@@ -0,0 +1,85 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session
+
+from core.calendar_feed import CALENDAR_REFRESH_MINUTES, render_calendar
+from core.dependencies import get_read_db
+from core.response_cache import CALENDAR_NAMESPACE, cached_response
+from models.group import Group
+from models.professor import Professor
+from repositories.assessment_schedule_repository import AssessmentScheduleRepository
+from repositories.room_repository import RoomRepository
+from repositories.schedule_repository import ScheduleRepository
+
+router = APIRouter(prefix="/calendar", tags=["Calendar"])
+
+CALENDAR_MEDIA_TYPE = "text/calendar; charset=utf-8"
+# Feed-urile sunt publice: proxy-urile/CDN-urile le pot păstra până la următoarea sondare
+CALENDAR_CACHE_CONTROL = f"public, max-age={CALENDAR_REFRESH_MINUTES * 60}"
+
+
+def _calendar_response(request: Request, key: tuple, build) -> Response:
+    return cached_response(request, CALENDAR_NAMESPACE, key, build, CALENDAR_MEDIA_TYPE, CALENDAR_CACHE_CONTROL)
+
+
+@router.get("/professor/{professor_id}.ics")
+def get_professor_calendar(
+    professor_id: int,
+    request: Request,
+    db: Session = Depends(get_read_db),
+):
+    """Feed iCalendar cu orele și evaluările unui profesor."""
+    def build() -> bytes:
+        professor = db.query(Professor).filter(Professor.id == professor_id).first()
+        if professor is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profesorul nu a fost găsit")
+        return render_calendar(
+            f"Orar {professor.full_name}",
+            schedules=ScheduleRepository().get_by_professor(db, professor_id),
+            assessments=AssessmentScheduleRepository().get_by_professor_name(db, professor.full_name),
+            professor_id=professor_id,
+        )
+
+    return _calendar_response(request, ("professor", professor_id), build)
+
+
+@router.get("/room/{room_code}.ics")
+def get_room_calendar(
+    room_code: str,
+    request: Request,
+    db: Session = Depends(get_read_db),
+):
+    """Feed iCalendar cu orele și evaluările dintr-o sală."""
+    def build() -> bytes:
+        room = RoomRepository().get_by_code(db, room_code)
+        if room is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Sala nu a fost găsită")
+        return render_calendar(
+            f"Orar sala {room.code}",
+            schedules=ScheduleRepository().get_by_room(db, room.id),
+            assessments=AssessmentScheduleRepository().get_by_room_code(db, room.code),
+            room_id=room.id,
+        )
+
+    return _calendar_response(request, ("room", room_code.strip()), build)
+
+
+@router.get("/{group_code}.ics")
+def get_group_calendar(
+    group_code: str,
+    request: Request,
+    db: Session = Depends(get_read_db),
+):
+    """
+    Feed iCalendar cu orarul unei grupe (ore recurente, cu alternanța pară/impară) și
+    evaluările periodice. Răspunsul este servit din cache, cu ETag.
+    """
+    def build() -> bytes:
+        if db.query(Group.id).filter(Group.code == group_code).first() is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Grupa nu a fost găsită")
+        return render_calendar(
+            f"Orar {group_code}",
+            schedules=ScheduleRepository().get_by_group_code(db, group_code),
+            assessments=AssessmentScheduleRepository().get_by_group_code(db, group_code),
+        )
+
+    return _calendar_response(request, ("group", group_code), build)
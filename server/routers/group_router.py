@@ -3,7 +3,8 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from core.dependencies import get_admin_user, get_current_user, get_db
+from core.dependencies import get_admin_user, get_current_user, get_db, get_read_db
+from core.response_cache import SCHEDULE_NAMESPACE, response_cache
 from models.user import User
 from repositories.group_repository import GroupRepository
 from schemas.reference import GroupCreate, GroupResponse, GroupUpdate
@@ -14,7 +15,7 @@ repo = GroupRepository()
 
 @router.get("/", response_model=List[GroupResponse])
 def list_groups(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     return repo.get_all(db)
@@ -23,7 +24,7 @@ def list_groups(
 @router.get("/{group_id}", response_model=GroupResponse)
 def get_group(
     group_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     group = repo.get_by_id(db, group_id)
@@ -51,6 +52,7 @@ def update_group(
     group = repo.update(db, group_id, payload)
     if not group:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Grupa nu a fost găsită")
+    response_cache.invalidate(SCHEDULE_NAMESPACE)
     return group
 
 
@@ -63,5 +65,6 @@ def delete_group(
     group = repo.delete(db, group_id)
     if not group:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Grupa nu a fost găsită")
+    response_cache.invalidate(SCHEDULE_NAMESPACE)
     return {"message": f"Grupa cu ID {group_id} a fost ștearsă cu succes"}
 
@@ -0,0 +1,20 @@
+"""
+Endpoint pentru scrape-ul Prometheus.
+"""
+import secrets
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from core.metrics import CONTENT_TYPE, METRICS_TOKEN, registry
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics(request: Request):
+    """Metricile procesului curent, în formatul text Prometheus."""
+    if METRICS_TOKEN:
+        authorization = request.headers.get("Authorization", "")
+        if not secrets.compare_digest(authorization, f"Bearer {METRICS_TOKEN}"):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token de metrici invalid")
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
@@ -1,16 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
+from types import SimpleNamespace
 from typing import List
 import asyncio
+import logging
 
-from core.dependencies import get_admin_user, get_db
+from core.dependencies import get_admin_user, get_db, get_read_db
+from core.read_routing import should_read_primary
+from core.response_cache import SCHEDULE_NAMESPACE, cached_json_response, response_cache
+from core.schedule_conflicts import (
+    RESOURCE_PROFESSOR,
+    RESOURCE_ROOM,
+    SCHEDULE_CONFLICT_MODE,
+    SlotConflict,
+    schedule_conflict_index,
+)
 from core.websocket_manager import websocket_manager
+from models.professor import Professor
+from models.room import Room
+from models.schedule import Schedule
 from models.user import User
+from repositories.room_repository import RoomRepository
 from repositories.schedule_repository import ScheduleRepository
-from schemas.schedules import ScheduleCreate, ScheduleResponse, ScheduleUpdate
+from schemas.schedules import (
+    ScheduleConflictResponse,
+    ScheduleCreate,
+    ScheduleResponse,
+    ScheduleSolveRequest,
+    ScheduleSolveResponse,
+    ScheduleUpdate,
+)
 
 router = APIRouter(prefix="/schedule", tags=["Schedule"])
 
+logger = logging.getLogger(__name__)
+
 
 async def _broadcast_schedule_update(action: str, schedule: ScheduleResponse = None, all_schedules: List[ScheduleResponse] = None):
     """
@@ -43,32 +67,97 @@ def _serialize_schedule(schedule) -> ScheduleResponse:
         return ScheduleResponse.model_validate(schedule)
     except Exception as e:
         # Log eroarea pentru debugging
-        print(f"Eroare la serializarea schedule-ului cu ID {schedule.id}: {str(e)}")
+        logger.warning("Eroare la serializarea schedule-ului cu ID %s: %s", schedule.id, e)
         raise ValueError(f"Eroare la serializarea datelor pentru schedule ID {schedule.id}: {str(e)}")
 
 
+def _serialize_schedules(schedules) -> List[ScheduleResponse]:
+    """Serializează o listă de ore, sărind peste cele care nu pot fi serializate."""
+    result = []
+    for s in schedules:
+        try:
+            result.append(_serialize_schedule(s))
+        except Exception:
+            # Sare peste schedule-urile care nu pot fi serializate (eroarea este deja logată)
+            continue
+    return result
+
+
+def _serialize_conflicts(db: Session, conflicts: List[SlotConflict]) -> List[ScheduleConflictResponse]:
+    """Adaugă numele resurselor (codul sălii / numele profesorului) cu câte o interogare."""
+    room_ids = {c.resource_id for c in conflicts if c.resource_type == RESOURCE_ROOM}
+    professor_ids = {c.resource_id for c in conflicts if c.resource_type == RESOURCE_PROFESSOR}
+    names = {}
+    if room_ids:
+        names.update({
+            (RESOURCE_ROOM, room_id): code
+            for room_id, code in db.query(Room.id, Room.code).filter(Room.id.in_(room_ids))
+        })
+    if professor_ids:
+        names.update({
+            (RESOURCE_PROFESSOR, professor_id): full_name
+            for professor_id, full_name in db.query(Professor.id, Professor.full_name).filter(Professor.id.in_(professor_ids))
+        })
+    return [
+        ScheduleConflictResponse(
+            resource_type=c.resource_type,
+            resource_id=c.resource_id,
+            resource_name=names.get((c.resource_type, c.resource_id)),
+            day=c.day,
+            hour=c.hour,
+            parity=c.parity,
+            schedule_ids=c.schedule_ids,
+        )
+        for c in conflicts
+    ]
+
+
+def _check_conflicts(db: Session, request: Request, response: Response, candidate, schedule_id: int | None = None):
+    """
+    Verifică suprapunerile pentru o scriere, conform SCHEDULE_CONFLICT_MODE:
+    "reject" - 409 cu lista suprapunerilor, "warn" - header X-Schedule-Conflicts, "off" - nimic.
+    Scrierile succesive ale unui admin (read-your-writes) se verifică pe un index proaspăt,
+    pentru că scrierea anterioară poate să fi fost făcută de alt worker.
+    """
+    if SCHEDULE_CONFLICT_MODE == "off":
+        return
+    conflicts = schedule_conflict_index.check(db, candidate, schedule_id, fresh=should_read_primary(request))
+    if not conflicts:
+        return
+    if SCHEDULE_CONFLICT_MODE == "reject":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "message": "Sala sau profesorul este deja ocupat în acest interval",
+                "conflicts": [c.model_dump() for c in _serialize_conflicts(db, conflicts)],
+            },
+        )
+    response.headers["X-Schedule-Conflicts"] = str(len(conflicts))
+    logger.warning("Scriere cu %d suprapuneri de sală/profesor (schedule ID %s)", len(conflicts), schedule_id)
+
+
 @router.get("/", response_model=List[ScheduleResponse])
 def get_all_schedules(
+    request: Request,
     academic_year: int | None = None,
     semester: str | None = None,
     cycle_type: str | None = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Obține toate schedule-urile, opțional filtrate după an academic, semestru și tip de ciclu.
+    Răspunsul vine din cache, cu ETag (304 dacă clientul are deja versiunea curentă).
     """
     try:
         repo = ScheduleRepository()
-        schedules = repo.get_all(db, academic_year=academic_year, semester=semester, cycle_type=cycle_type)
-        result = []
-        for s in schedules:
-            try:
-                result.append(_serialize_schedule(s))
-            except Exception as e:
-                # Sare peste schedule-urile care nu pot fi serializate și continuă cu restul
-                print(f"Eroare la serializarea schedule-ului cu ID {s.id}: {str(e)}")
-                continue
-        return result
+        return cached_json_response(
+            request,
+            SCHEDULE_NAMESPACE,
+            ("all", academic_year, semester, cycle_type),
+            lambda: _serialize_schedules(
+                repo.get_all(db, academic_year=academic_year, semester=semester, cycle_type=cycle_type)
+            ),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -76,34 +165,109 @@ def get_all_schedules(
         )
 
 
+@router.get("/conflicts", response_model=List[ScheduleConflictResponse])
+def get_schedule_conflicts(
+    request: Request,
+    semester: str | None = None,
+    cycle_type: str | None = None,
+    academic_year: int | None = None,
+    db: Session = Depends(get_db),  # indexul se construiește doar de pe primar
+    current_user: User = Depends(get_admin_user),
+):
+    """
+    Suprapunerile de sală și profesor (zi, oră, săptămână pară/impară) dintr-un semestru, peste
+    toți anii și toate tipurile de ciclu. Fără `semester`, raportează toate semestrele.
+    Cu `academic_year` sau `cycle_type`, doar suprapunerile care implică o oră din acel an/ciclu.
+    """
+    conflicts = schedule_conflict_index.find_conflicts(
+        db,
+        semester=semester,
+        cycle_type=cycle_type,
+        academic_year=academic_year,
+        all_domains=semester is None,
+        fresh=should_read_primary(request),
+    )
+    return _serialize_conflicts(db, conflicts)
+
+
+@router.get("/professor/{professor_id}", response_model=List[ScheduleResponse])
+def get_schedule_by_professor(
+    professor_id: int,
+    request: Request,
+    academic_year: int | None = None,
+    semester: str | None = None,
+    cycle_type: str | None = None,
+    db: Session = Depends(get_read_db),
+):
+    """Orarul unui profesor, inclusiv orele în care predă doar în săptămâna impară."""
+    def build():
+        if db.query(Professor.id).filter(Professor.id == professor_id).first() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Profesorul nu a fost găsit",
+            )
+        repo = ScheduleRepository()
+        return _serialize_schedules(
+            repo.get_by_professor(db, professor_id, academic_year=academic_year, semester=semester, cycle_type=cycle_type)
+        )
+
+    return cached_json_response(
+        request, SCHEDULE_NAMESPACE, ("professor", professor_id, academic_year, semester, cycle_type), build
+    )
+
+
+@router.get("/room/{room_code}", response_model=List[ScheduleResponse])
+def get_schedule_by_room(
+    room_code: str,
+    request: Request,
+    academic_year: int | None = None,
+    semester: str | None = None,
+    cycle_type: str | None = None,
+    db: Session = Depends(get_read_db),
+):
+    """Orarul unei săli, inclusiv orele ținute acolo doar în săptămâna impară."""
+    def build():
+        room = RoomRepository().get_by_code(db, room_code)
+        if room is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Sala nu a fost găsită",
+            )
+        repo = ScheduleRepository()
+        return _serialize_schedules(
+            repo.get_by_room(db, room.id, academic_year=academic_year, semester=semester, cycle_type=cycle_type)
+        )
+
+    return cached_json_response(
+        request, SCHEDULE_NAMESPACE, ("room", room_code.strip(), academic_year, semester, cycle_type), build
+    )
+
+
 @router.get("/{group_code}", response_model=List[ScheduleResponse])
 def get_schedule_by_group(
     group_code: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: Session = Depends(get_read_db),
 ):
     try:
         repo = ScheduleRepository()
-        schedules = repo.get_by_group_code(db, group_code)
-        result = []
-        for s in schedules:
-            try:
-                result.append(_serialize_schedule(s))
-            except Exception as e:
-                # Sare peste schedule-urile care nu pot fi serializate și continuă cu restul
-                print(f"Eroare la serializarea schedule-ului cu ID {s.id}: {str(e)}")
-                continue
-        return result
+        return cached_json_response(
+            request,
+            SCHEDULE_NAMESPACE,
+            ("group", group_code),
+            lambda: _serialize_schedules(repo.get_by_group_code(db, group_code)),
+        )
     except Exception as e:
         # Dacă grupul nu există sau nu are schedule-uri, returnează o listă goală
         # în loc de o eroare 500
-        print(f"Eroare la încărcarea orarului pentru grupul {group_code}: {str(e)}")
+        logger.warning("Eroare la încărcarea orarului pentru grupul %s: %s", group_code, e)
         return []
 
 
 @router.get("/id/{schedule_id}", response_model=ScheduleResponse)
 def get_schedule_by_id(
     schedule_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     repo = ScheduleRepository()
     schedule = repo.get_by_id(db, schedule_id)
@@ -120,11 +284,16 @@ def get_schedule_by_id(
 @router.post("/", response_model=ScheduleResponse, status_code=status.HTTP_201_CREATED)
 async def add_schedule(
     item: ScheduleCreate,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_admin_user),
 ):
     repo = ScheduleRepository()
+    _check_conflicts(db, request, response, item)
     new_schedule = repo.create(db, item)
+    schedule_conflict_index.record(new_schedule)
+    response_cache.invalidate(SCHEDULE_NAMESPACE)
     serialized = _serialize_schedule(new_schedule)
     
     # Emite WebSocket update
@@ -137,10 +306,24 @@ async def add_schedule(
 async def update_schedule(
     schedule_id: int,
     item: ScheduleUpdate,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_admin_user),
 ):
     repo = ScheduleRepository()
+
+    if SCHEDULE_CONFLICT_MODE != "off":
+        existing = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+        if existing is not None:
+            # Starea după actualizare: câmpurile trimise (non-None) peste cele existente
+            changes = item.model_dump(exclude_none=True)
+            candidate = SimpleNamespace(**{
+                column.key: changes.get(column.key, getattr(existing, column.key))
+                for column in Schedule.__table__.columns
+            })
+            _check_conflicts(db, request, response, candidate, schedule_id)
+
     updated_schedule = repo.update(db, schedule_id, item)
 
     if not updated_schedule:
@@ -149,6 +332,9 @@ async def update_schedule(
             detail="Cursul nu a fost găsit",
         )
 
+    schedule_conflict_index.record(updated_schedule)
+    response_cache.invalidate(SCHEDULE_NAMESPACE)
+
     serialized = _serialize_schedule(updated_schedule)
     
     # Emite WebSocket update
@@ -176,6 +362,9 @@ async def delete_schedule(
             detail="Cursul nu a fost găsit",
         )
 
+    schedule_conflict_index.forget(schedule_id)
+    response_cache.invalidate(SCHEDULE_NAMESPACE)
+
     # Emite WebSocket update cu datele schedule-ului șters
     if schedule_to_delete:
         serialized = _serialize_schedule(schedule_to_delete)
@@ -184,6 +373,44 @@ async def delete_schedule(
     return {"message": f"Cursul cu ID {schedule_id} a fost șters cu succes!"}
 
 
+@router.post("/solve", response_model=ScheduleSolveResponse)
+def solve_schedule(
+    request: ScheduleSolveRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_admin_user),
+):
+    """
+    Propune zi, interval și sală pentru orele încă neprogramate, fără a scrie nimic în baza de date.
+    Ciorna (în formatul ScheduleCreate) se aplică din grila de administrare, la salvare.
+    """
+    # Importat la primul apel: solver-ul (și multiprocessing) nu sunt necesari la pornirea worker-ului
+    from core.timetable_solver import build_draft, build_problem, solve_timetable
+
+    try:
+        problem = build_problem(db, request)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    try:
+        solution = solve_timetable(problem, request.time_limit_seconds, request.seed)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+    logger.info(
+        "Solver orar: %d ore, cost %s, %d iterații în %.1fs (%d procese)",
+        len(problem.units), solution.cost, solution.iterations, solution.elapsed_seconds, solution.workers,
+    )
+    return ScheduleSolveResponse(
+        draft=build_draft(problem, solution, request),
+        sessions=len(problem.units),
+        cost=solution.cost,
+        iterations=solution.iterations,
+        workers=solution.workers,
+        elapsed_seconds=round(solution.elapsed_seconds, 3),
+        **solution.breakdown,
+    )
+
+
 @router.post("/refresh-all", response_model=dict)
 async def refresh_all_schedules(
     db: Session = Depends(get_db),
@@ -194,15 +421,8 @@ async def refresh_all_schedules(
     Utilizat după operații batch pentru a actualiza toți clienții dintr-o dată.
     """
     repo = ScheduleRepository()
-    schedules = repo.get_all(db)
-    all_schedules = []
-    for s in schedules:
-        try:
-            all_schedules.append(_serialize_schedule(s))
-        except Exception as e:
-            print(f"Eroare la serializarea schedule-ului cu ID {s.id}: {str(e)}")
-            continue
-    
+    all_schedules = _serialize_schedules(repo.get_all(db))
+
     await _broadcast_schedule_update("refresh_all", all_schedules=all_schedules)
     
     return {"message": f"Refresh trimis către {websocket_manager.get_connection_count()} clienți", "schedules_count": len(all_schedules)}
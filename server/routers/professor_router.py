@@ -1,9 +1,12 @@
-from typing import List
+from typing import List, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
-from core.dependencies import get_admin_user, get_current_user, get_db
+from core.availability import find_available_professors, professor_catalog
+from core.dependencies import get_admin_user, get_current_user, get_db, get_read_db
+from core.read_routing import should_read_primary
+from core.response_cache import SCHEDULE_NAMESPACE, response_cache
 from models.user import User
 from repositories.professor_repository import ProfessorRepository
 from schemas.reference import ProfessorCreate, ProfessorResponse, ProfessorUpdate
@@ -14,16 +17,40 @@ repo = ProfessorRepository()
 
 @router.get("/", response_model=List[ProfessorResponse])
 def list_professors(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     return repo.get_all(db)
 
 
+@router.get("/available", response_model=List[ProfessorResponse])
+def list_available_professors(
+    request: Request,
+    day: str = Query(..., description="Ziua (ex: Marți)"),
+    hour: str = Query(..., description="Intervalul (ex: 11.30-13.00) sau începutul lui (ex: 11:30)"),
+    parity: Literal["even", "odd"] | None = Query(None, description="Săptămâna pară/impară; implicit ambele"),
+    semester: str = Query(..., description="Semestrul (ex: semester1)"),
+    db: Session = Depends(get_db),  # indexul de ocupare se construiește doar de pe primar
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Profesorii liberi într-un slot al semestrului (peste toți anii și toate tipurile de ciclu).
+    Fără `parity`, doar cei liberi atât în săptămâna pară, cât și în cea impară.
+    """
+    return find_available_professors(
+        db,
+        day=day,
+        hour=hour,
+        parity=parity,
+        semester=semester,
+        fresh=should_read_primary(request),
+    )
+
+
 @router.get("/{professor_id}", response_model=ProfessorResponse)
 def get_professor(
     professor_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     professor = repo.get_by_id(db, professor_id)
@@ -38,7 +65,9 @@ def create_professor(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_admin_user),
 ):
-    return repo.create(db, payload)
+    created = repo.create(db, payload)
+    professor_catalog.invalidate()
+    return created
 
 
 @router.put("/{professor_id}", response_model=ProfessorResponse)
@@ -51,6 +80,8 @@ def update_professor(
     professor = repo.update(db, professor_id, payload)
     if not professor:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profesorul nu a fost găsit")
+    professor_catalog.invalidate()
+    response_cache.invalidate(SCHEDULE_NAMESPACE)
     return professor
 
 
@@ -63,5 +94,7 @@ def delete_professor(
     professor = repo.delete(db, professor_id)
     if not professor:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profesorul nu a fost găsit")
+    professor_catalog.invalidate()
+    response_cache.invalidate(SCHEDULE_NAMESPACE)
     return {"message": f"Profesorul cu ID {professor_id} a fost șters cu succes"}
 
@@ -0,0 +1,62 @@
+"""
+Router pentru profilarea la cerere a worker-ului (doar admin).
+"""
+from typing import List, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from core.dependencies import get_admin_user
+from core.profiler import (
+    PROFILER_INTERVAL_MS,
+    PROFILER_MAX_SECONDS,
+    profile_worker,
+    request_profiles,
+)
+
+router = APIRouter(prefix="/profiling", tags=["Profiling"])
+
+
+@router.post("/worker", response_class=PlainTextResponse)
+def profile_current_worker(
+    seconds: float = Query(10, gt=0, le=PROFILER_MAX_SECONDS),
+    mode: Literal["wall", "cpu"] = "wall",
+    interval_ms: float = Query(PROFILER_INTERVAL_MS, ge=1, le=100),
+    include_idle: bool = Query(False, description="Include thread-urile inactive (așteptări în cozi, lock-uri, select)"),
+    current_user=Depends(get_admin_user),
+):
+    """
+    Profilează worker-ul care tratează cererea timp de `seconds` secunde și întoarce stivele
+    în formatul folded (flamegraph.pl / speedscope). Cu mai mulți workeri, se profilează doar
+    cel care primește cererea.
+    """
+    try:
+        output, summary = profile_worker(seconds, mode, interval_ms, include_idle)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return PlainTextResponse(
+        output,
+        headers={
+            "X-Profile-Mode": summary["mode"],
+            "X-Profile-Samples": str(summary["samples"]),
+            "X-Profile-Ticks": str(summary["ticks"]),
+            "X-Profile-Elapsed-Seconds": str(summary["elapsed_seconds"]),
+        },
+    )
+
+
+@router.get("/requests", response_model=List[dict])
+def list_request_profiles(current_user=Depends(get_admin_user)):
+    """Ultimele request-uri profilate cu header-ul X-Profile (în acest worker)."""
+    return request_profiles.list()
+
+
+@router.get("/requests/{profile_id}", response_class=PlainTextResponse)
+def get_request_profile(profile_id: str, current_user=Depends(get_admin_user)):
+    """Stivele unui request profilat, în formatul folded."""
+    entry = request_profiles.get(profile_id)
+    if entry is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profilul nu a fost găsit")
+    return PlainTextResponse(entry["folded"])
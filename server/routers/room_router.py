@@ -1,9 +1,12 @@
-from typing import List
+from typing import List, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
-from core.dependencies import get_admin_user, get_current_user, get_db
+from core.availability import find_available_rooms, room_catalog
+from core.dependencies import get_admin_user, get_current_user, get_db, get_read_db
+from core.read_routing import should_read_primary
+from core.response_cache import SCHEDULE_NAMESPACE, response_cache
 from models.user import User
 from repositories.room_repository import RoomRepository
 from schemas.reference import RoomCreate, RoomResponse, RoomUpdate
@@ -14,16 +17,43 @@ repo = RoomRepository()
 
 @router.get("/", response_model=List[RoomResponse])
 def list_rooms(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     return repo.get_all(db)
 
 
+@router.get("/available", response_model=List[RoomResponse])
+def list_available_rooms(
+    request: Request,
+    day: str = Query(..., description="Ziua (ex: Marți)"),
+    hour: str = Query(..., description="Intervalul (ex: 11.30-13.00) sau începutul lui (ex: 11:30)"),
+    parity: Literal["even", "odd"] | None = Query(None, description="Săptămâna pară/impară; implicit ambele"),
+    semester: str = Query(..., description="Semestrul (ex: semester1)"),
+    min_capacity: int | None = Query(None, ge=0, description="Capacitatea minimă a sălii"),
+    db: Session = Depends(get_db),  # indexul de ocupare se construiește doar de pe primar
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Sălile libere într-un slot al semestrului (peste toți anii și toate tipurile de ciclu),
+    opțional doar cele cu capacitatea cel puțin `min_capacity`, ordonate descrescător după capacitate.
+    Fără `parity`, doar sălile libere atât în săptămâna pară, cât și în cea impară.
+    """
+    return find_available_rooms(
+        db,
+        day=day,
+        hour=hour,
+        parity=parity,
+        semester=semester,
+        fresh=should_read_primary(request),
+        min_capacity=min_capacity,
+    )
+
+
 @router.get("/{room_id}", response_model=RoomResponse)
 def get_room(
     room_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     room = repo.get_by_id(db, room_id)
@@ -38,7 +68,9 @@ def create_room(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_admin_user),
 ):
-    return repo.create(db, payload)
+    created = repo.create(db, payload)
+    room_catalog.invalidate()
+    return created
 
 
 @router.put("/{room_id}", response_model=RoomResponse)
@@ -51,6 +83,8 @@ def update_room(
     room = repo.update(db, room_id, payload)
     if not room:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Sala nu a fost găsită")
+    room_catalog.invalidate()
+    response_cache.invalidate(SCHEDULE_NAMESPACE)
     return room
 
 
@@ -63,5 +97,7 @@ def delete_room(
     room = repo.delete(db, room_id)
     if not room:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Sala nu a fost găsită")
+    room_catalog.invalidate()
+    response_cache.invalidate(SCHEDULE_NAMESPACE)
     return {"message": f"Sala cu ID {room_id} a fost ștearsă cu succes"}
 
@@ -4,9 +4,11 @@ Router pentru notificări de modificări ale orarului.
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List, Set
+import logging
 from pydantic import BaseModel
 
 from core.dependencies import get_admin_user, get_db
+from core.query_budget import query_budget
 from models.user import User
 from repositories.schedule_repository import ScheduleRepository
 from repositories.group_repository import GroupRepository
@@ -15,6 +17,8 @@ from schemas.schedules import ScheduleCreate
 
 router = APIRouter(prefix="/schedule/notifications", tags=["Schedule Notifications"])
 
+logger = logging.getLogger(__name__)
+
 
 class BatchScheduleNotificationRequest(BaseModel):
     """Request pentru notificări în batch după modificarea orarului."""
@@ -22,6 +26,7 @@ class BatchScheduleNotificationRequest(BaseModel):
 
 
 @router.post("/batch")
+@query_budget(3)  # admin + grupe + studenți, indiferent de numărul de grupe
 def notify_batch_schedule_changes(
     request: BatchScheduleNotificationRequest,
     db: Session = Depends(get_db),
@@ -52,7 +57,7 @@ def notify_batch_schedule_changes(
             **results
         }
     except Exception as e:
-        print(f"Eroare la trimiterea notificărilor: {str(e)}")
+        logger.exception("Eroare la trimiterea notificărilor")
         raise HTTPException(
             status_code=500,
             detail=f"Eroare la trimiterea notificărilor: {str(e)}"
@@ -3,7 +3,8 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from core.dependencies import get_admin_user, get_current_user, get_db
+from core.dependencies import get_admin_user, get_current_user, get_db, get_read_db
+from core.response_cache import SCHEDULE_NAMESPACE, response_cache
 from models.user import User
 from repositories.subject_repository import SubjectRepository
 from schemas.reference import SubjectCreate, SubjectResponse, SubjectUpdate
@@ -14,7 +15,7 @@ repo = SubjectRepository()
 
 @router.get("/", response_model=List[SubjectResponse])
 def list_subjects(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     return repo.get_all(db)
@@ -23,7 +24,7 @@ def list_subjects(
 @router.get("/{subject_id}", response_model=SubjectResponse)
 def get_subject(
     subject_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     subject = repo.get_by_id(db, subject_id)
@@ -51,6 +52,7 @@ def update_subject(
     subject = repo.update(db, subject_id, payload)
     if not subject:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Disciplina nu a fost găsită")
+    response_cache.invalidate(SCHEDULE_NAMESPACE)
     return subject
 
 
@@ -63,5 +65,6 @@ def delete_subject(
     subject = repo.delete(db, subject_id)
     if not subject:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Disciplina nu a fost găsită")
+    response_cache.invalidate(SCHEDULE_NAMESPACE)
     return {"message": f"Disciplina cu ID {subject_id} a fost ștearsă cu succes"}
 
@@ -1,30 +1,23 @@
+import logging
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from core.dependencies import get_admin_user, get_db
+from core.query_budget import query_budget
+from models.user import UserRole
 from repositories.user_repository import UserRepository
-from repositories.group_repository import GroupRepository
 from schemas.users import UserCreate, UserResponse, UserUpdate
 
 router = APIRouter(prefix="/users", tags=["Users"])
 repo = UserRepository()
-group_repo = GroupRepository()
 
+logger = logging.getLogger(__name__)
 
-def _serialize_user_response(user, db: Session) -> UserResponse:
-    """Helper pentru a serializa un user cu informații despre grupă."""
-    user_group = repo.get_user_group(db, user.id)
-    group_id = None
-    group_code = None
-    
-    if user_group:
-        group_id = user_group.group_id
-        group = group_repo.get_by_id(db, group_id)
-        if group:
-            group_code = group.code
-    
+
+def _build_user_response(user, group_id: int | None, group_code: str | None) -> UserResponse:
+    """Construiește răspunsul pentru un user din datele deja încărcate (fără interogări)."""
     return UserResponse(
         id=user.id,
         username=user.username,
@@ -34,13 +27,27 @@ def _serialize_user_response(user, db: Session) -> UserResponse:
     )
 
 
+def _serialize_user_response(user, db: Session) -> UserResponse:
+    """Helper pentru a serializa un user cu informații despre grupă (o singură interogare)."""
+    row = repo.get_with_group(db, user.id)
+    if row is None:
+        return _build_user_response(user, None, None)
+    _, group_id, group_code = row
+    return _build_user_response(user, group_id, group_code)
+
+
 @router.get("/", response_model=List[UserResponse])
+@query_budget(2)  # utilizatorul curent + lista cu grupe (join)
 def list_users(
+    skip: int = Query(0, ge=0),
+    limit: int | None = Query(None, ge=1, le=1000),
+    search: str | None = Query(None, description="Prefixul username-ului (email)"),
+    role: UserRole | None = None,
     db: Session = Depends(get_db),
     current_user=Depends(get_admin_user),
 ):
-    users = repo.list(db)
-    return [_serialize_user_response(user, db) for user in users]
+    rows = repo.list(db, skip=skip, limit=limit, search=search, role=role)
+    return [_build_user_response(user, group_id, group_code) for user, group_id, group_code in rows]
 
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -113,7 +120,7 @@ def delete_user(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Eroare la ștergerea utilizatorului {user_id}: {str(e)}")
+        logger.exception("Eroare la ștergerea utilizatorului %s", user_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Eroare la ștergerea utilizatorului: {str(e)}"
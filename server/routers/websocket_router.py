@@ -4,11 +4,14 @@ Router WebSocket pentru actualizări în timp real ale orarului.
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from typing import Optional
 import json
+import logging
 
-from core.websocket_manager import websocket_manager
+from core.websocket_manager import Subscription, websocket_manager
 
 router = APIRouter(prefix="/ws", tags=["WebSocket"])
 
+logger = logging.getLogger(__name__)
+
 
 @router.websocket("/schedule")
 async def websocket_schedule_endpoint(websocket: WebSocket):
@@ -27,6 +30,17 @@ async def websocket_schedule_endpoint(websocket: WebSocket):
         "schedule": { /* Schedule object */ },
         "all_schedules": [ /* Toate schedule-urile (doar pentru refresh_all) */ ]
     }
+    {
+        "type": "assessment_schedule_update",
+        "action": "create|update|delete|batch",
+        "upserted": [ /* Evaluări create/modificate */ ],
+        "deleted": [ /* ID-uri de eliminat din starea locală */ ]
+    }
+
+    Clientul se poate abona la evaluările anumitor grupe (și, opțional, ale unui an/semestru);
+    fără abonament primește toate modificările:
+    {"type": "subscribe", "groups": ["TI-221"], "academic_year": 2, "semester": "assessments1"}
+    {"type": "unsubscribe"}
     """
     await websocket_manager.connect(websocket)
     
@@ -50,17 +64,53 @@ async def websocket_schedule_endpoint(websocket: WebSocket):
                     await websocket_manager.send_personal_message({
                         "type": "pong"
                     }, websocket)
+                elif data.startswith("{"):
+                    await _handle_client_message(websocket, data)
                     
             except WebSocketDisconnect:
                 break
             except Exception as e:
-                print(f"✗ Eroare la primirea mesajului WebSocket: {str(e)}")
+                logger.warning("Eroare la primirea mesajului WebSocket: %s", e)
                 break
                 
     except WebSocketDisconnect:
         pass
     except Exception as e:
-        print(f"✗ Eroare WebSocket: {str(e)}")
+        logger.warning("Eroare WebSocket: %s", e)
     finally:
         await websocket_manager.disconnect(websocket)
 
+
+
+async def _handle_client_message(websocket: WebSocket, data: str):
+    """Procesează mesajele JSON de la client (abonare/dezabonare)."""
+    try:
+        message = json.loads(data)
+    except json.JSONDecodeError:
+        await websocket_manager.send_personal_message({"type": "error", "message": "Mesaj JSON invalid"}, websocket)
+        return
+
+    message_type = message.get("type") if isinstance(message, dict) else None
+    if message_type == "subscribe":
+        groups = message.get("groups") or []
+        academic_year = message.get("academic_year")
+        semester = message.get("semester")
+        if (
+            not isinstance(groups, list)
+            or not all(isinstance(code, str) for code in groups)
+            or (academic_year is not None and not isinstance(academic_year, int))
+            or (semester is not None and not isinstance(semester, str))
+        ):
+            await websocket_manager.send_personal_message({"type": "error", "message": "Abonament invalid"}, websocket)
+            return
+        subscription = Subscription(groups=groups, academic_year=academic_year, semester=semester)
+        websocket_manager.subscribe(websocket, subscription)
+        await websocket_manager.send_personal_message({
+            "type": "subscribed",
+            "groups": sorted(subscription.groups or []),
+            "academic_year": subscription.academic_year,
+            "semester": subscription.semester,
+        }, websocket)
+    elif message_type == "unsubscribe":
+        websocket_manager.subscribe(websocket, None)
+        await websocket_manager.send_personal_message({"type": "unsubscribed"}, websocket)
@@ -1,4 +1,56 @@
-from pydantic import BaseModel
+from datetime import date, datetime, time
+from typing import List
+
+from pydantic import BaseModel, field_serializer, field_validator
+
+# Formatele acceptate pentru datele scrise manual în panoul admin
+DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y", "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%y")
+TIME_FORMATS = ("%H:%M", "%H.%M", "%H:%M:%S", "%H")
+
+
+def parse_assessment_date(value) -> date | None:
+    """
+    Parsează data unei evaluări (ex: "2024-01-15" sau "15.01.2024").
+    Șirul gol înseamnă dată nestabilită (None).
+
+    Raises:
+        ValueError: Dacă valoarea nu poate fi interpretată ca dată
+    """
+    if value is None or isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    text = str(value).strip()
+    if not text:
+        return None
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Data evaluării nu este validă: '{text}' (format așteptat: AAAA-LL-ZZ sau ZZ.LL.AAAA)")
+
+
+def parse_assessment_time(value) -> time | None:
+    """
+    Parsează ora unei evaluări (ex: "14:00", "14.00" sau intervalul "14:00-15:30", din care se ia începutul).
+    Șirul gol înseamnă oră nestabilită (None).
+
+    Raises:
+        ValueError: Dacă valoarea nu poate fi interpretată ca oră
+    """
+    if value is None or isinstance(value, time):
+        return value
+    text = str(value).strip()
+    if not text:
+        return None
+    start = text.replace("–", "-").split("-")[0].strip()
+    for fmt in TIME_FORMATS:
+        try:
+            return datetime.strptime(start, fmt).time()
+        except ValueError:
+            continue
+    raise ValueError(f"Ora evaluării nu este validă: '{text}' (format așteptat: HH:MM)")
 
 
 class AssessmentScheduleBase(BaseModel):
@@ -6,13 +58,23 @@ class AssessmentScheduleBase(BaseModel):
     subject: str  # Numele disciplinei (scris manual)
     groups_composition: str  # Componența seriei - grupele separate prin virgulă (ex: "TI-221, TI-222, TI-223")
     professor_name: str  # Cadrul didactic titular (scris manual)
-    assessment_date: str  # Data evaluării (scris manual, ex: "2024-01-15")
-    assessment_time: str  # Ora evaluării (scris manual, ex: "14:00")
+    assessment_date: date | None = None  # Data evaluării (ex: "2024-01-15"; acceptă și "15.01.2024")
+    assessment_time: time | None = None  # Ora evaluării (ex: "14:00")
     room_code: str  # Codul sălii (scris manual)
     academic_year: int  # Anul academic (1, 2, 3, 4)
     semester: str  # "assessments1" sau "assessments2"
     cycle_type: str | None = None  # "F" sau "FR"
 
+    @field_validator("assessment_date", mode="before")
+    @classmethod
+    def _parse_date(cls, value):
+        return parse_assessment_date(value)
+
+    @field_validator("assessment_time", mode="before")
+    @classmethod
+    def _parse_time(cls, value):
+        return parse_assessment_time(value)
+
 
 class AssessmentScheduleCreate(AssessmentScheduleBase):
     """Schema pentru crearea unei evaluări periodice."""
@@ -20,21 +82,59 @@ class AssessmentScheduleCreate(AssessmentScheduleBase):
 
 
 class AssessmentScheduleUpdate(BaseModel):
-    """Schema pentru actualizarea unei evaluări periodice."""
+    """Schema pentru actualizarea unei evaluări periodice; se aplică doar câmpurile trimise ("" golește data/ora)."""
     subject: str | None = None
     groups_composition: str | None = None
     professor_name: str | None = None
-    assessment_date: str | None = None
-    assessment_time: str | None = None
+    assessment_date: date | None = None
+    assessment_time: time | None = None
     room_code: str | None = None
     academic_year: int | None = None
     semester: str | None = None
     cycle_type: str | None = None
 
+    @field_validator("assessment_date", mode="before")
+    @classmethod
+    def _parse_date(cls, value):
+        return parse_assessment_date(value)
+
+    @field_validator("assessment_time", mode="before")
+    @classmethod
+    def _parse_time(cls, value):
+        return parse_assessment_time(value)
+
 
 class AssessmentScheduleResponse(AssessmentScheduleBase):
     """Schema pentru răspunsul API cu o evaluare periodică."""
     id: int
 
+    # Clienții lucrează cu text: data ca "AAAA-LL-ZZ", ora ca "HH:MM", "" dacă nu este stabilită
+    @field_serializer("assessment_date")
+    def _serialize_date(self, value: date | None) -> str:
+        return value.isoformat() if value else ""
+
+    @field_serializer("assessment_time")
+    def _serialize_time(self, value: time | None) -> str:
+        return value.strftime("%H:%M") if value else ""
+
     class Config:
         from_attributes = True
+
+
+class AssessmentScheduleBatchUpdateItem(AssessmentScheduleUpdate):
+    """O actualizare din batch; câmpurile trimise explicit (inclusiv "" pentru dată/oră) sunt aplicate."""
+    id: int
+
+
+class AssessmentScheduleBatchRequest(BaseModel):
+    """Diferența pentru o felie de evaluări (an, semestru, ciclu), aplicată într-o singură tranzacție."""
+    create: List[AssessmentScheduleCreate] = []
+    update: List[AssessmentScheduleBatchUpdateItem] = []
+    delete: List[int] = []
+
+
+class AssessmentScheduleBatchResponse(BaseModel):
+    """Rezultatul unui batch: rândurile create și actualizate, plus ID-urile șterse."""
+    created: List[AssessmentScheduleResponse]
+    updated: List[AssessmentScheduleResponse]
+    deleted: List[int]
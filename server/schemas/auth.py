@@ -1,6 +1,8 @@
 """
 Schemas pentru flow-ul de autentificare în două pași.
 """
+from datetime import datetime
+
 from pydantic import BaseModel, EmailStr
 
 
@@ -25,6 +27,16 @@ class SendVerificationCodeResponse(BaseModel):
     """Response pentru trimiterea codului de verificare."""
     success: bool
     message: str
+    delivery_id: str | None = None  # ID-ul livrării email-ului (pentru interogarea statusului)
+
+
+class EmailDeliveryStatusResponse(BaseModel):
+    """Response cu statusul livrării unui email din coadă."""
+    delivery_id: str
+    status: str  # queued, sending, retrying, sent, failed
+    attempts: int
+    max_attempts: int
+    updated_at: datetime
 
 
 class VerifyCodeAndSetPasswordRequest(BaseModel):
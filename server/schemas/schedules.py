@@ -1,6 +1,6 @@
-from typing import Literal
+from typing import List, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from .reference import (
     GroupResponse,
@@ -74,3 +74,60 @@ class ScheduleResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ScheduleConflictResponse(BaseModel):
+    """O sală sau un profesor ocupat de mai multe ore diferite în același slot."""
+    resource_type: Literal["room", "professor"]
+    resource_id: int
+    resource_name: str | None = None  # Codul sălii sau numele profesorului
+    day: str
+    hour: str
+    parity: Literal["even", "odd"]  # Săptămâna pară sau impară
+    schedule_ids: List[int]
+
+
+class ScheduleSolveRequirement(BaseModel):
+    """O disciplină de programat: `weekly_count` ore pe săptămână pentru grupele date (mai multe = serie)."""
+    group_ids: List[int] = Field(min_length=1)
+    subject_id: int
+    professor_id: int
+    session_type: SessionTypeLiteral = "course"
+    weekly_count: int = Field(default=1, ge=1, le=10)
+    parity: Literal["both", "even", "odd"] = "both"  # Săptămânile în care se ține ora
+    min_capacity: int | None = None  # Capacitatea minimă a sălii
+    room_ids: List[int] | None = None  # Doar aceste săli (ex: laboratoare)
+
+
+class ProfessorUnavailability(BaseModel):
+    professor_id: int
+    day: str
+    hour: str | None = None  # Fără oră: toată ziua
+
+
+class ScheduleSolveRequest(BaseModel):
+    academic_year: int | None = None
+    semester: str | None = None
+    cycle_type: str | None = None
+    requirements: List[ScheduleSolveRequirement] = Field(min_length=1)
+    unavailable: List[ProfessorUnavailability] = []
+    days: List[str] | None = None  # Implicit SOLVER_DAYS
+    hours: List[str] | None = None  # Implicit SOLVER_HOURS
+    skip_scheduled: bool = True  # Scade orele deja existente în orar pentru aceeași disciplină
+    time_limit_seconds: float | None = None
+    seed: int | None = None
+
+
+class ScheduleSolveResponse(BaseModel):
+    """Propunerea solver-ului: orele de adăugat (în formatul ScheduleCreate) și calitatea ei."""
+    draft: List[ScheduleCreate]
+    sessions: int  # Numărul de ore plasate
+    cost: int
+    conflicts: int  # Suprapuneri de sală/profesor/grupă rămase
+    group_gaps: int  # Ferestre în orarul grupelor implicate
+    professor_gaps: int
+    same_day_repeats: int  # Aceeași disciplină de mai multe ori în aceeași zi
+    unpaired: int  # Ore doar pe o paritate fără pereche în slot
+    iterations: int
+    workers: int
+    elapsed_seconds: float
@@ -0,0 +1,323 @@
+"""
+Generator de date sintetice la scara unei facultăți mari, pentru reproducerea locală a
+volumului din producție (și pentru benchmark-uri).
+
+Generează grupe (ciclu F sau FR), discipline, profesori, săli, studenți repartizați în grupe,
+orarul ambelor semestre (cu alternanțe pară/impară, fără suprapuneri de sală/profesor cât timp
+există resurse libere), evaluările periodice și un admin. Toți utilizatorii au aceeași parolă,
+deci hash-ul Argon2 se calculează o singură dată.
+
+Încărcarea se face în masă: COPY ... FROM STDIN pe PostgreSQL (psycopg2), executemany pe
+SQLite. Schema trebuie să existe (python migrate.py); tabelele trebuie să fie goale sau se
+golesc cu --reset.
+
+Utilizare (din directorul server/, folosește DATABASE_URL):
+    python scripts/generate_data.py --reset
+    python scripts/generate_data.py --url sqlite:///./mare.db --groups 500 --students 30000
+    python scripts/generate_data.py --reset --groups 50 --students 1500 --sessions-per-semester 12
+"""
+import argparse
+import csv
+import enum
+import io
+import os
+import random
+import sys
+import time as timer
+from dataclasses import asdict, dataclass
+from datetime import date, time, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DAYS = ["Luni", "Marți", "Miercuri", "Joi", "Vineri"]
+HOURS = ["8.00-9.30", "9.45-11.15", "11.30-13.00", "13.30-15.00", "15.15-16.45", "17.00-18.30", "18.45-20.15"]
+SPECIALIZATIONS = ["TI", "CR", "IS", "SI", "FAF", "MAI", "RM", "ET", "IA", "MN"]
+SEMESTERS = ["semester1", "semester2"]
+ASSESSMENT_SEMESTERS = ["assessments1", "assessments2"]
+ASSESSMENT_START = {"assessments1": date(2024, 10, 7), "assessments2": date(2025, 3, 10)}
+
+DEFAULT_PASSWORD = "Parola-Test-2024!"
+DEFAULT_ADMIN_EMAIL = "admin@example.com"
+COPY_MIN_ROWS = 1000  # sub acest număr de rânduri, executemany este la fel de rapid
+
+
+@dataclass
+class DatasetSize:
+    groups: int = 500
+    students: int = 30000
+    subjects: int = 300
+    professors: int = 450
+    rooms: int = 360
+    sessions_per_semester: int = 20  # ore pe săptămână per grupă, în fiecare semestru
+    odd_week_share: float = 0.25  # proporția orelor cu alternanță pară/impară
+    fr_share: float = 0.2  # proporția grupelor cu frecvență redusă
+    assessments_per_semester: int = 60  # evaluări per an de studiu și semestru
+
+
+def group_code(index: int) -> str:
+    """Cod unic și realist (ex: TI-221): specializare, an, număr de ordine."""
+    specialization = SPECIALIZATIONS[index % len(SPECIALIZATIONS)]
+    year = index // len(SPECIALIZATIONS) % 4 + 1
+    number = index // (len(SPECIALIZATIONS) * 4) + 1
+    return f"{specialization}-{year}{number:02d}"
+
+
+def student_username(index: int) -> str:
+    return f"student{index:05d}@example.com"
+
+
+def build_dataset(size: DatasetSize, password_hash: str, seed: int = 1, admin_email: str = DEFAULT_ADMIN_EMAIL):
+    """Rândurile fiecărei tabele, în ordinea inserării: listă de (model, rânduri)."""
+    from models.assessment_schedule import AssessmentSchedule
+    from models.assessment_schedule_group import AssessmentScheduleGroup
+    from models.group import Group
+    from models.professor import Professor
+    from models.room import Room
+    from models.schedule import Schedule, SessionStatus, SessionType
+    from models.subject import Subject
+    from models.user import User, UserRole
+    from models.user_group import UserGroup
+
+    rng = random.Random(seed)
+
+    groups, group_cycles = [], {}
+    for i in range(size.groups):
+        code = group_code(i)
+        groups.append({
+            "id": i + 1,
+            "code": code,
+            "year": i // len(SPECIALIZATIONS) % 4 + 1,
+            "faculty": "FCIM",
+            "specialization": code.split("-")[0],
+        })
+        group_cycles[i + 1] = "FR" if rng.random() < size.fr_share else "F"
+    subjects = [
+        {"id": i + 1, "name": f"Disciplina {i + 1}", "code": f"D{i + 1:04d}", "semester": SEMESTERS[i % 2]}
+        for i in range(size.subjects)
+    ]
+    professors = [
+        {"id": i + 1, "full_name": f"Profesor {i + 1}", "department": f"Dep. {i % 12 + 1}", "email": f"prof{i + 1}@example.com"}
+        for i in range(size.professors)
+    ]
+    rooms = [
+        {"id": i + 1, "code": f"{i % 6 + 1}-{100 + i}", "building": f"Blocul {i % 6 + 1}", "capacity": rng.choice([30, 60, 120, 200])}
+        for i in range(size.rooms)
+    ]
+
+    users = [{"id": 1, "username": admin_email.lower(), "password_hash": password_hash, "role": UserRole.ADMIN, "is_active": True}]
+    user_groups = []
+    for s in range(size.students):
+        user_id = s + 2
+        users.append({
+            "id": user_id,
+            "username": student_username(s + 1),
+            "password_hash": password_hash,
+            "role": UserRole.STUDENT,
+            "is_active": True,
+        })
+        if groups:
+            user_groups.append({"id": s + 1, "user_id": user_id, "group_id": s % len(groups) + 1})
+
+    # Sălile și profesorii se alocă din resursele libere ale intervalului (semestru, zi, oră);
+    # abia când nu mai există resurse libere apar suprapuneri
+    free_rooms, free_professors = {}, {}
+
+    def take(free, key, count):
+        pool = free.get(key)
+        if pool is None:
+            pool = free[key] = rng.sample(range(1, count + 1), count)
+        return pool.pop() if pool else rng.randint(1, count)
+
+    slots = [(day, hour) for day in DAYS for hour in HOURS]
+    schedules = []
+    for semester in SEMESTERS:
+        semester_subjects = [s["id"] for s in subjects if s["semester"] == semester] or [s["id"] for s in subjects]
+        for group in groups:
+            for day, hour in rng.sample(slots, min(size.sessions_per_semester, len(slots))):
+                key = (semester, day, hour)
+                row = {
+                    "id": len(schedules) + 1,
+                    "group_id": group["id"],
+                    "subject_id": rng.choice(semester_subjects),
+                    "professor_id": take(free_professors, key, size.professors),
+                    "room_id": take(free_rooms, key, size.rooms),
+                    "day": day,
+                    "hour": hour,
+                    "session_type": rng.choice(list(SessionType)),
+                    "status": SessionStatus.NORMAL,
+                    "notes": None,
+                    "version": 1,
+                    "odd_week_subject_id": None,
+                    "odd_week_professor_id": None,
+                    "odd_week_room_id": None,
+                    "academic_year": group["year"],
+                    "semester": semester,
+                    "cycle_type": group_cycles[group["id"]],
+                }
+                if rng.random() < size.odd_week_share:
+                    row["odd_week_subject_id"] = rng.choice(semester_subjects)
+                    row["odd_week_professor_id"] = take(free_professors, key, size.professors)
+                    row["odd_week_room_id"] = take(free_rooms, key, size.rooms)
+                schedules.append(row)
+
+    assessments, assessment_groups = [], []
+    for year in range(1, 5):
+        year_groups = [g for g in groups if g["year"] == year]
+        if not year_groups:
+            continue
+        for semester in ASSESSMENT_SEMESTERS:
+            for _ in range(size.assessments_per_semester):
+                assessment_id = len(assessments) + 1
+                # O evaluare comună pentru 1-4 grupe ale aceleiași specializări (seria)
+                specialization = rng.choice(year_groups)["specialization"]
+                series = [g for g in year_groups if g["specialization"] == specialization]
+                members = rng.sample(series, min(len(series), rng.randint(1, 4)))
+                assessments.append({
+                    "id": assessment_id,
+                    "subject": f"Disciplina {rng.randint(1, max(1, size.subjects))}",
+                    "professor_name": f"Profesor {rng.randint(1, max(1, size.professors))}",
+                    "assessment_date": ASSESSMENT_START[semester] + timedelta(days=rng.randint(0, 60)),
+                    "assessment_time": time(rng.choice([8, 9, 11, 13, 15]), rng.choice([0, 45])),
+                    "room_code": rng.choice(rooms)["code"] if rooms else None,
+                    "academic_year": year,
+                    "semester": semester,
+                    "cycle_type": group_cycles[members[0]["id"]],
+                })
+                for position, group in enumerate(members):
+                    assessment_groups.append({
+                        "id": len(assessment_groups) + 1,
+                        "assessment_schedule_id": assessment_id,
+                        "group_code": group["code"],
+                        "position": position,
+                    })
+
+    return [
+        (Group, groups),
+        (Subject, subjects),
+        (Professor, professors),
+        (Room, rooms),
+        (User, users),
+        (UserGroup, user_groups),
+        (Schedule, schedules),
+        (AssessmentSchedule, assessments),
+        (AssessmentScheduleGroup, assessment_groups),
+    ]
+
+
+def _copy_value(value):
+    # Coloanele Enum sunt stocate cu numele membrului (comportamentul implicit SQLAlchemy)
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return value  # None devine câmp gol, adică NULL în formatul CSV al COPY
+
+
+def _copy_rows(connection, table, rows) -> bool:
+    """COPY ... FROM STDIN (psycopg2); False dacă driver-ul nu îl suportă."""
+    cursor = connection.connection.dbapi_connection.cursor()
+    if not hasattr(cursor, "copy_expert"):
+        return False
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_copy_value(row[column]) for column in columns])
+    buffer.seek(0)
+    quote = connection.dialect.identifier_preparer.quote
+    cursor.copy_expert(
+        f"COPY {quote(table.name)} ({', '.join(quote(c) for c in columns)}) FROM STDIN WITH (FORMAT csv)",
+        buffer,
+    )
+    return True
+
+
+def bulk_insert(connection, table, rows) -> None:
+    """Inserează rândurile într-o singură operație: COPY pe PostgreSQL, executemany în rest."""
+    from sqlalchemy import insert
+
+    if not rows:
+        return
+    if connection.dialect.name == "postgresql" and len(rows) >= COPY_MIN_ROWS and _copy_rows(connection, table, rows):
+        return
+    connection.execute(insert(table), rows)
+
+
+def load_dataset(engine, tables) -> dict:
+    """Încarcă rândurile într-o singură tranzacție; întoarce numărul de rânduri per tabelă."""
+    with engine.begin() as connection:
+        for model, rows in tables:
+            bulk_insert(connection, model.__table__, rows)
+        if connection.dialect.name == "postgresql":
+            # Id-urile au fost inserate explicit: aliniază secvențele
+            for model, _ in tables:
+                table = model.__table__.name
+                connection.exec_driver_sql(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1)) FROM {table}"
+                )
+    return {model.__table__.name: len(rows) for model, rows in tables}
+
+
+def clear_tables(engine) -> None:
+    """Golește toate tabelele aplicației (schema și revizia Alembic rămân neschimbate)."""
+    import models  # noqa: F401  (înregistrează modelele în metadata)
+    from core.database import Base
+
+    tables = list(reversed(Base.metadata.sorted_tables))
+    with engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            names = ", ".join(table.name for table in tables)
+            connection.exec_driver_sql(f"TRUNCATE {names} RESTART IDENTITY CASCADE")
+        else:
+            for table in tables:
+                connection.execute(table.delete())
+
+
+def existing_rows(engine) -> int:
+    from sqlalchemy import func, select
+
+    from models.group import Group
+    from models.user import User
+
+    with engine.connect() as connection:
+        return sum(connection.execute(select(func.count()).select_from(model)).scalar() for model in (Group, User))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generează un set mare de date sintetice (facultate).")
+    parser.add_argument("--url", help="DATABASE_URL (implicit: variabila de mediu)")
+    parser.add_argument("--reset", action="store_true", help="Golește tabelele înainte de generare")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="Parola tuturor utilizatorilor")
+    parser.add_argument("--admin-email", default=DEFAULT_ADMIN_EMAIL)
+    for field, value in asdict(DatasetSize()).items():
+        parser.add_argument(f"--{field.replace('_', '-')}", type=type(value), default=value)
+    args = parser.parse_args()
+
+    if args.url:
+        os.environ["DATABASE_URL"] = args.url
+    from core.database import engine
+    from core.security import get_password_hash
+
+    size = DatasetSize(**{field: getattr(args, field) for field in asdict(DatasetSize())})
+    if args.reset:
+        clear_tables(engine)
+    elif existing_rows(engine):
+        print("❌ Baza de date conține deja grupe sau utilizatori. Folosește --reset pentru a le șterge.")
+        return 1
+
+    started = timer.perf_counter()
+    tables = build_dataset(size, get_password_hash(args.password), args.seed, args.admin_email)
+    generated = timer.perf_counter()
+    counts = load_dataset(engine, tables)
+    loaded = timer.perf_counter()
+
+    for table, count in counts.items():
+        print(f"  {table:<28} {count:>8}")
+    print(f"✓ Generare {generated - started:.1f}s, încărcare {loaded - generated:.1f}s ({engine.dialect.name})")
+    print(f"  Admin: {args.admin_email}; toți utilizatorii au parola '{args.password}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
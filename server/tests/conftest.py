@@ -0,0 +1,43 @@
+"""
+Configurarea comună a testelor: o bază SQLite temporară, setată înainte ca aplicația
+(core.database) să-și creeze engine-ul.
+
+Rulare (din directorul server/):
+    python -m pytest -q
+"""
+import os
+import sys
+import tempfile
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_DIR not in sys.path:
+    sys.path.insert(0, SERVER_DIR)
+
+_DB_DIR = tempfile.mkdtemp(prefix="orar-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'test.db')}"
+os.environ.pop("DATABASE_READ_URL", None)
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import models  # noqa: E402,F401  (înregistrează toate tabelele pe Base.metadata)
+from core.database import Base, SessionLocal, engine  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    """O sesiune pe o bază goală (tabelele sunt recreate pentru fiecare test)."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    import main
+
+    return TestClient(main.app)
@@ -0,0 +1,43 @@
+"""GET /users/ face același număr de interogări indiferent de numărul de utilizatori (fără N+1)."""
+from core.query_budget import count_queries
+from core.security import create_access_token
+from models.group import Group
+from models.user import User, UserRole
+from models.user_group import UserGroup
+
+ADMIN_USERNAME = "admin@test.md"
+
+
+def _seed_users(db, start: int, count: int) -> None:
+    """Adaugă `count` studenți, fiecare într-o grupă (ca lista să facă join-ul cu grupele)."""
+    for index in range(start, start + count):
+        group = Group(code=f"TI-{index}", year=1)
+        user = User(username=f"student{index}@test.md", password_hash="x", role=UserRole.STUDENT, is_active=True)
+        db.add_all([group, user])
+        db.flush()
+        db.add(UserGroup(user_id=user.id, group_id=group.id))
+    db.commit()
+
+
+def _count_list_queries(client, headers) -> tuple:
+    with count_queries() as tracker:
+        response = client.get("/users/", headers=headers)
+    assert response.status_code == 200, response.text
+    return len(response.json()), tracker.count
+
+
+def test_user_list_query_count_does_not_grow_with_users(db, client):
+    db.add(User(username=ADMIN_USERNAME, password_hash="x", role=UserRole.ADMIN, is_active=True))
+    db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': ADMIN_USERNAME, 'role': 'admin'})}"}
+
+    n = 5
+    _seed_users(db, 0, n)
+    users_small, queries_small = _count_list_queries(client, headers)
+
+    _seed_users(db, n, 9 * n)
+    users_large, queries_large = _count_list_queries(client, headers)
+
+    assert (users_small, users_large) == (n + 1, 10 * n + 1)
+    assert queries_large == queries_small
+    assert queries_small <= 2  # utilizatorul curent + lista cu grupe (@query_budget(2))